@@ -279,6 +279,22 @@ TOP_PRIORITY_BARRIER_EDIT_PERMISSION = "set_topprioritybarrier"
 # but need to keep for older and archived barriers.
 DEPRECATED_TAGS = ("COVID-19", "Brexit", "NI Protocol", "Programme Fund")
 
+# Search filter labels for trading blocs, in place of the trading bloc's name
+TRADING_BLOC_WIDE_SEARCH_LABELS = {
+    "TB00003": "Include ASEAN-wide barriers",
+    "TB00016": "Include EU-wide barriers",
+    "TB00026": "Include Mercosur-wide barriers",
+    "TB00013": "Include EAEU-wide barriers",
+    "TB00017": "Include GCC-wide barriers",
+}
+TRADING_BLOC_IMPLEMENTATION_SEARCH_LABELS = {
+    "TB00003": "Include country specific implementations of ASEAN regulations",
+    "TB00016": "Include country specific implementations of EU regulations",
+    "TB00026": "Include country specific implementations of Mercosur regulations",
+    "TB00013": "Include country specific implementations of EAEU regulations",
+    "TB00017": "Include country specific implementations of GCC regulations",
+}
+
 EXPORT_TYPES = Choices(
     ("goods", "Goods"),
     ("services", "Services"),
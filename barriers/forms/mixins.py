@@ -39,9 +39,11 @@ class DocumentMixin:
     1. Calls the API with file name and size, getting back a document id
        and signed url for uploading to S3.
     2. Uploads the file to S3.
-    3. Calls the API confirming that the file has been uploaded.
-    4. Polls the API until the virus scan is complete, raising an exception
-       if it fails the check.
+    3. Calls the API confirming that the file has been uploaded, which
+       starts the virus scan.
+    4. Checks the scan once, raising an exception if it has already failed.
+       The scan is not waited for - the API keeps the file back until it
+       passes, and ajax uploads poll the scan status view.
     """
 
     def __init__(self, *args, **kwargs):
@@ -93,7 +95,7 @@ class DocumentMixin:
         self.upload_to_s3(url=data["signed_upload_url"], document=document)
 
         client.documents.complete_upload(document_id)
-        client.documents.check_scan_status(document_id)
+        scan = client.documents.get_scan_status(document_id)
 
         return {
             "id": document_id,
@@ -101,20 +103,28 @@ class DocumentMixin:
                 "name": document.name,
                 "size": document.size,
             },
+            "scan_status": scan["status"],
         }
 
     def upload_to_s3(self, url, document):
+        """
+        Stream the file to the signed url. requests sends a file a block at a
+        time, with the Content-Length S3 needs taken from its size.
+        """
+        # to avoid circular imports
+        from utils.api.client import get_upload_session
+
         document.seek(0)
-        response = requests.put(
-            url,
-            headers={
-                "x-amz-server-side-encryption": "AES256",
-            },
-            data=document,
-        )
         try:
+            response = get_upload_session().put(
+                url,
+                headers={
+                    "x-amz-server-side-encryption": "AES256",
+                },
+                data=document,
+            )
             response.raise_for_status()
-        except requests.exceptions.HTTPError:
+        except requests.exceptions.RequestException:
             raise FileUploadError(
                 "A system error has occured, so the file has not been "
                 "uploaded. Try again."
@@ -1,13 +1,12 @@
 import copy
 import logging
-from operator import itemgetter
 from urllib.parse import urlencode
 
 from django import forms
 from django.conf import settings
 from django.http import QueryDict
 
-from barriers.constants import DEPRECATED_TAGS, EXPORT_TYPES, STATUS_WITH_DATE_FILTER
+from barriers.constants import EXPORT_TYPES, STATUS_WITH_DATE_FILTER
 from utils.forms.fields import MonthDateRangeField
 from utils.helpers import format_dict_for_url_querystring
 
@@ -228,8 +227,24 @@ class BarrierSearchForm(forms.Form):
         },
     }
 
+    # Fields whose choices come from the metadata choice catalogue
+    catalogue_choices = {
+        "country": "locations",
+        "extra_location": "trading_bloc_wide",
+        "country_trading_bloc": "trading_bloc_implementations",
+        "trade_direction": "trade_directions",
+        "sector": "sectors",
+        "organisation": "organisations",
+        "category": "categories",
+        "region": "overseas_regions",
+        "status": "open_statuses",
+        "tags": "tags",
+        "ordering": "search_ordering",
+    }
+
     def __init__(self, metadata, *args, **kwargs):
         self.metadata = metadata
+        self.choice_catalogue = metadata.get_search_choice_catalogue()
 
         # we need to use some trickery here as we're initialising the form with a QueryDict from GET data, so we need to
         # check if the field requires multiple values, or if it only needs one. That decides how we retrieve it from the
@@ -267,101 +282,53 @@ class BarrierSearchForm(forms.Form):
         self.index_filter_groups()
 
     def set_country_choices(self):
-        location_choices = [
-            (trading_bloc["code"], trading_bloc["name"])
-            for trading_bloc in self.metadata.get_trading_bloc_list()
-        ] + [
-            (country["id"], country["name"])
-            for country in self.metadata.get_country_list()
-        ]
-        self.fields["country"].choices = location_choices
+        self.fields["country"].choices = self.choice_catalogue.get_choices("locations")
 
     def set_extra_location_choices(self):
-        trading_bloc_labels = {
-            "TB00003": "Include ASEAN-wide barriers",
-            "TB00016": "Include EU-wide barriers",
-            "TB00026": "Include Mercosur-wide barriers",
-            "TB00013": "Include EAEU-wide barriers",
-            "TB00017": "Include GCC-wide barriers",
-        }
-        self.fields["extra_location"].choices = [
-            (
-                trading_bloc["code"],
-                trading_bloc_labels.get(trading_bloc["code"], trading_bloc["name"]),
-            )
-            for trading_bloc in self.metadata.get_trading_bloc_list()
-        ]
+        self.fields["extra_location"].choices = self.choice_catalogue.get_choices(
+            "trading_bloc_wide"
+        )
 
     def set_country_trading_bloc_choices(self):
-        trading_bloc_labels = {
-            "TB00003": "Include country specific implementations of ASEAN regulations",
-            "TB00016": "Include country specific implementations of EU regulations",
-            "TB00026": (
-                "Include country specific implementations of Mercosur regulations"
-            ),
-            "TB00013": "Include country specific implementations of EAEU regulations",
-            "TB00017": "Include country specific implementations of GCC regulations",
-        }
-        self.fields["country_trading_bloc"].choices = [
-            (
-                trading_bloc["code"],
-                trading_bloc_labels.get(trading_bloc["code"], trading_bloc["name"]),
-            )
-            for trading_bloc in self.metadata.get_trading_bloc_list()
-        ]
+        self.fields["country_trading_bloc"].choices = self.choice_catalogue.get_choices(
+            "trading_bloc_implementations"
+        )
 
     def set_trade_direction_choices(self):
-        self.fields["trade_direction"].choices = (
-            self.metadata.get_trade_direction_choices()
+        self.fields["trade_direction"].choices = self.choice_catalogue.get_choices(
+            "trade_directions"
         )
 
     def set_sector_choices(self):
-        self.fields["sector"].choices = [
-            (sector["id"], sector["name"])
-            for sector in self.metadata.get_sector_list(level=0)
-        ]
+        self.fields["sector"].choices = self.choice_catalogue.get_choices("sectors")
 
     def set_organisation_choices(self):
-        self.fields["organisation"].choices = (
-            self.metadata.get_gov_organisation_choices()
+        self.fields["organisation"].choices = self.choice_catalogue.get_choices(
+            "organisations"
         )
 
     def set_category_choices(self):
-        choices = [
-            (str(category["id"]), category["title"])
-            for category in self.metadata.data["categories"]
-        ]
-        choices = list(set(choices))
-        choices.sort(key=itemgetter(1))
-        self.fields["category"].choices = choices
+        self.fields["category"].choices = self.choice_catalogue.get_choices(
+            "categories"
+        )
 
     def set_region_choices(self):
-        choices = [
-            (country["id"], country["name"])
-            for country in self.metadata.get_overseas_region_list()
-        ]
-        self.fields["region"].choices = choices
+        self.fields["region"].choices = self.choice_catalogue.get_choices(
+            "overseas_regions"
+        )
 
     def set_status_choices(self):
-        status_ids = ("2", "3", "4", "5")
-        choices = [
-            (id, value)
-            for id, value in self.metadata.data["barrier_status"].items()
-            if id in status_ids
-        ]
-        choices.sort(key=itemgetter(0))
-        self.fields["status"].choices = choices
+        self.fields["status"].choices = self.choice_catalogue.get_choices(
+            "open_statuses"
+        )
 
     def set_tags_choices(self):
-        choices = [
-            (str(tag["id"]), tag["title"])
-            for tag in self.metadata.get_barrier_tag_choices("search")
-            if tag["title"] not in DEPRECATED_TAGS
-        ]
-        self.fields["tags"].choices = choices
+        self.fields["tags"].choices = self.choice_catalogue.get_choices("tags")
 
     def set_ordering_choices(self):
-        self.fields["ordering"].choices = self.metadata.get_search_ordering_choices()
+        self.fields["ordering"].choices = self.choice_catalogue.get_choices(
+            "search_ordering"
+        )
 
     def clean_country(self):
         data = self.cleaned_data["country"]
@@ -532,11 +499,16 @@ class BarrierSearchForm(forms.Form):
 
         return urlencode(filters_for_encode, doseq=True)
 
+    def get_choice_labels(self, field_name):
+        if field_name in self.catalogue_choices:
+            return self.choice_catalogue.get_labels(self.catalogue_choices[field_name])
+        return dict(self.fields[field_name].choices)
+
     def get_filter_readable_value(self, field_name, value):
         field = self.fields[field_name]
 
         if hasattr(field, "choices"):
-            field_lookup = dict(field.choices)
+            field_lookup = self.get_choice_labels(field_name)
             return ", ".join([field_lookup.get(x) for x in value])
         elif isinstance(field, forms.BooleanField):
             return field.label
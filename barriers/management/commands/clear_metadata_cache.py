@@ -2,11 +2,13 @@ import redis
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from utils.metadata import clear_metadata_cache
+
 
 class Command(BaseCommand):
     help = "Clears the metadata cache"
 
     def handle(self, *args, **options):
         redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
-        redis_client.delete("metadata")
+        clear_metadata_cache(client=redis_client)
         self.stdout.write(self.style.SUCCESS("Metadata cache cleared"))
@@ -1,5 +1,3 @@
-import dateutil.parser
-
 from barriers.constants import PUBLIC_BARRIER_STATUSES
 from barriers.models.assessments import (
     EconomicAssessment,
@@ -69,7 +67,7 @@ class Barrier(APIModel):
 
     @property
     def archived_on(self):
-        return dateutil.parser.parse(self.data["archived_on"])
+        return self.get_date("archived_on")
 
     @property
     def category_titles(self):
@@ -77,19 +75,17 @@ class Barrier(APIModel):
 
     @property
     def created_on(self):
-        return dateutil.parser.parse(self.data["created_on"])
+        return self.get_date("created_on")
 
     @property
     def estimated_resolution_date(self):
         if self.data.get("estimated_resolution_date"):
-            return dateutil.parser.parse(self.data["estimated_resolution_date"])
+            return self.get_date("estimated_resolution_date")
 
     @property
     def proposed_estimated_resolution_date(self):
         if self.data.get("proposed_estimated_resolution_date"):
-            return dateutil.parser.parse(
-                self.data["proposed_estimated_resolution_date"]
-            )
+            return self.get_date("proposed_estimated_resolution_date")
 
     @property
     def has_active_estimated_resolution_date_proposal(self):
@@ -103,9 +99,7 @@ class Barrier(APIModel):
     @property
     def proposed_estimated_resolution_date_created(self):
         if self.data.get("proposed_estimated_resolution_date_created"):
-            return dateutil.parser.parse(
-                self.data["proposed_estimated_resolution_date_created"]
-            )
+            return self.get_date("proposed_estimated_resolution_date_created")
 
     @property
     def commodities(self):
@@ -141,7 +135,7 @@ class Barrier(APIModel):
 
     @property
     def last_seen_on(self):
-        return dateutil.parser.parse(self.data["last_seen_on"])
+        return self.get_date("last_seen_on")
 
     @property
     def location(self):
@@ -149,7 +143,7 @@ class Barrier(APIModel):
 
     @property
     def modified_on(self):
-        return dateutil.parser.parse(self.data["modified_on"])
+        return self.get_date("modified_on")
 
     @property
     def public_barrier(self):
@@ -163,7 +157,7 @@ class Barrier(APIModel):
 
     @property
     def reported_on(self):
-        return dateutil.parser.parse(self.data["reported_on"])
+        return self.get_date("reported_on")
 
     @property
     def archived_economic_assessments(self):
@@ -283,7 +277,7 @@ class Barrier(APIModel):
 
     @property
     def status_date(self):
-        return dateutil.parser.parse(self.data.get("status_date"))
+        return self.get_date("status_date")
 
     @property
     def tags(self):
@@ -371,7 +365,7 @@ class Barrier(APIModel):
     @property
     def start_date(self):
         if self.data.get("start_date") is not None:
-            return dateutil.parser.parse(self.data.get("start_date"))
+            return self.get_date("start_date")
 
     @property
     def export_types(self):
@@ -431,17 +425,17 @@ class PublicBarrier(APIModel):
     @property
     def status_date(self):
         if self.data.get("status_date"):
-            return dateutil.parser.parse(self.data["status_date"])
+            return self.get_date("status_date")
 
     @property
     def first_published_on(self):
         if self.data.get("first_published_on") is not None:
-            return dateutil.parser.parse(self.data["first_published_on"])
+            return self.get_date("first_published_on")
 
     @property
     def last_published_on(self):
         if self.data.get("last_published_on") is not None:
-            return dateutil.parser.parse(self.data["last_published_on"])
+            return self.get_date("last_published_on")
 
     @property
     def unpublished_changes(self):
@@ -452,7 +446,7 @@ class PublicBarrier(APIModel):
     @property
     def unpublished_on(self):
         if self.data.get("unpublished_on") is not None:
-            return dateutil.parser.parse(self.data["unpublished_on"])
+            return self.get_date("unpublished_on")
 
     @property
     def is_eligible(self):
@@ -516,4 +510,4 @@ class PublicBarrier(APIModel):
     @property
     def reported_on(self):
         if self.data.get("reported_on"):
-            return dateutil.parser.parse(self.data["reported_on"])
+            return self.get_date("reported_on")
@@ -1,6 +1,4 @@
-import dateutil.parser
-
-from utils.diff import diff_match_patch
+from utils.diff import get_html_diff
 from utils.metadata import MetadataMixin
 from utils.models import APIModel
 
@@ -13,7 +11,7 @@ class BaseHistoryItem(MetadataMixin, APIModel):
 
     @property
     def date(self):
-        return dateutil.parser.parse(self.data["date"])
+        return self.get_date("date")
 
     @property
     def new_value(self):
@@ -29,10 +27,7 @@ class BaseHistoryItem(MetadataMixin, APIModel):
 
     @property
     def diff(self):
-        dmp = diff_match_patch()
-        diffs = dmp.diff_main(self.old_value or "", self.new_value or "")
-        dmp.diff_cleanupSemantic(diffs)
-        return dmp.diff_prettyHtml(diffs)
+        return get_html_diff(self.old_value or "", self.new_value or "")
 
     def get_value(self, value):
         return value
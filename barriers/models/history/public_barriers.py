@@ -1,6 +1,5 @@
-import dateutil.parser
-
 from barriers.constants import PUBLIC_BARRIER_STATUSES
+from utils.models import parse_date
 
 from .base import BaseHistoryItem, GenericHistoryItem
 from .utils import PolymorphicBase
@@ -67,7 +66,7 @@ class StatusHistoryItem(BaseHistoryItem):
             status_id=value["status"],
         )
         if value["status_date"]:
-            value["status_date"] = dateutil.parser.parse(value["status_date"])
+            value["status_date"] = parse_date(value["status_date"])
         return value
 
 
@@ -1,18 +1,44 @@
+import functools
+import html
 import re
 
 from django import template
+from django.utils.html import conditional_escape
 from django.utils.safestring import mark_safe
 
 register = template.Library()
 
+# Longer search terms are not highlighted
+MAX_HIGHLIGHT_LENGTH = 200
+
+
+@functools.lru_cache(maxsize=256)
+def get_highlight_pattern(term):
+    """
+    Compile a pattern matching the search term as plain text in escaped HTML.
+
+    HTML entities not starting a match are consumed whole, so a term is never
+    highlighted inside one.
+    """
+    return re.compile(
+        rf"({re.escape(html.escape(term))})|(&#?\w+;)", flags=re.IGNORECASE
+    )
+
+
+def highlight_match(match):
+    text, entity = match.groups()
+    if entity:
+        return entity
+    return f"<span class='highlight'>{text}</span>"
+
 
 @register.filter(needs_autoescape=True)
 def highlight(value, arg, autoescape=True):
-    if not arg:
+    if not arg or len(arg) > MAX_HIGHLIGHT_LENGTH:
         return value
 
-    result = re.sub(
-        rf"({arg})", r"<span class='highlight'>\1</span>", value, flags=re.IGNORECASE
-    )
+    if autoescape:
+        value = conditional_escape(value)
+    result = get_highlight_pattern(arg).sub(highlight_match, str(value))
 
     return mark_safe(result)
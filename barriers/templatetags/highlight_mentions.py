@@ -5,12 +5,12 @@ from django.utils.safestring import mark_safe
 
 register = template.Library()
 
+MENTION_RE = re.compile(r"(@[^ @]+@[^ @\r\n]+)", re.MULTILINE)
+
 
 @register.filter(needs_autoescape=True)
 def highlight_mentions(value, user_email=None, autoescape=True):
 
-    regex = r"(@[^ @]+@[^ @\r\n]+)"
-
     def wrap_email(match):
         email = match.group(1)
         if user_email and email == "@" + user_email:
@@ -19,7 +19,7 @@ def highlight_mentions(value, user_email=None, autoescape=True):
             )
         return f"<span class='mention-highlight'>{email}</span>"
 
-    result = re.sub(regex, wrap_email, value, 0, re.MULTILINE)
+    result = MENTION_RE.sub(wrap_email, value)
 
     return mark_safe(result)
 
@@ -27,12 +27,10 @@ def highlight_mentions(value, user_email=None, autoescape=True):
 @register.filter(needs_autoescape=True)
 def get_mention_emails(value, user_email=None, autoescape=True):
 
-    regex = r"(@[^ @]+@[^ @\r\n]+)"
-
     def wrap_email(match):
         email = match.group(1)[1:]  # Remove leading @ for a clean email value
         return f"{email},"
 
-    result = re.sub(regex, wrap_email, value, 0, re.MULTILINE)
+    result = MENTION_RE.sub(wrap_email, value)
 
     return result.split(",")[:-1]
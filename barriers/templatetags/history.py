@@ -1,12 +1,128 @@
+import functools
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
 from django import template
+from django.conf import settings
+from django.core.cache import cache
 from django.template.loader import select_template
+from django.utils.safestring import mark_safe
+
+import barriers.models.history
+from utils.diff import get_diff_budget
 
 register = template.Library()
 
+HISTORY_TEMPLATES_DIR = Path(settings.ROOT_DIR) / "templates/barriers/history"
+HISTORY_MODELS_DIR = Path(barriers.models.history.__file__).parent
 
-@register.simple_tag()
-def history_item(item):
+
+def get_fragment_version():
+    """
+    Hash of everything a rendered history item depends on besides its data,
+    so fragments rendered by a previous release are not reused.
+    """
+    if settings.DEBUG:
+        return compute_fragment_version()
+    return cached_fragment_version()
+
+
+def compute_fragment_version():
+    version = hashlib.md5()
+    for path in sorted(
+        [*HISTORY_TEMPLATES_DIR.rglob("*.html"), *HISTORY_MODELS_DIR.rglob("*.py")]
+    ):
+        version.update(str(path).encode())
+        version.update(path.read_bytes())
+    return version.hexdigest()
+
+
+cached_fragment_version = functools.lru_cache(maxsize=None)(compute_fragment_version)
+
+
+class HistoryFragmentCache:
+    """
+    Rendered history items, shared between workers in the django cache with a
+    process-local LRU in front.
+
+    History items never change once written, so a fragment is keyed on the
+    item's data and the fragment version. Shared fragments still expire after
+    HISTORY_FRAGMENT_CACHE_TIME, as names looked up in the metadata can change.
+    """
+
+    def __init__(self):
+        self.fragments = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_key(self, item):
+        data = json.dumps(item.data, sort_keys=True)
+        item_hash = hashlib.md5(data.encode()).hexdigest()
+        return f"history-fragment:{get_fragment_version()}:{item_hash}"
+
+    def get_local(self, key):
+        with self.lock:
+            fragment = self.fragments.get(key)
+            if fragment is not None:
+                self.fragments.move_to_end(key)
+            return fragment
+
+    def set_local(self, key, fragment):
+        with self.lock:
+            self.fragments[key] = fragment
+            self.fragments.move_to_end(key)
+            while len(self.fragments) > settings.HISTORY_FRAGMENT_LOCAL_CACHE_SIZE:
+                self.fragments.popitem(last=False)
+
+    def prefetch(self, items):
+        """
+        Load the fragments for a page of history items in one cache call.
+        """
+        if not settings.HISTORY_FRAGMENT_CACHE_TIME:
+            return
+        keys = [self.get_key(item) for item in items]
+        missing_keys = [key for key in keys if self.get_local(key) is None]
+        for key, fragment in cache.get_many(missing_keys).items():
+            self.set_local(key, fragment)
+
+    def render(self, item):
+        if not settings.HISTORY_FRAGMENT_CACHE_TIME:
+            return render_history_item(item)
+
+        key = self.get_key(item)
+        fragment = self.get_local(key)
+        if fragment is not None:
+            return mark_safe(fragment)
+
+        fragment = cache.get(key)
+        if fragment is None:
+            budget = get_diff_budget()
+            degraded = budget.degraded if budget else 0
+            fragment = render_history_item(item)
+            # Diffs cut short by the CPU budget are not worth keeping
+            if budget and budget.degraded != degraded:
+                return mark_safe(fragment)
+            cache.set(key, fragment, settings.HISTORY_FRAGMENT_CACHE_TIME)
+        self.set_local(key, fragment)
+        return mark_safe(fragment)
+
+    def clear(self):
+        with self.lock:
+            self.fragments.clear()
+
+
+history_fragment_cache = HistoryFragmentCache()
+
+
+def render_history_item(item):
     template_name = f"barriers/history/partials/{item.model}/{item.field}.html"
     default_template_name = "barriers/history/partials/default.html"
     item_template = select_template([template_name, default_template_name])
     return item_template.render({"item": item})
+
+
+@register.simple_tag()
+def history_item(item):
+    return history_fragment_cache.render(item)
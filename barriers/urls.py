@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path, re_path
 
 from barriers.views.action_plans import (
@@ -87,8 +88,8 @@ from .views.companies import (
     BarrierSearchCompany,
     CompanyDetail,
 )
-from .views.core import BarrierDetail, Dashboard, WhatIsABarrier
-from .views.documents import DownloadDocument
+from .views.core import AsyncDashboard, BarrierDetail, Dashboard, WhatIsABarrier
+from .views.documents import DocumentScanStatus, DownloadDocument
 from .views.edit import (
     BarrierEditCausedByTradingBloc,
     BarrierEditCommercialValue,
@@ -148,6 +149,7 @@ from .views.search import (
     DownloadBarriersDelete,
     DownloadBarriersDetail,
     RequestBarrierDownloadApproval,
+    SearchSidebarData,
 )
 from .views.sectors import (
     BarrierAddAllSectors,
@@ -175,9 +177,14 @@ from .views.wto import (
 app_name = "barriers"
 
 urlpatterns = [
-    path("", Dashboard.as_view(), name="dashboard"),
+    path(
+        "",
+        (AsyncDashboard if settings.ASYNC_VIEWS_ENABLED else Dashboard).as_view(),
+        name="dashboard",
+    ),
     path("search/", BarrierSearch.as_view(), name="search"),
     path("find-a-barrier/", BarrierSearch.as_view(), name="find_a_barrier"),
+    path("search/sidebar/", SearchSidebarData.as_view(), name="search_sidebar"),
     path("search/download/", DownloadBarriers.as_view(), name="download"),
     path(
         "search/download/<uuid:download_barrier_id>",
@@ -205,6 +212,11 @@ urlpatterns = [
         DownloadDocument.as_view(),
         name="download_document",
     ),
+    path(
+        "documents/<uuid:document_id>/scan-status/",
+        DocumentScanStatus.as_view(),
+        name="document_scan_status",
+    ),
     path("saved-searches/new/", NewSavedSearch.as_view(), name="new_saved_search"),
     path(
         "saved-searches/<uuid:saved_search_id>/rename/",
@@ -24,7 +24,7 @@ from barriers.forms.action_plans import (
 )
 from barriers.views.mixins import APIBarrierFormViewMixin, BarrierMixin
 from users.mixins import UserSearchMixin
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.exceptions import APIHttpException
 
 logger = logging.getLogger(__name__)
@@ -47,7 +47,7 @@ class ActionPlanFormViewMixin(ActionPlanFormSuccessUrlMixin):
         return self._action_plan
 
     def get_action_plan(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         barrier_id = self.kwargs.get("barrier_id")
         try:
             return client.action_plans.get_barrier_action_plan(barrier_id=barrier_id)
@@ -211,7 +211,7 @@ class EditActionPlanOwner(
 
 class RemoveActionPlanOwner(ActionPlanFormViewMixin, APIBarrierFormViewMixin, View):
     def get(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.action_plans.edit_action_plan(
             barrier_id=str(self.kwargs.get("barrier_id")), owner=None
         )
@@ -293,7 +293,7 @@ class DeleteActionPlanMilestoneView(BarrierMixin, TemplateView):
         return context_data
 
     def post(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         milestone_id = str(self.kwargs.get("milestone_id"))
         barrier_id = str(self.kwargs.get("barrier_id"))
         client.action_plan_milestones.delete_milestone(barrier_id, milestone_id)
@@ -489,7 +489,7 @@ class DeleteActionPlanTaskView(
         return context_data
 
     def post(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         task_id = str(self.kwargs.get("task_id"))
         barrier_id = str(self.kwargs.get("barrier_id"))
         client.action_plan_tasks.delete_task(barrier_id, task_id)
@@ -560,7 +560,7 @@ class ActionPlanRisksAndMitigationWizardView(
         return self.action_plan.data
 
     def done(self, form_list, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
 
         cleaned_data = self.get_all_cleaned_data()
 
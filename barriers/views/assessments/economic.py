@@ -3,7 +3,7 @@ from django.urls import reverse
 from django.views.generic import FormView, RedirectView, TemplateView
 
 from users.permissions import APIPermissionMixin
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.exceptions import APIHttpException
 from utils.metadata import MetadataMixin
 
@@ -142,7 +142,7 @@ class AutomateEconomicAssessment(
     permission_required = "add_economicassessment"
 
     def post(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         try:
             economic_assessment = client.economic_assessments.create(
                 barrier_id=self.barrier.id,
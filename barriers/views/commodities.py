@@ -8,7 +8,7 @@ from barriers.forms.commodities import (
     MultiCommodityLookupForm,
     UpdateBarrierCommoditiesForm,
 )
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 
 from .mixins import BarrierMixin
 
@@ -155,7 +155,7 @@ class BarrierEditCommodities(BarrierMixin, FormView):
             return self.barrier.commodities
 
         if session_commodities != []:
-            client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+            client = get_api_client(self.request)
             hs6_session_codes = [
                 commodity["code"][:6].ljust(10, "0")
                 for commodity in session_commodities
@@ -1,6 +1,10 @@
+from functools import partial
+
+from asgiref.sync import sync_to_async
 from django.views.generic import TemplateView
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.async_client import AsyncMarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.metadata import get_metadata
 
 from .mixins import AnalyticsMixin, BarrierMixin
@@ -16,17 +20,34 @@ class Dashboard(AnalyticsMixin, TemplateView):
         }
     }
 
+    dashboard_data = None
+
+    def get_dashboard_calls(self, client):
+        return (
+            partial(client.saved_searches.get, "my-barriers"),
+            partial(client.saved_searches.get, "team-barriers"),
+            client.mentions.list,
+            client.reports.list,
+            client.saved_searches.list,
+            client.notification_exclusion.get,
+            client.barrier_download.list,
+        )
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         active = self.request.GET.get("active", "barriers")
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        my_barriers_saved_search = client.saved_searches.get("my-barriers")
-        team_barriers_saved_search = client.saved_searches.get("team-barriers")
-        mentions = client.mentions.list()
-        draft_barriers = client.reports.list()
-        saved_searches = client.saved_searches.list()
-        notification_exclusion = client.notification_exclusion.get()
-        barrier_downloads = client.barrier_download.list()
+        if self.dashboard_data is None:
+            client = get_api_client(self.request)
+            self.dashboard_data = client.gather(*self.get_dashboard_calls(client))
+        (
+            my_barriers_saved_search,
+            team_barriers_saved_search,
+            mentions,
+            draft_barriers,
+            saved_searches,
+            notification_exclusion,
+            barrier_downloads,
+        ) = self.dashboard_data
 
         are_all_mentions_read: bool = not any(
             not mention.read_by_recipient for mention in mentions
@@ -52,6 +73,24 @@ class Dashboard(AnalyticsMixin, TemplateView):
         return context_data
 
 
+class AsyncDashboard(Dashboard):
+    """
+    Dashboard served as an async view under ASGI.
+
+    The API calls are awaited on the event loop rather than tying up a worker
+    thread for the duration of the slowest call.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        client = AsyncMarketAccessAPIClient(
+            request.session.get("sso_token"), memo=getattr(request, "api_memo", None)
+        )
+        self.dashboard_data = await client.gather(
+            *self.get_dashboard_calls(client.sync_client)
+        )
+        return await sync_to_async(super().get)(request, *args, **kwargs)
+
+
 class BarrierDetail(AnalyticsMixin, BarrierMixin, TemplateView):
     template_name = "barriers/barrier_detail.html"
     include_interactions = True
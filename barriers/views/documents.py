@@ -2,20 +2,40 @@ from http import HTTPStatus
 
 from django.http import JsonResponse
 from django.template.defaultfilters import filesizeformat
-from django.views.generic import FormView, RedirectView
+from django.urls import reverse
+from django.views.generic import FormView, RedirectView, View
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.exceptions import FileUploadError, ScanError
 
 
 class DownloadDocument(RedirectView):
     def get_redirect_url(self, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         document_id = self.kwargs.get("document_id")
         data = client.documents.get_download(document_id)
         return data["document_url"]
 
 
+class DocumentScanStatus(View):
+    """
+    Ajax view polled while a document is being virus scanned
+    """
+
+    def get(self, request, *args, **kwargs):
+        client = get_api_client(self.request)
+        try:
+            scan = client.documents.get_scan_status(str(self.kwargs["document_id"]))
+        except ScanError as e:
+            return JsonResponse(
+                {"message": str(e)},
+                status=HTTPStatus.UNAUTHORIZED,
+            )
+        return JsonResponse(
+            {"status": scan["status"], "retryAfter": scan["retry_after"]}
+        )
+
+
 class AddDocumentAjaxView(FormView):
     """
     Base ajax view for uploading documents
@@ -50,6 +70,11 @@ class AddDocumentAjaxView(FormView):
                     "name": document["file"]["name"],
                     "size": filesizeformat(document["file"]["size"]),
                 },
+                "scanStatus": document["scan_status"],
+                "scanStatusUrl": reverse(
+                    "barriers:document_scan_status",
+                    kwargs={"document_id": document["id"]},
+                ),
             }
         )
 
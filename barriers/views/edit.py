@@ -19,7 +19,7 @@ from barriers.forms.edit import (
     UpdateTradeDirectionForm,
     update_barrier_priority_form_factory,
 )
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import MarketAccessAPIClient, get_api_client
 from utils.context_processors import user_scope
 from utils.metadata import MetadataMixin
 
@@ -95,7 +95,7 @@ class BarrierEditPriority(APIBarrierFormViewMixin, FormView):
 
     def remove_all_priorities(self, is_admin=False, rejection_reason=""):
         # Remove all priority tags
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         if is_admin:
             client.barriers.patch(
                 self.barrier.id, priority_level="NONE", top_priority_status="NONE"
@@ -160,7 +160,7 @@ class BarrierEditPriority(APIBarrierFormViewMixin, FormView):
             TOP_PRIORITY_BARRIER_STATUS.REMOVAL_PENDING,
             TOP_PRIORITY_BARRIER_STATUS.APPROVED,
         ]:
-            client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+            client = get_api_client(self.request)
             existing_top_priority_summary = client.barriers.get_top_priority_summary(
                 barrier=self.barrier.id
             )
@@ -1,6 +1,9 @@
+from django.conf import settings
 from django.views.generic import TemplateView
 
-from utils.api.client import MarketAccessAPIClient
+from barriers.templatetags.history import history_fragment_cache
+from utils.api.client import get_api_client
+from utils.diff import diff_budget
 
 from .mixins import BarrierMixin
 
@@ -8,16 +11,22 @@ from .mixins import BarrierMixin
 class BarrierHistory(BarrierMixin, TemplateView):
     template_name = "barriers/history.html"
 
+    def get(self, request, *args, **kwargs):
+        # Render inside the budget, as the diffs are made by the templates
+        with diff_budget(settings.HISTORY_DIFF_CPU_BUDGET):
+            return super().get(request, *args, **kwargs).render()
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
 
         full_history = self.get_full_history()
+        history_fragment_cache.prefetch(full_history)
 
         context_data["history_items"] = full_history
         return context_data
 
     def get_full_history(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         barrier_id = self.kwargs.get("barrier_id")
         full_history = client.barriers.get_full_history(barrier_id=barrier_id)
         full_history.sort(key=lambda object: object.date, reverse=True)
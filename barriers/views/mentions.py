@@ -1,40 +1,40 @@
 from django.http import HttpResponseRedirect
 from django.views.generic.base import View
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 
 
 class MentionMarkAsRead(View):
     def get(self, request, mention_id):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.mentions.mark_as_read(mention_id)
         return HttpResponseRedirect("/?active=mentions")
 
 
 class MentionMarkAsUnread(View):
     def get(self, request, mention_id):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.mentions.mark_as_unread(mention_id)
         return HttpResponseRedirect("/?active=mentions")
 
 
 class MentionMarkAllAsRead(View):
     def get(self, request):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.mentions.mark_all_as_read()
         return HttpResponseRedirect("/?active=mentions")
 
 
 class MentionMarkAllAsUnread(View):
     def get(self, request):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.mentions.mark_all_as_unread()
         return HttpResponseRedirect("/?active=mentions")
 
 
 class MentionMarkAsReadAndRedirect(View):
     def get(self, request, mention_id):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         mention = client.mentions.get(mention_id)
         client.mentions.mark_as_read(mention_id)
         return HttpResponseRedirect(mention.go_to_url_path)
@@ -42,13 +42,13 @@ class MentionMarkAsReadAndRedirect(View):
 
 class TurnNotificationsOffAndRedirect(View):
     def get(self, request):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.notification_exclusion.turn_off_notifications()
         return HttpResponseRedirect("/?active=mentions")
 
 
 class TurnNotificationsOnAndRedirect(View):
     def get(self, request):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.notification_exclusion.turn_on_notifications()
         return HttpResponseRedirect("/?active=mentions")
@@ -6,7 +6,7 @@ from django.http import Http404, HttpResponseRedirect
 from django.urls import reverse
 
 from barriers.models import PublicBarrier
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.exceptions import APIHttpException
 
 logger = logging.getLogger(__name__)
@@ -50,8 +50,34 @@ class BarrierMixin:
             self._action_plan = self.get_action_plan()
         return self._action_plan
 
+    def get_barrier_id(self):
+        return self.kwargs.get("barrier_id") or self.barrier.id
+
+    def fetch_barrier_data(self):
+        """
+        Fetch the barrier, its action plan and (if needed) its notes and
+        activity concurrently, rather than one after another on first access.
+        """
+        client = get_api_client(self.request)
+        calls = {}
+        if not self._barrier:
+            calls["_barrier"] = self.get_barrier
+        if not self._action_plan:
+            calls["_action_plan"] = self.get_action_plan
+        if self.include_interactions and not self._interactions:
+            if not self._notes:
+                calls["_notes"] = self.get_notes
+            calls["_activity"] = self.get_barrier_activity
+
+        results = dict(zip(calls.keys(), client.gather(*calls.values())))
+        activity = results.pop("_activity", None)
+        for attr, value in results.items():
+            setattr(self, attr, value)
+        if activity is not None:
+            self._interactions = self.sort_interactions(self.notes + activity)
+
     def get_barrier(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         barrier_id = self.kwargs.get("barrier_id")
         try:
             return client.barriers.get(id=barrier_id)
@@ -60,18 +86,23 @@ class BarrierMixin:
                 raise Http404()
             raise
 
-    def get_interactions(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        activity = client.barriers.get_activity(barrier_id=self.barrier.id)
-        interactions = self.notes + activity
+    def get_barrier_activity(self):
+        client = get_api_client(self.request)
+        return client.barriers.get_activity(barrier_id=self.get_barrier_id())
+
+    def sort_interactions(self, interactions):
         interactions.sort(key=lambda object: object.date, reverse=True)
         return interactions
 
+    def get_interactions(self):
+        return self.sort_interactions(self.notes + self.get_barrier_activity())
+
     def get_notes(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        return client.notes.list(barrier_id=self.barrier.id)
+        client = get_api_client(self.request)
+        return client.notes.list(barrier_id=self.get_barrier_id())
 
     def get_context_data(self, **kwargs):
+        self.fetch_barrier_data()
         context_data = super().get_context_data(**kwargs)
         context_data["barrier"] = self.barrier
         context_data["action_plan"] = self.action_plan
@@ -87,8 +118,8 @@ class BarrierMixin:
                 return note
 
     def get_action_plan(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
-        barrier_id = self.barrier.id
+        client = get_api_client(self.request)
+        barrier_id = self.get_barrier_id()
         try:
             return client.action_plans.get_barrier_action_plan(barrier_id=barrier_id)
         except APIHttpException as e:
@@ -107,7 +138,7 @@ class PublicBarrierMixin:
         return self._public_barrier
 
     def get_public_barrier(self) -> PublicBarrier:
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         barrier_id = self.kwargs.get("barrier_id")
         return client.public_barriers.get(id=barrier_id)
 
@@ -122,7 +153,7 @@ class TeamMembersContextMixin:
 
     def get_team_members(self):
         if self._team_members is None:
-            client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+            client = get_api_client(self.request)
             self._team_members = client.barriers.get_team_members(
                 barrier_id=self.kwargs.get("barrier_id")
             )
@@ -278,7 +309,14 @@ class AnalyticsMixin:
     def dispatch(self, request, *args, **kwargs):
         utm_querystring = self.get_utm_querystring()
         if utm_querystring is not None:
-            return HttpResponseRedirect(f"{request.path_info}?{utm_querystring}")
+            response = HttpResponseRedirect(f"{request.path_info}?{utm_querystring}")
+            if self.view_is_async:
+
+                async def func():
+                    return response
+
+                return func()
+            return response
         return super().dispatch(request, *args, **kwargs)
 
 
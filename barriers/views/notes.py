@@ -2,7 +2,7 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.views.generic import FormView, RedirectView, TemplateView
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 
 from ..forms.notes import AddNoteForm, EditNoteForm, NoteDocumentForm
 from .documents import AddDocumentAjaxView, DeleteDocumentAjaxView
@@ -150,7 +150,7 @@ class BarrierDeleteNote(NoteSessionDocumentMixin, BarrierMixin, TemplateView):
         return context_data
 
     def post(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.notes.delete(self.kwargs.get("note_id"))
         self.delete_session_documents()
         url = reverse(
@@ -12,7 +12,7 @@ from barriers.forms.edit import (
 )
 from barriers.forms.various import ChooseUpdateTypeForm
 from barriers.views.mixins import APIBarrierFormViewMixin, BarrierMixin
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.context_processors import user_scope
 
 logger = logging.getLogger(__name__)
@@ -298,7 +298,7 @@ class BarrierCompleteNextStepItem(View):
         barrier_id = kwargs["barrier_id"]
         item_id = kwargs["item_id"]
         # Patch next step item in DB to complete
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.barriers.patch_next_steps_item(
             barrier=barrier_id,
             id=item_id,
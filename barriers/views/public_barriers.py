@@ -20,7 +20,7 @@ from barriers.forms.public_barriers import (
     UnpublishPublicBarrierForm,
 )
 from users.mixins import UserMixin
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.helpers import remove_empty_values_from_dict
 from utils.metadata import MetadataMixin
 
@@ -72,7 +72,7 @@ class PublicBarrierListView(MetadataMixin, SearchFormView):
             return None
 
     def get_public_barriers(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         return client.public_barriers.list(**self.get_params())
 
     def get_context_data(self, **kwargs):
@@ -90,7 +90,7 @@ class PublicBarrierDetail(
     template_name = "barriers/public_barriers/detail.html"
 
     def get_activity(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         activity_items = client.public_barriers.get_activity(barrier_id=self.barrier.id)
         activity_items = [
             item
@@ -102,12 +102,11 @@ class PublicBarrierDetail(
         return activity_items
 
     def get_context_data(self, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
         context_data = super().get_context_data(**kwargs)
 
         # Establish type of user accessing the page and pass to template
         # Users can only be in one of these categories.
-        user_groups = client.users.get_current().groups_display
+        user_groups = self.request.current_user.groups_display
         if "Public barrier approver" in user_groups:
             context_data["user_role"] = "Approver"
         elif "Publisher" in user_groups:
@@ -178,7 +177,7 @@ class PublicBarrierDetail(
                 return note
 
     def get_notes(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         return client.public_barriers.get_notes(self.barrier.id)
 
     def form_valid(self, form):
@@ -189,7 +188,7 @@ class PublicBarrierDetail(
         action = self.request.POST.get("action")
         context_data = self.get_context_data()
         if action:
-            client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+            client = get_api_client(self.request)
             barrier_id = self.kwargs.get("barrier_id")
 
             if action == "submit-for-approval":
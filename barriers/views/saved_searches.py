@@ -2,7 +2,7 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.views.generic import FormView, TemplateView
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.metadata import get_metadata
 
 from ..forms.saved_searches import (
@@ -49,7 +49,7 @@ class SavedSearchMixin:
         return context_data
 
     def get_saved_search(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         saved_search_id = self.kwargs.get("saved_search_id")
         return client.saved_searches.get(saved_search_id)
 
@@ -87,7 +87,7 @@ class DeleteSavedSearch(SavedSearchMixin, TemplateView):
     template_name = "barriers/saved_searches/delete.html"
 
     def post(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         saved_search_id = str(self.kwargs.get("saved_search_id"))
         client.saved_searches.delete(saved_search_id)
         return HttpResponseRedirect(reverse("barriers:dashboard"))
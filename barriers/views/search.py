@@ -1,18 +1,23 @@
+import csv
 import logging
 import uuid
 from urllib.parse import urlencode
 
+from django.conf import settings
 from django.forms import Form
-from django.http import HttpResponseRedirect
+from django.http import HttpResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.views.generic import FormView, TemplateView, View
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import MarketAccessAPIClient, get_api_client
 from utils.metadata import get_metadata
+from utils.models import parse_date
 from utils.pagination import PaginationMixin
 from utils.tools import nested_sort
 
 from ..forms.search import BarrierSearchForm
+from ..models import Barrier
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,26 @@ class SearchFormMixin:
         }
 
 
+class SearchSidebarData(View):
+    """
+    The metadata the search filters are built from, as JSON.
+
+    It is the same for every search, so rather than embedding it in each
+    search page it is fetched separately and cached by the browser.
+    """
+
+    def get(self, request, *args, **kwargs):
+        content, etag = get_metadata().get_search_sidebar()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(content, content_type="application/json")
+        response["ETag"] = etag
+        patch_cache_control(
+            response, private=True, max_age=settings.SEARCH_SIDEBAR_CACHE_TIME
+        )
+        return response
+
+
 class SearchFormView(SearchFormMixin, FormView):
     form_class = Form
 
@@ -48,24 +73,23 @@ class BarrierSearch(PaginationMixin, SearchFormView):
     @property
     def client(self):
         if self._client is None:
-            self._client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+            self._client = get_api_client(self.request)
         return self._client
 
     def get_context_data(self, form, **kwargs):
         context_data = super().get_context_data(form=form, **kwargs)
         context_data.update(self.get_saved_search_context_data(form))
         barriers = self.get_barriers(form)
+        pagination = self.get_pagination_data(object_list=barriers)
+        if "next" in pagination:
+            self.prefetch_next_page(form)
         metadata = get_metadata()
         context_data.update(
             {
                 "barriers": barriers,
-                "trading_blocs": metadata.get_trading_bloc_list(),
-                "admin_areas": self.get_admin_areas_data(
-                    metadata.get_admin_area_list()
-                ),
-                "countries_with_admin_areas": metadata.get_countries_with_admin_areas_list(),
+                "search_sidebar_url": self.get_search_sidebar_url(metadata),
                 "filters": form.get_readable_filters(),
-                "pagination": self.get_pagination_data(object_list=barriers),
+                "pagination": pagination,
                 "pageless_querystring": self.get_pageless_querystring(),
                 "page": "search",
                 "search_csv_downloaded": self.request.GET.get("search_csv_downloaded"),
@@ -89,25 +113,21 @@ class BarrierSearch(PaginationMixin, SearchFormView):
             **form.get_api_search_parameters(),
         )
 
-    def get_admin_areas_data(self, admin_areas_metadata):
-        # Admin area data works differently to both trading blocs and countries
-        # We only want admin areas for specific countries and we need them formatted and
-        # sorted in a particular way so the Javascript and HTML can display them correctly
-        # in seperate drop down lists.
-        filtered_areas = {}
-
-        for area in admin_areas_metadata:
-            country = area["country"]["id"]
-            if filtered_areas.get(f"{country}") is None:
-                filtered_areas[f"{country}"] = [
-                    {"value": area["id"], "label": area["name"]}
-                ]
-            else:
-                filtered_areas[f"{country}"].append(
-                    {"value": area["id"], "label": area["name"]}
-                )
+    def prefetch_next_page(self, form):
+        """
+        Start fetching the next page so that following "Next" is a cache hit.
+        """
+        self.client.barriers.prefetch_list(
+            limit=self.get_pagination_limit(),
+            offset=self.get_pagination_offset() + self.get_pagination_limit(),
+            **form.get_api_search_parameters(),
+        )
 
-        return filtered_areas
+    def get_search_sidebar_url(self, metadata):
+        # The ETag changes with the metadata, so browsers can keep each version
+        _, etag = metadata.get_search_sidebar()
+        version = etag.strip('"')
+        return f"{reverse('barriers:search_sidebar')}?{urlencode({'v': version})}"
 
     def get_saved_search(self, form):
         if form.cleaned_data.get("search_id") is not None:
@@ -165,14 +185,51 @@ class BarrierSearch(PaginationMixin, SearchFormView):
         return params.urlencode()
 
 
+class Echo:
+    """
+    File-like object for csv.writer which returns each row instead of storing it.
+    """
+
+    def write(self, value):
+        return value
+
+
 class DownloadBarriers(SearchFormMixin, View):
     form_class = BarrierSearchForm
+    csv_page_size = 100
+    csv_headers = (
+        "Code",
+        "Title",
+        "Status",
+        "Status date",
+        "Location",
+        "Sectors",
+        "Reported on",
+        "Last updated",
+        "Estimated resolution date",
+        "Link",
+    )
 
     _search_form = None
 
     def get(self, request, *args, **kwargs):
         form = self.form_class(**self.get_form_kwargs())
         form.is_valid()
+
+        if settings.BARRIER_CSV_STREAMING_MAX_ROWS:
+            # A client without the request memo, so that pages already
+            # written out are not kept in memory
+            client = MarketAccessAPIClient(request.session.get("sso_token"))
+            list_parameters = form.get_api_search_parameters()
+            first_page = self.get_csv_page(client, list_parameters, offset=0)
+            if first_page["count"] <= settings.BARRIER_CSV_STREAMING_MAX_ROWS:
+                response = StreamingHttpResponse(
+                    self.get_csv_rows(client, list_parameters, first_page),
+                    content_type="text/csv",
+                )
+                response["Content-Disposition"] = "attachment; filename=barriers.csv"
+                return response
+
         search_parameters = form.get_api_search_parameters()
         search_parameters["filters"] = self.search_form.get_raw_filters()
         search_id = search_parameters.get("search_id")
@@ -182,7 +239,7 @@ class DownloadBarriers(SearchFormMixin, View):
         if search_id and isinstance(search_id, uuid.UUID):
             search_parameters["search_id"] = str(search_id)
 
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         barrier_download = client.barrier_download.create(**search_parameters)
         download_detail_url = reverse(
             "barriers:download-detail",
@@ -198,6 +255,49 @@ class DownloadBarriers(SearchFormMixin, View):
             f"{download_detail_url}?{urlencode(search_page_params)}&{form.get_raw_filters_querystring()}"
         )
 
+    def get_csv_page(self, client, list_parameters, offset):
+        # Not client.barriers.list, to keep export pages out of the search cache
+        return client.get(
+            client.barriers.resource_name,
+            params={**list_parameters, "limit": self.csv_page_size, "offset": offset},
+        )
+
+    def get_csv_rows(self, client, list_parameters, page):
+        """
+        Yield CSV rows a page of barriers at a time.
+        """
+        writer = csv.writer(Echo())
+        yield writer.writerow(self.csv_headers)
+        offset = 0
+        while True:
+            for barrier_data in page["results"]:
+                yield writer.writerow(self.get_csv_row(Barrier(barrier_data)))
+            offset += self.csv_page_size
+            if not page["results"] or offset >= page["count"]:
+                return
+            page = self.get_csv_page(client, list_parameters, offset)
+
+    def get_csv_row(self, barrier):
+        return (
+            barrier.code,
+            barrier.title,
+            barrier.status.get("name"),
+            self.format_csv_date(barrier.data.get("status_date")),
+            barrier.location,
+            ", ".join(barrier.sector_names),
+            self.format_csv_date(barrier.data.get("reported_on")),
+            self.format_csv_date(barrier.data.get("modified_on")),
+            self.format_csv_date(barrier.data.get("estimated_resolution_date")),
+            self.request.build_absolute_uri(
+                reverse("barriers:barrier_detail", kwargs={"barrier_id": barrier.id})
+            ),
+        )
+
+    def format_csv_date(self, value):
+        if value:
+            return parse_date(value).strftime("%d/%m/%Y")
+        return ""
+
     @property
     def search_form(self):
         if not self._search_form:
@@ -215,7 +315,7 @@ class DownloadBarriersDetail(SearchFormMixin, TemplateView):
     template_name = "barriers/download_barriers/detail.html"
 
     def get(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         download_barrier_id = str(kwargs["download_barrier_id"])
         barrier_download = client.barrier_download.get(download_barrier_id)
         return self.render_to_response(
@@ -227,7 +327,7 @@ class DownloadBarriersDelete(SearchFormMixin, TemplateView):
     template_name = "barriers/download_barriers/delete.html"
 
     def post(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         download_barrier_id = str(kwargs["download_barrier_id"])
         client.barrier_download.delete(download_barrier_id)
         url = reverse("barriers:dashboard") + "?active=barrier_downloads"
@@ -235,7 +335,7 @@ class DownloadBarriersDelete(SearchFormMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         download_barrier_id = kwargs["download_barrier_id"]
         context_data["download_barrier_id"] = download_barrier_id
         context_data["barrier_download"] = client.barrier_download.get(
@@ -246,7 +346,7 @@ class DownloadBarriersDelete(SearchFormMixin, TemplateView):
 
 class BarrierDownloadLink(View):
     def get(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         download_barrier_id = str(kwargs["download_barrier_id"])
         barrier_download_link = client.barrier_download.get_presigned_url(
             download_barrier_id
@@ -258,7 +358,7 @@ class RequestBarrierDownloadApproval(SearchFormMixin, View):
     form_class = BarrierSearchForm
 
     def get(self, request, *args, **kwargs):
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         resp = client.barriers.request_download_approval()
 
         search_page_url = reverse("barriers:search")
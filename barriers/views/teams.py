@@ -3,7 +3,7 @@ from django.urls import reverse
 from django.views.generic import FormView, TemplateView
 
 from users.mixins import UserSearchMixin
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 
 from .mixins import BarrierMixin, TeamMembersContextMixin
 
@@ -66,7 +66,7 @@ class DeleteTeamMember(
 
     def post(self, request, *args, **kwargs):
         team_member_id = self.kwargs.get("team_member_id")
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         client.barriers.delete_team_member(team_member_id)
         return HttpResponseRedirect(self.get_success_url())
 
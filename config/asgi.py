@@ -0,0 +1,14 @@
+"""
+ASGI config for market_access_python_frontend project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+Set ASYNC_VIEWS_ENABLED to serve the heaviest views as async views,
+overlapping their API calls on the event loop.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
+"""
+
+from django.core.asgi import get_asgi_application
+
+application = get_asgi_application()
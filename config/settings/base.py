@@ -115,6 +115,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "utils.middleware.APIClientMiddleware",
+    "utils.middleware.CurrentUserMiddleware",
     "authentication.middleware.SSOMiddleware",
     "utils.middleware.RequestLoggingMiddleware",
     "csp.middleware.CSPMiddleware",
@@ -159,13 +161,24 @@ if is_copilot():
     DATABASES = {
         "default": dj_database_url.config(
             default=database_url_from_env("DATABASE_ENV_VAR_KEY"),
+            engine="utils.db.postgresql_pool",
+            # Connections are kept between requests by the pool instead
             conn_max_age=0,
-            conn_health_checks=True,
         )
     }
 else:
     DATABASES = {"default": env.db("DATABASE_URL")}
 
+# Connections kept by each worker, see utils.db.postgresql_pool
+DATABASE_POOL_SIZE = env.int("DATABASE_POOL_SIZE", default=10)
+# Seconds a request waits for a pooled connection before failing
+DATABASE_POOL_TIMEOUT = env.int("DATABASE_POOL_TIMEOUT", default=10)
+DATABASE_POOL_MAX_IDLE_TIME = env.int("DATABASE_POOL_MAX_IDLE_TIME", default=300)
+# Seconds a health check result is reused for, see healthcheck.checks
+HEALTHCHECK_CACHE_TIME = env.int("HEALTHCHECK_CACHE_TIME", default=5)
+# Seconds each dependency probe of /check-dependencies/ is given
+HEALTHCHECK_TIMEOUT = env.float("HEALTHCHECK_TIMEOUT", default=3.0)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
@@ -222,9 +235,49 @@ STORAGES = {
     },
 }
 
-USER_DATA_CACHE_TIME = 3600
+# How long browsers keep the search filter data, see barriers.views.search
+SEARCH_SIDEBAR_CACHE_TIME = env.int("SEARCH_SIDEBAR_CACHE_TIME", default=86400)
+# The current user's data, including their permissions, is refreshed from the
+# API at least this often, see users.helpers.get_current_user
+USER_DATA_CACHE_TIME = env.int("USER_DATA_CACHE_TIME", default=300)
+# Rendered barrier history items, see barriers.templatetags.history
+HISTORY_FRAGMENT_CACHE_TIME = env.int("HISTORY_FRAGMENT_CACHE_TIME", default=86400)
+HISTORY_FRAGMENT_LOCAL_CACHE_SIZE = env.int(
+    "HISTORY_FRAGMENT_LOCAL_CACHE_SIZE", default=2000
+)
+# CPU time (seconds) a history page may spend on text diffs
+HISTORY_DIFF_CPU_BUDGET = env.float("HISTORY_DIFF_CPU_BUDGET", default=2.0)
 METADATA_CACHE_TIME = env.int("METADATA_CACHE_TIME", default=10600)
+# How long (seconds) a worker uses its parsed metadata before checking redis
+# for a new version
+METADATA_LOCAL_CACHE_TIME = env.int("METADATA_LOCAL_CACHE_TIME", default=5)
+# Longest time (seconds) one process may spend downloading metadata while
+# the others wait for it
+METADATA_LOCK_TIME = env.int("METADATA_LOCK_TIME", default=60)
+# How often (seconds) each worker's background refresher checks the metadata
+# in redis, 0 turns it off. It downloads metadata again when missing or due to
+# expire within METADATA_REFRESH_AHEAD_TIME seconds.
+METADATA_REFRESH_INTERVAL = env.int("METADATA_REFRESH_INTERVAL", default=60)
+METADATA_REFRESH_AHEAD_TIME = env.int("METADATA_REFRESH_AHEAD_TIME", default=600)
+# Higher values make requests refresh metadata earlier before it expires
+METADATA_EARLY_REFRESH_BETA = env.float("METADATA_EARLY_REFRESH_BETA", default=1.0)
 USE_S3_FOR_CSV_DOWNLOADS = env("USE_S3_FOR_CSV_DOWNLOADS", default=True)
+# Searches with up to this many barriers are streamed straight to the browser
+# as CSV instead of going through a download job. 0 always uses the job.
+BARRIER_CSV_STREAMING_MAX_ROWS = env.int("BARRIER_CSV_STREAMING_MAX_ROWS", default=0)
+# How long (seconds) slow-changing API responses are shared between requests,
+# by APICachePolicy name. 0 turns caching off for that policy.
+API_CACHE_TIMES = {
+    "barrier-search": env.int("API_CACHE_BARRIER_SEARCH_TIME", default=30),
+    "commodities": env.int("API_CACHE_COMMODITIES_TIME", default=3600),
+    "current-user": env.int("API_CACHE_CURRENT_USER_TIME", default=30),
+    "groups": env.int("API_CACHE_GROUPS_TIME", default=3600),
+    "saved-searches": env.int("API_CACHE_SAVED_SEARCHES_TIME", default=60),
+    "top-priority-summary": env.int("API_CACHE_TOP_PRIORITY_SUMMARY_TIME", default=60),
+}
+# How long (seconds) after expiring a response may still be served while it
+# is refreshed in the background
+API_CACHE_STALE_TIME = env.int("API_CACHE_STALE_TIME", default=300)
 
 # CACHE / REDIS
 # Try to read from PaaS service env vars first
@@ -244,9 +297,9 @@ if REDIS_URI:
         }
     }
 
-# Set user sessions to be stored in the cache, not the DB, unless there
-# is a problem with redis
-SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+# User sessions are stored in redis, see utils.redis_sessions. Set to
+# django.contrib.sessions.backends.cached_db to keep them in the DB as well
+SESSION_ENGINE = env.str("SESSION_ENGINE", default="utils.redis_sessions")
 
 # Market access API
 MARKET_ACCESS_API_URI = env("MARKET_ACCESS_API_URI")
@@ -257,6 +310,25 @@ MARKET_ACCESS_API_HAWK_CREDS = {
     "key": MARKET_ACCESS_API_HAWK_KEY,
     "algorithm": "sha256",
 }
+# Connection pool, timeouts (seconds) and retries for calls to the API.
+# Read timeouts are never retried, so the worst case for a single call is
+# (MAX_RETRIES + 1) * CONNECT_TIMEOUT + READ_TIMEOUT plus the backoff sleeps
+# (BACKOFF * (2 ** n) between attempts) - about 40s with the defaults.
+MARKET_ACCESS_API_POOL_SIZE = env.int("MARKET_ACCESS_API_POOL_SIZE", default=10)
+MARKET_ACCESS_API_CONNECT_TIMEOUT = env.float(
+    "MARKET_ACCESS_API_CONNECT_TIMEOUT", default=3.05
+)
+MARKET_ACCESS_API_READ_TIMEOUT = env.float("MARKET_ACCESS_API_READ_TIMEOUT", default=30)
+MARKET_ACCESS_API_MAX_RETRIES = env.int("MARKET_ACCESS_API_MAX_RETRIES", default=2)
+MARKET_ACCESS_API_RETRY_BACKOFF = env.float(
+    "MARKET_ACCESS_API_RETRY_BACKOFF", default=0.3
+)
+# Maximum number of API calls a view may have in flight at once
+MARKET_ACCESS_API_MAX_CONCURRENCY = env.int(
+    "MARKET_ACCESS_API_MAX_CONCURRENCY", default=8
+)
+# Serve the heaviest views as async views, only worthwhile under config.asgi
+ASYNC_VIEWS_ENABLED = env.bool("ASYNC_VIEWS_ENABLED", default=False)
 
 SSO_CLIENT = env("SSO_CLIENT")
 SSO_SECRET = env("SSO_SECRET")
@@ -274,10 +346,19 @@ DATAHUB_HAWK_ID = env("DATAHUB_HAWK_ID")
 DATAHUB_HAWK_KEY = env("DATAHUB_HAWK_KEY")
 
 FILE_MAX_SIZE = env.int("FILE_MAX_SIZE", default=(5 * 1024 * 1024))
+FILE_UPLOAD_HANDLERS = [
+    "utils.uploadhandlers.MaxSizeUploadHandler",
+    "django.core.files.uploadhandler.MemoryFileUploadHandler",
+    "django.core.files.uploadhandler.TemporaryFileUploadHandler",
+]
 FILE_SCAN_MAX_WAIT_TIME = env.int("FILE_SCAN_MAX_WAIT_TIME", default=30000)
 FILE_SCAN_STATUS_CHECK_INTERVAL = env.int(
     "FILE_SCAN_STATUS_CHECK_INTERVAL", default=500
 )
+FILE_SCAN_STATUS_MAX_CHECK_INTERVAL = env.int(
+    "FILE_SCAN_STATUS_MAX_CHECK_INTERVAL", default=4000
+)
+FILE_SCAN_STATUS_CACHE_TIME = env.int("FILE_SCAN_STATUS_CACHE_TIME", default=3600)
 ALLOWED_FILE_TYPES = env.list("ALLOWED_FILE_TYPES", default=["text/csv", "image/jpeg"])
 
 API_RESULTS_LIMIT = env.int("API_RESULTS_LIMIT", default=50)
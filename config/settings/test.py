@@ -18,6 +18,12 @@ CACHES = {
     }
 }
 
+API_CACHE_TIMES = {}
+SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+HISTORY_FRAGMENT_CACHE_TIME = 0
+HEALTHCHECK_CACHE_TIME = 0
+HEALTHCHECK_TIMEOUT = 1.0
+
 
 HEADLESS = env.bool("HEADLESS", default=True)
 
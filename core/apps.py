@@ -10,5 +10,10 @@ class CoreConfig(AppConfig):
         # deleting the metadata cache on startup, making sure we start from a blank slate when we deploy.
         # we don't want to do this in the test environment, as we don't have access to the redis instance
         if settings.DJANGO_ENV != "test":
+            from utils.metadata import clear_metadata_cache, start_metadata_refresher
+
             redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
-            redis_client.delete("metadata")
+            clear_metadata_cache(client=redis_client)
+            # keep metadata downloaded ahead of expiry, so requests never wait for it
+            if settings.METADATA_REFRESH_INTERVAL:
+                start_metadata_refresher()
@@ -74,15 +74,17 @@ ma.components.AttachmentForm = (function (jessie) {
             var file = data.file;
 
             if (documentId && file) {
-                this.submitButton.disabled = false;
-                this.fileUpload.showLink();
                 var item = {
                     id: documentId,
                     delete_url: data.delete_url,
                     name: file.name,
                     size: file.size,
                 };
-                this.attachments.addItem(item, this.multiDocument);
+                if (data.scanStatus === "pending") {
+                    this.checkScanStatus(item, data.scanStatusUrl);
+                } else {
+                    this.addItem(item);
+                }
             } else {
                 this.showError(
                     "There was an issue uploading the document, try again",
@@ -99,6 +101,62 @@ ma.components.AttachmentForm = (function (jessie) {
         }
     };
 
+    AttachmentForm.prototype.addItem = function (item) {
+        this.submitButton.disabled = false;
+        this.fileUpload.showLink();
+        this.attachments.addItem(item, this.multiDocument);
+    };
+
+    // The scan status view says how long to wait before asking again,
+    // backing off while the scan is still running
+    AttachmentForm.prototype.checkScanStatus = function (item, url) {
+        var xhr = ma.xhr2();
+
+        xhr.addEventListener(
+            "load",
+            bind(function () {
+                var data;
+
+                try {
+                    data = JSON.parse(xhr.response);
+                } catch (e) {
+                    data = {};
+                }
+
+                if (xhr.status === 200 && data.status === "pending") {
+                    setTimeout(
+                        bind(function () {
+                            this.checkScanStatus(item, url);
+                        }, this),
+                        data.retryAfter,
+                    );
+                } else if (xhr.status === 200 && data.status === "clean") {
+                    this.addItem(item);
+                } else {
+                    this.removeDocument(item.delete_url);
+                    this.showError(
+                        data.message ||
+                            "There was an issue uploading the document, try again",
+                    );
+                }
+            }, this),
+            false,
+        );
+        xhr.addEventListener(
+            "error",
+            bind(function () {
+                this.removeDocument(item.delete_url);
+                this.transferFailed();
+            }, this),
+            false,
+        );
+
+        xhr.open("GET", url, true);
+        xhr.send();
+
+        this.fileUpload.setProgress("scanning file for viruses...");
+    };
+
     AttachmentForm.prototype.newFile = function (fieldName, file) {
         var xhr2 = ma.xhr2();
         var formData = new FormData();
@@ -129,17 +187,21 @@ ma.components.AttachmentForm = (function (jessie) {
         this.fileUpload.setProgress("uploading file... 0%");
     };
 
-    AttachmentForm.prototype.deleteDocument = function (documentId, deleteUrl) {
-        if (!documentId) {
-            return;
-        }
-
+    // Remove the document from the session
+    AttachmentForm.prototype.removeDocument = function (deleteUrl) {
         var xhr = ma.xhr2();
 
         xhr.open("POST", deleteUrl, true);
         xhr.setRequestHeader("X-CSRFToken", csrftoken);
         xhr.send();
+    };
+
+    AttachmentForm.prototype.deleteDocument = function (documentId, deleteUrl) {
+        if (!documentId) {
+            return;
+        }
 
+        this.removeDocument(deleteUrl);
         this.attachments.removeItem(documentId);
     };
 
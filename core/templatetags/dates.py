@@ -1,9 +1,10 @@
 import datetime
 
-import dateutil.parser
 from django.template import Library
 from django.template.defaultfilters import stringfilter
 
+from utils.models import parse_date as parse_api_date
+
 register = Library()
 
 
@@ -27,4 +28,4 @@ def parse_date(date_string, format):
 @register.filter
 @stringfilter
 def parse_iso(date_string):
-    return dateutil.parser.parse(date_string)
+    return parse_api_date(date_string)
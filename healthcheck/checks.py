@@ -1,12 +1,51 @@
+import functools
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import redis
 import requests
 from django.conf import settings
+from django.db import connection
 from mohawk import Sender
 from sentry_sdk import capture_exception
 
 from .constants import HealthStatus
 from .models import HealthCheck
 
+# Number of recent probe durations kept for each dependency
+LATENCY_SAMPLES = 100
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def cached_check(check):
+    """
+    Reuse a check's result for HEALTHCHECK_CACHE_TIME seconds.
+
+    Load balancers and uptime monitors probe every few seconds, this stops
+    each probe from reaching the dependency being checked.
+    """
+    lock = threading.Lock()
+    cached = {}
+
+    @functools.wraps(check)
+    def wrapper():
+        with lock:
+            if cached and cached["expires_at"] > time.monotonic():
+                return cached["result"]
+        result = check()
+        with lock:
+            cached["result"] = result
+            cached["expires_at"] = time.monotonic() + settings.HEALTHCHECK_CACHE_TIME
+        return result
 
+    wrapper.clear = cached.clear
+    return wrapper
+
+
+@cached_check
 def db_check():
     """
     Performs a basic check on the database by performing a select query on a simple table
@@ -41,6 +80,7 @@ def api_check():
                 "Authorization": sender.request_header,
                 "Content-Type": "text/plain",
             },
+            timeout=settings.HEALTHCHECK_TIMEOUT,
         )
         response.raise_for_status()
         response_data = response.json()
@@ -51,3 +91,143 @@ def api_check():
         data["duration"] = response_data.get("duration")
 
     return data
+
+
+class LatencyHistogram:
+    """
+    Durations of the most recent probes of a dependency, kept by each process.
+    """
+
+    def __init__(self, size=LATENCY_SAMPLES):
+        self.lock = threading.Lock()
+        self.durations = deque(maxlen=size)
+
+    def add(self, duration):
+        with self.lock:
+            self.durations.append(duration)
+
+    def get_percentiles(self):
+        with self.lock:
+            durations = sorted(self.durations)
+        if not durations:
+            return {}
+        # Nearest rank percentiles
+        return {
+            f"p{percentile}": durations[
+                math.ceil(len(durations) * percentile / 100) - 1
+            ]
+            for percentile in LATENCY_PERCENTILES
+        }
+
+
+def probe_database(timeout):
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    finally:
+        # Probes run in their own thread, so its connection isn't closed
+        # at the end of a request
+        connection.close()
+
+
+def probe_redis(timeout):
+    with redis.Redis.from_url(
+        settings.REDIS_URI, socket_connect_timeout=timeout, socket_timeout=timeout
+    ) as client:
+        client.ping()
+
+
+def probe_api(timeout):
+    status = api_check()["status"]
+    if status != HealthStatus.OK:
+        raise ConnectionError(f"API check returned {status}")
+
+
+def probe_url(url, timeout):
+    """
+    Any response short of a server error shows the service is up, without
+    needing credentials for an endpoint.
+    """
+    response = requests.get(url, verify=not settings.DEBUG, timeout=timeout)
+    if response.status_code >= 500:
+        raise ConnectionError(f"{url} returned {response.status_code}")
+
+
+def probe_sso(timeout):
+    probe_url(settings.SSO_API_URI, timeout)
+
+
+def probe_datahub(timeout):
+    probe_url(settings.DATAHUB_URL, timeout)
+
+
+DEPENDENCY_PROBES = {
+    "database": probe_database,
+    "redis": probe_redis,
+    "api": probe_api,
+    "sso": probe_sso,
+    "datahub": probe_datahub,
+}
+latency_histograms = {name: LatencyHistogram() for name in DEPENDENCY_PROBES}
+
+
+def run_probe(name):
+    """
+    Returns the probe's duration and error message, None if it succeeded.
+
+    The duration is recorded even if the probe finishes after
+    dependencies_check has given up on it, so a dependency that keeps timing
+    out shows in its latency percentiles.
+    """
+    error = None
+    start = time.monotonic()
+    try:
+        DEPENDENCY_PROBES[name](settings.HEALTHCHECK_TIMEOUT)
+    except Exception as e:
+        error = str(e) or e.__class__.__name__
+    duration = time.monotonic() - start
+    latency_histograms[name].add(duration)
+    return duration, error
+
+
+@cached_check
+def dependencies_check():
+    """
+    Probes every dependency at once, giving each HEALTHCHECK_TIMEOUT seconds.
+    :return: The overall status and each dependency's status and duration
+    """
+    executor = ThreadPoolExecutor(max_workers=len(DEPENDENCY_PROBES))
+    futures = {name: executor.submit(run_probe, name) for name in DEPENDENCY_PROBES}
+    # Don't wait for probes that have timed out
+    executor.shutdown(wait=False)
+
+    wait(futures.values(), timeout=settings.HEALTHCHECK_TIMEOUT)
+
+    checks = {}
+    for name, future in futures.items():
+        if future.done():
+            duration, error = future.result()
+        else:
+            duration = None
+            error = f"Timed out after {settings.HEALTHCHECK_TIMEOUT}s"
+        checks[name] = {
+            "status": HealthStatus.FAIL if error else HealthStatus.OK,
+            "duration": duration,
+            "error": error,
+        }
+
+    return {
+        "status": (
+            HealthStatus.OK
+            if all(check["status"] == HealthStatus.OK for check in checks.values())
+            else HealthStatus.FAIL
+        ),
+        "checks": checks,
+    }
+
+
+def get_latency_percentiles():
+    return {
+        name: histogram.get_percentiles()
+        for name, histogram in latency_histograms.items()
+    }
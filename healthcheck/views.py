@@ -1,11 +1,17 @@
 import time
 
-from django.views.generic import TemplateView
+from django.http import JsonResponse
+from django.views.generic import TemplateView, View
 
 from authentication.decorators import public_view
 from healthcheck.constants import HealthStatus
 
-from .checks import api_check, db_check
+from .checks import (
+    api_check,
+    db_check,
+    dependencies_check,
+    get_latency_percentiles,
+)
 
 
 @public_view
@@ -33,3 +39,23 @@ class APIHealthCheckView(TemplateView):
         context["status"] = data.get("status") or HealthStatus.FAIL
         context["response_time"] = data.get("duration") or fe_response_time
         return context
+
+
+@public_view
+class DependenciesHealthCheckView(View):
+    def get(self, request, *args, **kwargs):
+        """
+        Returns the status of each dependency the frontend calls, with
+        percentiles of its recent probe durations in seconds
+        """
+        data = dependencies_check()
+        latency = get_latency_percentiles()
+        return JsonResponse(
+            {
+                "status": data["status"],
+                "checks": {
+                    name: {**check, "latency": latency[name]}
+                    for name, check in data["checks"].items()
+                },
+            }
+        )
@@ -1,17 +1,23 @@
 from django.db import DatabaseError
 
+from healthcheck.checks import cached_check
 from healthcheck.models import HealthCheck
 
 
+@cached_check
+def check_database():
+    try:
+        HealthCheck.objects.exists()
+        return True, ""
+    except DatabaseError as e:
+        return False, e
+
+
 class CheckDatabase:
     name = "database"
 
     def check(self):
-        try:
-            HealthCheck.objects.exists()
-            return True, ""
-        except DatabaseError as e:
-            return False, e
+        return check_database()
 
 
 services_to_check = (CheckDatabase,)
@@ -1,7 +1,5 @@
 import operator
 
-import dateutil.parser
-
 from barriers.constants import STATUSES, Statuses
 from utils.metadata import get_metadata
 from utils.models import APIModel
@@ -31,7 +29,7 @@ class Report(APIModel):
 
     @property
     def created_on(self):
-        return dateutil.parser.parse(self.data["created_on"])
+        return self.get_date("created_on")
 
     @property
     def progress(self):
@@ -1,6 +1,8 @@
 import datetime
+import hashlib
 import json
 import logging
+from functools import partial
 
 from django.http import HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect
@@ -25,7 +27,7 @@ from reports.report_barrier_forms import (
     BarrierStatusForm,
     BarrierTradeDirectionForm,
 )
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.metadata import MetadataMixin
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,10 @@ logger = logging.getLogger(__name__)
 # visible to other users.
 
 
+def get_step_data_hash(step_data):
+    return hashlib.md5(json.dumps(step_data, sort_keys=True).encode()).hexdigest()
+
+
 def check_public_form_form_display(step):
     """
     Checks the current step, verifies that the prerequisite questions to 'unlock' the next page are met,
@@ -141,7 +147,7 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
         """
 
         step_url = kwargs.get("step", None)
-        self.client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        self.client = get_api_client(self.request)
 
         # Handle legacy React app calls
         if request.headers.get("x-requested-with") == "XMLHttpRequest":
@@ -528,19 +534,39 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
         # Ensure we have input data to save by checking we have passed at least
         # the first form page some input data
         barrier_title_form = self.get_cleaned_data_for_step("barrier-about")
-        if barrier_title_form:
-            # Check to see if it is an existing draft barrier/report otherwise create
-            barrier_report = self.get_or_create_barrier()
-        else:
+        if not barrier_title_form:
             # We don't have a barrier title therefore nothing to save
             # Send user to first step
             self.storage.current_step = self.steps.first
             return redirect(self.get_step_url(self.steps.first))
 
+        # Only save when some step data has changed since the draft was last saved,
+        # e.g. not when just moving back and forward through the steps
+        extra_data = self.storage.data.get("extra_data") or {}
+        saved_step_hashes = extra_data.get("saved_step_hashes", {})
+        step_hashes = {
+            step: get_step_data_hash(step_data)
+            for step, step_data in self.storage.data["step_data"].items()
+        }
+        if step_hashes == saved_step_hashes:
+            return
+
+        # Check to see if it is an existing draft barrier/report otherwise create
+        barrier_id = self.get_or_create_barrier_id()
+
+        # The report's own fields only need sending when the about step changed
+        barrier_fields = {}
+        if step_hashes.get("barrier-about") != saved_step_hashes.get("barrier-about"):
+            barrier_fields = barrier_title_form
+
         # Patch the session data to the barrier/report in the DB
+        self.storage.data["extra_data"] = {
+            **extra_data,
+            "saved_step_hashes": step_hashes,
+        }
         self.client.reports.patch(
-            id=barrier_report.id,
-            **barrier_title_form,
+            id=barrier_id,
+            **barrier_fields,
             new_report_session_data=json.dumps(self.storage.data),
         )
 
@@ -600,11 +626,12 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
             if "barrier-public-information-gate" in submitted_values.keys():
                 submitted_values.pop("barrier-public-information-gate")
 
+            # Patch the barrier with the data from all the steps in one call
+            report_values = {}
             for form_submission in submitted_values:
                 if form_submission not in public_barrier_form_pages:
-                    self.client.reports.patch(
-                        id=barrier_report.id, **submitted_values[form_submission]
-                    )
+                    report_values.update(submitted_values[form_submission])
+            self.client.reports.patch(id=barrier_report.id, **report_values)
 
             # When report/barrier patched fully, call submit
             self.client.reports.submit(barrier_report.id)
@@ -615,13 +642,17 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
                 "barrier-public-title" in submitted_values.keys()
                 and "barrier-public-summary" in submitted_values.keys()
             ):
-                self.client.public_barriers.report_public_barrier_title(
-                    id=barrier_report.id,
-                    values=submitted_values["barrier-public-title"],
-                )
-                self.client.public_barriers.report_public_barrier_summary(
-                    id=barrier_report.id,
-                    values=submitted_values["barrier-public-summary"],
+                self.client.gather(
+                    partial(
+                        self.client.public_barriers.report_public_barrier_title,
+                        id=barrier_report.id,
+                        values=submitted_values["barrier-public-title"],
+                    ),
+                    partial(
+                        self.client.public_barriers.report_public_barrier_summary,
+                        id=barrier_report.id,
+                        values=submitted_values["barrier-public-summary"],
+                    ),
                 )
 
         else:
@@ -650,3 +681,11 @@ class ReportBarrierWizardView(MetadataMixin, NamedUrlSessionWizardView, FormPrev
             self.storage.data["meta"] = {"barrier_id": str(barrier.id)}
 
         return barrier
+
+    def get_or_create_barrier_id(self):
+        """
+        Like get_or_create_barrier, but without fetching an existing barrier
+        """
+        if barrier_id := self.storage.data.get("meta", {}).get("barrier_id", None):
+            return barrier_id
+        return self.get_or_create_barrier().id
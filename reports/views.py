@@ -2,7 +2,7 @@ from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.views.generic import TemplateView
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 
 
 class NewReport(TemplateView):
@@ -33,7 +33,7 @@ class DraftBarriers(TemplateView):
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         reports = client.reports.list(ordering="-created_on")
         context_data["reports"] = reports
         return context_data
@@ -48,7 +48,7 @@ class DeleteReport(TemplateView):
         return ["reports/delete_report.html"]
 
     def get_report(self):
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         return client.reports.get(self.kwargs.get("barrier_id"))
 
     def get_context_data(self, **kwargs):
@@ -58,7 +58,7 @@ class DeleteReport(TemplateView):
         context_data = super().get_context_data(**kwargs)
         context_data["page"] = "draft-barriers"
 
-        client = MarketAccessAPIClient(self.request.session["sso_token"])
+        client = get_api_client(self.request)
         reports = client.reports.list(ordering="-created_on")
 
         context_data["reports"] = reports
@@ -72,7 +72,7 @@ class DeleteReport(TemplateView):
         report = self.get_report()
 
         if report.created_by["id"] == request.session["user_data"]["id"]:
-            client = MarketAccessAPIClient(request.session.get("sso_token"))
+            client = get_api_client(request)
             client.reports.delete(self.kwargs.get("barrier_id"))
 
         return HttpResponseRedirect(reverse("reports:draft_barriers"))
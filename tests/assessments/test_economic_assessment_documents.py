@@ -26,6 +26,7 @@ class EconomicAssessmentDocumentsTestCase(MarketAccessTestCase):
             "id": document_id,
             "signed_upload_url": "someurl",
         }
+        mock_check_scan_status.return_value = "pending"
 
         with open("tests/files/attachment.jpeg", "rb") as document:
             response = self.client.post(
@@ -42,6 +43,10 @@ class EconomicAssessmentDocumentsTestCase(MarketAccessTestCase):
         assert response_data["documentId"] == document_id
         assert "delete_url" in response_data
         assert response_data["file"]["name"] == "attachment.jpeg"
+        assert response_data["scanStatus"] == "pending"
+        assert response_data["scanStatusUrl"] == reverse(
+            "barriers:document_scan_status", kwargs={"document_id": document_id}
+        )
 
         session_key = f"barrier:{self.barrier['id']}:economic_assessments:new:documents"
         assert self.client.session[session_key][0]["id"] == document_id
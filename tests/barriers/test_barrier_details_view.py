@@ -2,13 +2,42 @@ from datetime import datetime, timezone
 from http import HTTPStatus
 
 from django.urls import reverse
-from mock import patch
+from mock import Mock, patch
 
 from barriers.models import HistoryItem
 from core.tests import MarketAccessTestCase
+from utils.exceptions import APIHttpException
 
 
 class BarrierViewTestCase(MarketAccessTestCase):
+    def test_barrier_view_fetches_barrier_data_once(self):
+        response = self.client.get(
+            reverse(
+                "barriers:barrier_detail", kwargs={"barrier_id": self.barrier["id"]}
+            )
+        )
+
+        assert HTTPStatus.OK == response.status_code
+        assert self.mock_get_barrier.call_count == 1
+        assert self.mock_get_interactions.call_count == 1
+        assert self.mock_get_activity.call_count == 1
+        assert self.get_barrier_action_plan.call_count == 1
+
+    def test_barrier_view_not_found(self):
+        response = Mock(status_code=HTTPStatus.NOT_FOUND)
+        response.json.return_value = {}
+        self.mock_get_barrier.side_effect = APIHttpException(
+            Mock(response=response), response
+        )
+
+        response = self.client.get(
+            reverse(
+                "barriers:barrier_detail", kwargs={"barrier_id": self.barrier["id"]}
+            )
+        )
+
+        assert HTTPStatus.NOT_FOUND == response.status_code
+
     @patch("utils.api.resources.BarriersResource.get_activity")
     def test_barrier_view_has_highlighted_event_list_items(self, mock_history):
         mock_history.return_value = [HistoryItem(result) for result in self.history]
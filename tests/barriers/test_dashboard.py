@@ -0,0 +1,55 @@
+from asgiref.sync import async_to_sync
+from django.http import HttpResponseRedirect
+from django.test import RequestFactory, TestCase
+from mock import patch
+
+from barriers.views.core import AsyncDashboard
+from utils.models import APIModel, ModelList
+
+
+class AsyncDashboardTestCase(TestCase):
+    def get_response(self, path="/"):
+        request = RequestFactory().get(path)
+        request.session = {"sso_token": "abcd"}
+        return async_to_sync(AsyncDashboard.as_view())(request)
+
+    @patch("utils.api.resources.BarrierDownloadsResource.list")
+    @patch("utils.api.resources.NotificationExclusionResource.get")
+    @patch("utils.api.resources.SavedSearchesResource.list")
+    @patch("utils.api.resources.ReportsResource.list")
+    @patch("utils.api.resources.MentionResource.list")
+    @patch("utils.api.resources.SavedSearchesResource.get")
+    def test_dashboard_context(
+        self,
+        mock_saved_search_get,
+        mock_mentions,
+        mock_reports,
+        mock_saved_searches,
+        mock_notification_exclusion,
+        mock_downloads,
+    ):
+        mock_saved_search_get.side_effect = lambda id: APIModel({"id": id})
+        mock_mentions.return_value = [
+            APIModel({"read_by_recipient": True}),
+            APIModel({"read_by_recipient": False}),
+        ]
+        mock_reports.return_value = ModelList(model=APIModel, data=[], total_count=0)
+        mock_saved_searches.return_value = []
+        mock_notification_exclusion.return_value = APIModel({})
+        mock_downloads.return_value = []
+
+        response = self.get_response()
+
+        assert response.status_code == 200
+        context = response.context_data
+        assert context["my_barriers_saved_search"].id == "my-barriers"
+        assert context["team_barriers_saved_search"].id == "team-barriers"
+        assert context["new_mentions_count"] == 1
+        assert context["are_all_mentions_read"] is False
+        mock_reports.assert_called_once()
+
+    def test_utm_redirect(self):
+        response = self.get_response("/?en=u")
+
+        assert isinstance(response, HttpResponseRedirect)
+        assert "utm_campaign=dashboard" in response.url
@@ -0,0 +1,100 @@
+from http import HTTPStatus
+
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from mock import patch
+
+from core.tests import MarketAccessTestCase
+from utils.exceptions import ScanError
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "document-scan-status-tests",
+        }
+    },
+    FILE_SCAN_MAX_WAIT_TIME=30000,
+    FILE_SCAN_STATUS_CHECK_INTERVAL=500,
+    FILE_SCAN_STATUS_MAX_CHECK_INTERVAL=2000,
+)
+@patch("utils.api.resources.time.time")
+@patch("utils.api.client.DocumentsResource.check_scan_status")
+class DocumentScanStatusTestCase(MarketAccessTestCase):
+    document_id = "38ab3bed-fc19-4770-9c12-9e26667efbc5"
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.url = reverse(
+            "barriers:document_scan_status",
+            kwargs={"document_id": self.document_id},
+        )
+
+    def test_pending_scan(self, mock_check_scan_status, mock_time):
+        mock_time.return_value = 1000
+        mock_check_scan_status.return_value = "pending"
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"status": "pending", "retryAfter": 500}
+        mock_check_scan_status.assert_called_once_with(self.document_id)
+
+    def test_checks_back_off(self, mock_check_scan_status, mock_time):
+        mock_time.return_value = 1000
+        mock_check_scan_status.return_value = "pending"
+
+        retry_afters = []
+        for _ in range(4):
+            retry_after = self.client.get(self.url).json()["retryAfter"]
+            retry_afters.append(retry_after)
+            mock_time.return_value += retry_after / 1000
+
+        assert retry_afters == [500, 1000, 2000, 2000]
+        assert mock_check_scan_status.call_count == 4
+
+    def test_polls_within_interval_are_cached(self, mock_check_scan_status, mock_time):
+        mock_time.return_value = 1000
+        mock_check_scan_status.return_value = "pending"
+        self.client.get(self.url)
+
+        mock_time.return_value = 1000.2
+        response = self.client.get(self.url)
+
+        assert response.json() == {"status": "pending", "retryAfter": 300}
+        assert mock_check_scan_status.call_count == 1
+
+    def test_clean_scan(self, mock_check_scan_status, mock_time):
+        mock_time.return_value = 1000
+        mock_check_scan_status.return_value = "clean"
+        self.client.get(self.url)
+
+        mock_time.return_value = 1010
+        response = self.client.get(self.url)
+
+        assert response.json()["status"] == "clean"
+        assert mock_check_scan_status.call_count == 1
+
+    def test_failed_scan(self, mock_check_scan_status, mock_time):
+        mock_time.return_value = 1000
+        mock_check_scan_status.side_effect = ScanError("Scan failed")
+
+        response = self.client.get(self.url)
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.json() == {"message": "Scan failed"}
+
+    def test_scan_times_out(self, mock_check_scan_status, mock_time):
+        mock_time.return_value = 1000
+        mock_check_scan_status.return_value = "pending"
+        self.client.get(self.url)
+
+        mock_time.return_value = 1031
+        response = self.client.get(self.url)
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+        assert response.json() == {"message": "Virus scan took too long"}
+        assert mock_check_scan_status.call_count == 1
@@ -1,5 +1,8 @@
+import csv
+import io
 from http import HTTPStatus
 
+from django.test import override_settings
 from django.urls import reverse
 from mock import patch
 
@@ -113,3 +116,64 @@ class TestDownloadBarriers(MarketAccessTestCase):
         assert response.status_code == HTTPStatus.FOUND
         assert "&country=9f5f66a0-5d95-e211-a939-e4115bead28a" in response.url
         assert "&country=83756b9a-5d95-e211-a939-e4115bead28a" in response.url
+
+    def get_barrier_pages(self, count):
+        def get(path, params):
+            assert path == "barriers"
+            offset = params["offset"]
+            results = [
+                dict(self.barrier, code=f"B-{i}")
+                for i in range(offset, min(offset + params["limit"], count))
+            ]
+            return {"count": count, "results": results}
+
+        return get
+
+    @override_settings(BARRIER_CSV_STREAMING_MAX_ROWS=250)
+    @patch("utils.api.client.BarrierDownloadsResource.create")
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    def test_small_downloads_are_streamed(self, mock_get, mock_create):
+        mock_get.side_effect = self.get_barrier_pages(250)
+
+        response = self.client.get(
+            reverse("barriers:download"), data={"ordering": "-reported"}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.streaming
+        assert response["Content-Disposition"] == "attachment; filename=barriers.csv"
+        # The first page is fetched before deciding to stream
+        assert mock_get.call_count == 1
+
+        content = b"".join(response.streaming_content).decode()
+        rows = list(csv.reader(io.StringIO(content)))
+
+        assert rows[0][:5] == ["Code", "Title", "Status", "Status date", "Location"]
+        assert len(rows) == 251
+        assert rows[1][:2] == ["B-0", self.barrier["title"]]
+        assert rows[1][-1].endswith(f"/barriers/{self.barrier['id']}/")
+        assert rows[-1][0] == "B-249"
+        assert [
+            call.kwargs["params"]["offset"] for call in mock_get.call_args_list
+        ] == [
+            0,
+            100,
+            200,
+        ]
+        assert mock_get.call_args.kwargs["params"]["ordering"] == "-reported"
+        mock_create.assert_not_called()
+
+    @override_settings(BARRIER_CSV_STREAMING_MAX_ROWS=250)
+    @patch("utils.api.client.BarrierDownloadsResource.create")
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    def test_large_downloads_use_download_job(self, mock_get, mock_create):
+        mock_get.side_effect = self.get_barrier_pages(251)
+        mock_create.return_value = BarrierDownload(
+            {"id": "83756b9a-5d95-e211-a939-e4115bead28a"}
+        )
+
+        response = self.client.get(reverse("barriers:download"))
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert mock_get.call_count == 1
+        mock_create.assert_called_once()
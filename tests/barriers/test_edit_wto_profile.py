@@ -170,6 +170,7 @@ class EditWTOProfileTestCase(MarketAccessTestCase):
         mock_upload_document.return_value = {
             "id": document_id,
             "file": {"name": "attachment.jpeg", "size": "5000"},
+            "scan_status": "clean",
         }
 
         with open("tests/files/attachment.jpeg", "rb") as document:
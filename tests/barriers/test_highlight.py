@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase
+from django.utils.safestring import mark_safe
+
+from barriers.templatetags.highlight import get_highlight_pattern, highlight
+from barriers.templatetags.highlight_mentions import (
+    get_mention_emails,
+    highlight_mentions,
+)
+
+
+class HighlightTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        get_highlight_pattern.cache_clear()
+
+    def test_highlight(self):
+        assert highlight("Acme Trading Ltd", "trading") == (
+            "Acme <span class='highlight'>Trading</span> Ltd"
+        )
+
+    def test_empty_term(self):
+        assert highlight("Acme Trading Ltd", "") == "Acme Trading Ltd"
+
+    def test_term_is_matched_as_text(self):
+        assert highlight("Acme (UK) Ltd", "(uk)") == (
+            "Acme <span class='highlight'>(UK)</span> Ltd"
+        )
+        assert highlight("Acme Ltd", "a+") == "Acme Ltd"
+
+    def test_value_is_escaped(self):
+        assert highlight("<b>Smith & Sons</b>", "smith") == (
+            "&lt;b&gt;<span class='highlight'>Smith</span> &amp; Sons&lt;/b&gt;"
+        )
+
+    def test_entities_are_not_split(self):
+        assert highlight("Smith & Sons", "amp") == "Smith &amp; Sons"
+        assert highlight("Smith & Sons", "& s") == (
+            "Smith <span class='highlight'>&amp; S</span>ons"
+        )
+
+    def test_safe_value_is_not_escaped(self):
+        assert highlight(mark_safe("<b>Acme</b>"), "acme") == (
+            "<b><span class='highlight'>Acme</span></b>"
+        )
+
+    def test_pattern_is_compiled_once_per_term(self):
+        for row in range(100):
+            highlight(f"Company {row}", "company")
+            highlight(f"{row} Street", "company")
+
+        cache_info = get_highlight_pattern.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 199
+
+
+class HighlightMentionsTestCase(SimpleTestCase):
+    def test_highlight_mentions(self):
+        assert highlight_mentions(
+            "Thanks @jane@example.com and @john@example.com", "john@example.com"
+        ) == (
+            "Thanks <span class='mention-highlight'>@jane@example.com</span> and "
+            "<span class='mention-highlight mention-highlight__me'>"
+            "@john@example.com</span>"
+        )
+
+    def test_get_mention_emails(self):
+        assert get_mention_emails("@jane@example.com @john@example.com") == [
+            "jane@example.com",
+            " john@example.com",
+        ]
@@ -1,5 +1,11 @@
+from django.core.cache import cache
+from django.test import override_settings
+from mock import patch
+
 from barriers.models import HistoryItem
+from barriers.templatetags.history import history_fragment_cache, render_history_item
 from core.tests import MarketAccessTestCase
+from utils.diff import clear_diff_memo, diff_budget
 
 
 class BarrierHistoryItemTestCase(MarketAccessTestCase):
@@ -446,3 +452,106 @@ class AssessmentHistoryItemTestCase(MarketAccessTestCase):
         assert item.field_name == "UK export value"
         assert item.old_value is None
         assert item.new_value == 55000
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "history-fragment-tests",
+        }
+    },
+    HISTORY_FRAGMENT_CACHE_TIME=60,
+)
+class HistoryFragmentCacheTestCase(MarketAccessTestCase):
+    item_data = {
+        "date": "2020-03-19T09:52:16.390000Z",
+        "model": "barrier",
+        "field": "summary",
+        "old_value": "Old summary",
+        "new_value": "New summary",
+        "user": {"id": 48, "name": "Test-user"},
+    }
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        history_fragment_cache.clear()
+        self.addCleanup(history_fragment_cache.clear)
+        clear_diff_memo()
+
+    @patch(
+        "barriers.templatetags.history.render_history_item", wraps=render_history_item
+    )
+    def test_item_is_rendered_once(self, mock_render):
+        fragment = history_fragment_cache.render(HistoryItem(self.item_data))
+        assert history_fragment_cache.render(HistoryItem(self.item_data)) == fragment
+
+        # Another worker gets the fragment from the shared cache
+        history_fragment_cache.clear()
+        assert history_fragment_cache.render(HistoryItem(self.item_data)) == fragment
+
+        assert mock_render.call_count == 1
+        assert '<ins class="diff__ins">New</ins>' in fragment
+
+    @patch("barriers.templatetags.history.render_history_item")
+    def test_changed_item_is_rendered(self, mock_render):
+        mock_render.side_effect = lambda item: item.data["new_value"]
+        history_fragment_cache.render(HistoryItem(self.item_data))
+
+        fragment = history_fragment_cache.render(
+            HistoryItem({**self.item_data, "new_value": "Newer summary"})
+        )
+
+        assert fragment == "Newer summary"
+        assert mock_render.call_count == 2
+
+    @patch("barriers.templatetags.history.cached_fragment_version")
+    @patch("barriers.templatetags.history.render_history_item")
+    def test_new_version_is_rendered(self, mock_render, mock_version):
+        mock_render.return_value = "fragment"
+        mock_version.return_value = "v1"
+        history_fragment_cache.render(HistoryItem(self.item_data))
+
+        mock_version.return_value = "v2"
+        history_fragment_cache.render(HistoryItem(self.item_data))
+
+        assert mock_render.call_count == 2
+
+    def test_prefetched_page_makes_no_further_cache_calls(self):
+        items = [
+            HistoryItem({**self.item_data, "new_value": f"Summary {i}"})
+            for i in range(3)
+        ]
+        for item in items:
+            history_fragment_cache.render(item)
+        history_fragment_cache.clear()
+
+        history_fragment_cache.prefetch(items)
+        with patch("barriers.templatetags.history.cache") as mock_cache:
+            for item in items:
+                history_fragment_cache.render(item)
+
+        assert mock_cache.method_calls == []
+
+    @override_settings(HISTORY_FRAGMENT_LOCAL_CACHE_SIZE=2)
+    def test_local_cache_size_is_limited(self):
+        for i in range(3):
+            history_fragment_cache.render(
+                HistoryItem({**self.item_data, "new_value": f"Summary {i}"})
+            )
+
+        assert len(history_fragment_cache.fragments) == 2
+
+    @patch(
+        "barriers.templatetags.history.render_history_item", wraps=render_history_item
+    )
+    def test_item_cut_short_by_diff_budget_is_not_cached(self, mock_render):
+        with diff_budget(0):
+            fragment = history_fragment_cache.render(HistoryItem(self.item_data))
+        assert '<del class="diff__del">Old summary</del>' in fragment
+
+        fragment = history_fragment_cache.render(HistoryItem(self.item_data))
+
+        assert '<ins class="diff__ins">New</ins>' in fragment
+        assert mock_render.call_count == 2
@@ -1,6 +1,8 @@
 from http import HTTPStatus
 
 import mock
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 from mock import patch
 
@@ -27,6 +29,7 @@ class NoteDocumentsTestCase(MarketAccessTestCase):
             "id": document_id,
             "signed_upload_url": "someurl",
         }
+        mock_check_scan_status.return_value = "pending"
 
         with open("tests/files/attachment.jpeg", "rb") as document:
             response = self.client.post(
@@ -43,6 +46,10 @@ class NoteDocumentsTestCase(MarketAccessTestCase):
         assert response_data["documentId"] == document_id
         assert "delete_url" in response_data
         assert response_data["file"]["name"] == "attachment.jpeg"
+        assert response_data["scanStatus"] == "pending"
+        assert response_data["scanStatusUrl"] == reverse(
+            "barriers:document_scan_status", kwargs={"document_id": document_id}
+        )
 
         session_key = f"barrier:{self.barrier['id']}:note:new:documents"
         assert self.client.session[session_key][0]["id"] == document_id
@@ -119,6 +126,25 @@ class NoteDocumentsTestCase(MarketAccessTestCase):
         response_data = response.json()
         assert response_data["message"] == "Upload failed"
 
+    @patch("utils.api.client.DocumentsResource.create")
+    def test_add_note_document_ajax_too_large(self, mock_create_document):
+        document = SimpleUploadedFile(
+            "attachment.txt", b"x" * (settings.FILE_MAX_SIZE + 1)
+        )
+
+        response = self.client.post(
+            reverse(
+                "barriers:add_note_document",
+                kwargs={"barrier_id": self.barrier["id"]},
+            ),
+            data={"document": document},
+            xhr=True,
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert "must be smaller" in response.json()["message"]
+        assert mock_create_document.called is False
+
     def test_cancel_new_note_document_ajax(self):
         session_key = f"barrier:{self.barrier['id']}:note:new:documents"
         self.update_session({session_key: [{"id": "1"}]})
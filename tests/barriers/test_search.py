@@ -381,6 +381,49 @@ class SearchTestCase(MarketAccessTestCase):
         page_labels = [page["label"] for page in pagination["pages"]]
         assert page_labels == [1, "...", 5, 6, 7, 8, "...", 13]
 
+    @patch("utils.pagination.PaginationMixin.update_querystring")
+    @patch("utils.api.resources.APIResource.list")
+    def test_pagination_only_builds_visible_pages(
+        self, mock_list, mock_update_querystring
+    ):
+        mock_update_querystring.return_value = "ordering=-reported"
+        mock_list.return_value = ModelList(
+            model=Barrier,
+            data=[self.barrier] * 10,
+            total_count=50000,
+        )
+
+        response = self.client.get(
+            reverse("barriers:search"),
+            data={"page": "2500", "ordering": "-reported"},
+        )
+
+        pagination = response.context["pagination"]
+        assert pagination["total_pages"] == 5000
+        page_labels = [page["label"] for page in pagination["pages"]]
+        assert page_labels == [1, "...", 2499, 2500, 2501, 2502, "...", 5000]
+        assert pagination["pages"][0]["url"] == "ordering=-reported&page=1"
+        assert pagination["previous"] == "ordering=-reported&page=2499"
+        assert pagination["next"] == "ordering=-reported&page=2501"
+        # The querystring is only encoded once for all the page links
+        mock_update_querystring.assert_called_once_with()
+
+    @patch("utils.api.resources.APIResource.prefetch_list")
+    @patch("utils.api.resources.APIResource.list")
+    def test_next_page_is_prefetched(self, mock_list, mock_prefetch_list):
+        mock_list.return_value = ModelList(
+            model=Barrier,
+            data=[self.barrier] * 10,
+            total_count=30,
+        )
+
+        self.client.get(reverse("barriers:search"), data={"page": "2"})
+        mock_prefetch_list.assert_called_once_with(archived="0", limit=10, offset=20)
+
+        mock_prefetch_list.reset_mock()
+        self.client.get(reverse("barriers:search"), data={"page": "3"})
+        mock_prefetch_list.assert_not_called()
+
     @patch("utils.api.resources.APIResource.list")
     def test_pagination_x_to_y_of_z_full_page(self, mock_list):
         mock_list.return_value = ModelList(
@@ -653,3 +696,64 @@ class SearchTestCase(MarketAccessTestCase):
             archived="0",
             only_main_sector=True,
         )
+
+
+class SearchSidebarTestCase(MarketAccessTestCase):
+    @patch("utils.api.resources.APIResource.list")
+    def test_search_page_links_to_sidebar(self, mock_list):
+        _, etag = get_metadata().get_search_sidebar()
+        version = etag.strip('"')
+
+        response = self.client.get(reverse("barriers:search"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.context["search_sidebar_url"] == (
+            f"{reverse('barriers:search_sidebar')}?v={version}"
+        )
+        assert "admin-areas-data" not in response.content.decode("utf8")
+        assert "no-store" in response["Cache-Control"]
+
+    def test_sidebar_data(self):
+        metadata = get_metadata()
+        admin_areas = {}
+        for area in metadata.get_admin_area_list():
+            admin_areas.setdefault(area["country"]["id"], []).append(
+                {"value": area["id"], "label": area["name"]}
+            )
+
+        response = self.client.get(reverse("barriers:search_sidebar"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response["Content-Type"] == "application/json"
+        assert response.json() == {
+            "trading_blocs": metadata.get_trading_bloc_list(),
+            "admin_areas": admin_areas,
+            "countries_with_admin_areas": (
+                metadata.get_countries_with_admin_areas_list()
+            ),
+            "search_ordering_choices": metadata.get_search_ordering_choices(),
+        }
+
+    def test_sidebar_is_cached_by_browser(self):
+        content, etag = get_metadata().get_search_sidebar()
+
+        response = self.client.get(reverse("barriers:search_sidebar"))
+
+        assert response["ETag"] == etag
+        assert response["Cache-Control"] == (
+            f"private, max-age={settings.SEARCH_SIDEBAR_CACHE_TIME}"
+        )
+
+        response = self.client.get(
+            reverse("barriers:search_sidebar"), HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.content == b""
+        assert response["ETag"] == etag
+        assert "no-store" not in response["Cache-Control"]
+
+    def test_sidebar_is_serialised_once(self):
+        metadata = get_metadata()
+
+        assert metadata.get_search_sidebar() is metadata.get_search_sidebar()
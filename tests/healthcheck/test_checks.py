@@ -0,0 +1,127 @@
+import threading
+import time
+
+from django.test import SimpleTestCase, override_settings
+from mock import patch
+
+from healthcheck.checks import (
+    DEPENDENCY_PROBES,
+    LatencyHistogram,
+    dependencies_check,
+    latency_histograms,
+)
+from healthcheck.constants import HealthStatus
+
+
+def ok_probe(timeout):
+    pass
+
+
+@override_settings(HEALTHCHECK_TIMEOUT=0.5)
+class DependenciesCheckTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        dependencies_check.clear()
+        patcher = patch.dict(
+            DEPENDENCY_PROBES, {name: ok_probe for name in DEPENDENCY_PROBES}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.dict(
+            latency_histograms, {name: LatencyHistogram() for name in DEPENDENCY_PROBES}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_all_ok(self):
+        data = dependencies_check()
+
+        assert data["status"] == HealthStatus.OK
+        assert set(data["checks"]) == {"database", "redis", "api", "sso", "datahub"}
+        assert data["checks"]["database"]["status"] == HealthStatus.OK
+        assert data["checks"]["database"]["error"] is None
+
+    def test_probes_run_concurrently(self):
+        barrier = threading.Barrier(len(DEPENDENCY_PROBES), timeout=0.4)
+
+        def probe(timeout):
+            barrier.wait()
+
+        with patch.dict(DEPENDENCY_PROBES, {name: probe for name in DEPENDENCY_PROBES}):
+            data = dependencies_check()
+
+        assert data["status"] == HealthStatus.OK
+
+    def test_failed_probe(self):
+        def probe(timeout):
+            raise ConnectionError("Connection refused")
+
+        with patch.dict(DEPENDENCY_PROBES, {"sso": probe}):
+            data = dependencies_check()
+
+        assert data["status"] == HealthStatus.FAIL
+        assert data["checks"]["sso"] == {
+            "status": HealthStatus.FAIL,
+            "duration": data["checks"]["sso"]["duration"],
+            "error": "Connection refused",
+        }
+        assert data["checks"]["api"]["status"] == HealthStatus.OK
+
+    def test_slow_probe_times_out(self):
+        recorded = threading.Event()
+
+        def probe(timeout):
+            time.sleep(timeout + 0.1)
+
+        histogram = latency_histograms["datahub"]
+        add = histogram.add
+        histogram.add = lambda duration: (add(duration), recorded.set())
+
+        with patch.dict(DEPENDENCY_PROBES, {"datahub": probe}):
+            start = time.monotonic()
+            data = dependencies_check()
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.6
+        assert data["status"] == HealthStatus.FAIL
+        assert data["checks"]["datahub"]["error"] == "Timed out after 0.5s"
+        assert data["checks"]["datahub"]["duration"] is None
+        # The slow probe's duration is still recorded once it finishes
+        assert recorded.wait(1)
+        assert latency_histograms["datahub"].get_percentiles()["p50"] >= 0.6
+
+    @override_settings(HEALTHCHECK_CACHE_TIME=60)
+    def test_result_is_cached(self):
+        self.addCleanup(dependencies_check.clear)
+        dependencies_check()
+
+        with patch.dict(DEPENDENCY_PROBES, {"redis": None}):
+            data = dependencies_check()
+
+        assert data["status"] == HealthStatus.OK
+
+    def test_view(self):
+        response = self.client.get("/check-dependencies/")
+
+        data = response.json()
+        assert data["status"] == HealthStatus.OK
+        assert set(data["checks"]["redis"]["latency"]) == {"p50", "p90", "p99"}
+
+
+class LatencyHistogramTestCase(SimpleTestCase):
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for duration in range(1, 101):
+            histogram.add(duration / 100)
+
+        assert histogram.get_percentiles() == {"p50": 0.5, "p90": 0.9, "p99": 0.99}
+
+    def test_only_recent_durations_are_kept(self):
+        histogram = LatencyHistogram(size=2)
+        for duration in (9.0, 1.0, 2.0):
+            histogram.add(duration)
+
+        assert histogram.get_percentiles() == {"p50": 1.0, "p90": 2.0, "p99": 2.0}
+
+    def test_empty(self):
+        assert LatencyHistogram().get_percentiles() == {}
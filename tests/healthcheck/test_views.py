@@ -1,7 +1,8 @@
 import xml.etree.ElementTree as ET
 
-from django.test import Client, TestCase
+from django.test import Client, TestCase, override_settings
 
+from healthcheck.checks import db_check
 from healthcheck.models import HealthCheck
 
 
@@ -29,3 +30,15 @@ class TestHealthcheckViews(TestCase):
         self.assertLess(pingdom_response_time, 1)
         self.assertEqual(pingdom_status, "FAIL")
         self.assertEqual(response.status_code, 200)
+
+    @override_settings(HEALTHCHECK_CACHE_TIME=60)
+    def test_check_result_is_cached(self):
+        db_check.clear()
+        self.addCleanup(db_check.clear)
+        self.anonymous_client.get("/check-fe/")
+        HealthCheck.objects.all().delete()
+
+        response = self.anonymous_client.get("/check-fe/")
+
+        tree = ET.fromstring(response.content)
+        self.assertEqual(tree[0].text, "OK")
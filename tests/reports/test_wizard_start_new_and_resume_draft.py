@@ -1,10 +1,14 @@
+import json
 import logging
+from collections import namedtuple
 from http import HTTPStatus
 
 from django.urls import reverse
 from mock import patch
 
 from core.tests import MarketAccessTestCase
+from reports.report_barrier_view import ReportBarrierWizardView
+from utils.api.client import MarketAccessAPIClient
 
 logger = logging.getLogger(__name__)
 
@@ -91,3 +95,71 @@ class DraftReportTestCase(MarketAccessTestCase):
         assert "reports/barrier_status_wizard_step.html" in response.template_name
         assert "form" in response.context
         assert response.context["form"].initial == {}
+
+
+class SaveReportProgressTestCase(MarketAccessTestCase):
+    # Test suite for saving the draft when moving between steps
+    # make django-test path=reports/test_wizard_start_new_and_resume_draft.py::SaveReportProgressTestCase
+
+    def setUp(self):
+        super().setUp()
+        self.about_cleaned_data = {"title": "Barrier title", "summary": "Summary"}
+        session_mock = namedtuple("session_mock", "prefix data")
+        self.view = ReportBarrierWizardView()
+        self.view.storage = session_mock(
+            prefix="wizard_report_barrier_wizard_view",
+            data={
+                "step": "barrier-status",
+                "step_data": {
+                    "barrier-about": {"barrier-about-title": ["Barrier title"]},
+                    "barrier-status": {"barrier-status-status": ["2"]},
+                },
+                "extra_data": {},
+                "meta": {"barrier_id": "b9bc718d-f535-413a-a2c0-8868351b44f2"},
+            },
+        )
+        self.view.client = MarketAccessAPIClient()
+        patcher = patch(
+            "reports.report_barrier_view.ReportBarrierWizardView"
+            ".get_cleaned_data_for_step",
+            return_value=self.about_cleaned_data,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("utils.api.resources.ReportsResource.get")
+    @patch("utils.api.resources.ReportsResource.patch")
+    def test_draft_is_saved_without_fetching_it(self, mock_patch, mock_get):
+        self.view.save_report_progress()
+
+        mock_get.assert_not_called()
+        mock_patch.assert_called_once()
+        kwargs = mock_patch.call_args.kwargs
+        assert kwargs["id"] == "b9bc718d-f535-413a-a2c0-8868351b44f2"
+        assert kwargs["title"] == "Barrier title"
+        saved_data = json.loads(kwargs["new_report_session_data"])
+        assert saved_data["step_data"] == self.view.storage.data["step_data"]
+
+    @patch("utils.api.resources.ReportsResource.patch")
+    def test_unchanged_draft_is_not_saved(self, mock_patch):
+        self.view.save_report_progress()
+        self.view.storage.data["step"] = "barrier-about"
+        self.view.save_report_progress()
+
+        mock_patch.assert_called_once()
+
+    @patch("utils.api.resources.ReportsResource.patch")
+    def test_only_changed_report_fields_are_sent(self, mock_patch):
+        self.view.save_report_progress()
+        self.view.storage.data["step_data"]["barrier-status"] = {
+            "barrier-status-status": ["3"]
+        }
+        self.view.save_report_progress()
+
+        assert mock_patch.call_count == 2
+        kwargs = mock_patch.call_args.kwargs
+        assert "title" not in kwargs
+        saved_data = json.loads(kwargs["new_report_session_data"])
+        assert saved_data["step_data"]["barrier-status"] == {
+            "barrier-status-status": ["3"]
+        }
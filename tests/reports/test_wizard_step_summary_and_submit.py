@@ -572,8 +572,8 @@ class SubmitReportTestCase(MarketAccessTestCase):
         assert result.status_code == 302
         assert result.url == f"/barriers/{self.draft_barrier['id']}/complete/"
 
-        # Assert the report patch mock was called for each form page
-        assert report_update_patch.call_count == 8
+        # Assert the report patch mock was called once with every form page
+        assert report_update_patch.call_count == 1
 
         # Assert the correct fields from cleaned_data have been included in a patch call
         patch_call_list = report_update_patch.call_args_list
@@ -581,48 +581,48 @@ class SubmitReportTestCase(MarketAccessTestCase):
         assert "'title': 'Fake barrier name'" in str(patch_call_list[0])
         assert "'summary': 'Fake barrier summary'" in str(patch_call_list[0])
         # Status fields
-        assert "'status': '2'" in str(patch_call_list[1])
-        assert "'start_date': None" in str(patch_call_list[1])
-        assert "'currently_active': 'YES'" in str(patch_call_list[1])
-        assert "'status_date': '2023-07-24'" in str(patch_call_list[1])
-        assert "'status_summary': ''" in str(patch_call_list[1])
-        assert "'start_date_known': False" in str(patch_call_list[1])
-        assert "'is_currently_active': 'YES'" in str(patch_call_list[1])
+        assert "'status': '2'" in str(patch_call_list[0])
+        assert "'start_date': None" in str(patch_call_list[0])
+        assert "'currently_active': 'YES'" in str(patch_call_list[0])
+        assert "'status_date': '2023-07-24'" in str(patch_call_list[0])
+        assert "'status_summary': ''" in str(patch_call_list[0])
+        assert "'start_date_known': False" in str(patch_call_list[0])
+        assert "'is_currently_active': 'YES'" in str(patch_call_list[0])
         # Location fields
-        assert "'affect_whole_country': True" in str(patch_call_list[2])
-        assert "'admin_areas': []" in str(patch_call_list[2])
+        assert "'affect_whole_country': True" in str(patch_call_list[0])
+        assert "'admin_areas': []" in str(patch_call_list[0])
         assert "'country': '985f66a0-5d95-e211-a939-e4115bead28a'" in str(
-            patch_call_list[2]
+            patch_call_list[0]
         )
-        assert "'trading_bloc': ''" in str(patch_call_list[2])
-        assert "'caused_by_trading_bloc': False" in str(patch_call_list[2])
-        assert "'caused_by_admin_areas': False" in str(patch_call_list[2])
+        assert "'trading_bloc': ''" in str(patch_call_list[0])
+        assert "'caused_by_trading_bloc': False" in str(patch_call_list[0])
+        assert "'caused_by_admin_areas': False" in str(patch_call_list[0])
         # Trade direction fields
-        assert "'trade_direction': '1'" in str(patch_call_list[3])
+        assert "'trade_direction': '1'" in str(patch_call_list[0])
         # Sector fields
         assert "'main_sector': '9638cecc-5f95-e211-a939-e4115bead28a'" in str(
-            patch_call_list[4]
+            patch_call_list[0]
         )
-        assert "'sectors': []" in str(patch_call_list[4])
-        assert "'sectors_affected': True" in str(patch_call_list[4])
+        assert "'sectors': []" in str(patch_call_list[0])
+        assert "'sectors_affected': True" in str(patch_call_list[0])
         # Companies fields
         assert "'companies': [{'id': '10590916', 'name': 'BLAH LTD'}]" in str(
-            patch_call_list[5]
+            patch_call_list[0]
         )
-        assert "'related_organisations': []" in str(patch_call_list[5])
+        assert "'related_organisations': []" in str(patch_call_list[0])
         # Export types fields
-        patch_call_list[6]
-        assert "'export_types': ['goods', 'services']" in str(patch_call_list[6])
+        patch_call_list[0]
+        assert "'export_types': ['goods', 'services']" in str(patch_call_list[0])
         assert "'export_description': 'A description of the export.'" in str(
-            patch_call_list[6]
+            patch_call_list[0]
         )
         assert (
             "'commodities': [{'code': '1001000000', "
             "'country': '80756b9a-5d95-e211-a939-e4115bead28a', 'trading_bloc': ''}]"
-        ) in str(patch_call_list[6])
+        ) in str(patch_call_list[0])
         assert (
             "'public_eligibility': True, " "'public_eligibility_summary': ''"
-        ) in str(patch_call_list[7])
+        ) in str(patch_call_list[0])
 
         # Assert the report submit mock was called a single time
         report_submit_patch.assert_called_once()
@@ -675,8 +675,8 @@ class SubmitReportTestCase(MarketAccessTestCase):
         assert result.status_code == 302
         assert result.url == f"/barriers/{self.draft_barrier['id']}/complete/"
 
-        # Assert the report patch mock was called for each form page
-        assert report_update_patch.call_count == 8
+        # Assert the report patch mock was called once with every form page
+        assert report_update_patch.call_count == 1
 
         # Assert the correct fields from cleaned_data have been included in a patch call
         patch_call_list = report_update_patch.call_args_list
@@ -684,49 +684,49 @@ class SubmitReportTestCase(MarketAccessTestCase):
         assert "'title': 'Fake barrier name'" in str(patch_call_list[0])
         assert "'summary': 'Fake barrier summary'" in str(patch_call_list[0])
         # Status fields
-        assert "'status': '2'" in str(patch_call_list[1])
-        assert "'start_date': None" in str(patch_call_list[1])
-        assert "'currently_active': 'YES'" in str(patch_call_list[1])
-        assert "'status_date': '2023-07-24'" in str(patch_call_list[1])
-        assert "'status_summary': ''" in str(patch_call_list[1])
-        assert "'start_date_known': False" in str(patch_call_list[1])
-        assert "'is_currently_active': 'YES'" in str(patch_call_list[1])
+        assert "'status': '2'" in str(patch_call_list[0])
+        assert "'start_date': None" in str(patch_call_list[0])
+        assert "'currently_active': 'YES'" in str(patch_call_list[0])
+        assert "'status_date': '2023-07-24'" in str(patch_call_list[0])
+        assert "'status_summary': ''" in str(patch_call_list[0])
+        assert "'start_date_known': False" in str(patch_call_list[0])
+        assert "'is_currently_active': 'YES'" in str(patch_call_list[0])
         # Location fields
-        assert "'affect_whole_country': True" in str(patch_call_list[2])
-        assert "'admin_areas': []" in str(patch_call_list[2])
+        assert "'affect_whole_country': True" in str(patch_call_list[0])
+        assert "'admin_areas': []" in str(patch_call_list[0])
         assert "'country': '985f66a0-5d95-e211-a939-e4115bead28a'" in str(
-            patch_call_list[2]
+            patch_call_list[0]
         )
-        assert "'trading_bloc': ''" in str(patch_call_list[2])
-        assert "'caused_by_trading_bloc': False" in str(patch_call_list[2])
-        assert "'caused_by_admin_areas': False" in str(patch_call_list[2])
+        assert "'trading_bloc': ''" in str(patch_call_list[0])
+        assert "'caused_by_trading_bloc': False" in str(patch_call_list[0])
+        assert "'caused_by_admin_areas': False" in str(patch_call_list[0])
         # Trade direction fields
-        assert "'trade_direction': '1'" in str(patch_call_list[3])
+        assert "'trade_direction': '1'" in str(patch_call_list[0])
         # Sector fields
         assert "'main_sector': '9638cecc-5f95-e211-a939-e4115bead28a'" in str(
-            patch_call_list[4]
+            patch_call_list[0]
         )
-        assert "'sectors': []" in str(patch_call_list[4])
-        assert "'sectors_affected': True" in str(patch_call_list[4])
+        assert "'sectors': []" in str(patch_call_list[0])
+        assert "'sectors_affected': True" in str(patch_call_list[0])
         # Companies fields
         assert "'companies': [{'id': '10590916', 'name': 'BLAH LTD'}]" in str(
-            patch_call_list[5]
+            patch_call_list[0]
         )
-        assert "'related_organisations': []" in str(patch_call_list[5])
+        assert "'related_organisations': []" in str(patch_call_list[0])
         # Export types fields
-        patch_call_list[6]
-        assert "'export_types': ['goods', 'services']" in str(patch_call_list[6])
+        patch_call_list[0]
+        assert "'export_types': ['goods', 'services']" in str(patch_call_list[0])
         assert "'export_description': 'A description of the export.'" in str(
-            patch_call_list[6]
+            patch_call_list[0]
         )
         assert (
             "'commodities': [{'code': '1001000000', "
             "'country': '80756b9a-5d95-e211-a939-e4115bead28a', 'trading_bloc': ''}]"
-        ) in str(patch_call_list[6])
+        ) in str(patch_call_list[0])
         assert (
             "'public_eligibility': False, "
             "'public_eligibility_summary': 'This barrier is not public'"
-        ) in str(patch_call_list[7])
+        ) in str(patch_call_list[0])
 
         # Assert the report submit mock was called a single time
         report_submit_patch.assert_called_once()
@@ -770,8 +770,8 @@ class SubmitReportTestCase(MarketAccessTestCase):
         assert result.status_code == 302
         assert result.url == f"/barriers/{self.draft_barrier['id']}/complete/"
 
-        # Assert the report patch mock was called for each form page
-        assert report_update_patch.call_count == 8
+        # Assert the report patch mock was called once with every form page
+        assert report_update_patch.call_count == 1
 
         # Assert the correct fields from cleaned_data have been included in a patch call
         patch_call_list = report_update_patch.call_args_list
@@ -779,48 +779,48 @@ class SubmitReportTestCase(MarketAccessTestCase):
         assert "'title': 'Fake barrier name'" in str(patch_call_list[0])
         assert "'summary': 'Fake barrier summary'" in str(patch_call_list[0])
         # Status fields
-        assert "'status': '2'" in str(patch_call_list[1])
-        assert "'start_date': None" in str(patch_call_list[1])
-        assert "'currently_active': 'YES'" in str(patch_call_list[1])
-        assert "'status_date': '2023-07-24'" in str(patch_call_list[1])
-        assert "'status_summary': ''" in str(patch_call_list[1])
-        assert "'start_date_known': False" in str(patch_call_list[1])
-        assert "'is_currently_active': 'YES'" in str(patch_call_list[1])
+        assert "'status': '2'" in str(patch_call_list[0])
+        assert "'start_date': None" in str(patch_call_list[0])
+        assert "'currently_active': 'YES'" in str(patch_call_list[0])
+        assert "'status_date': '2023-07-24'" in str(patch_call_list[0])
+        assert "'status_summary': ''" in str(patch_call_list[0])
+        assert "'start_date_known': False" in str(patch_call_list[0])
+        assert "'is_currently_active': 'YES'" in str(patch_call_list[0])
         # Location fields
-        assert "'affect_whole_country': True" in str(patch_call_list[2])
-        assert "'admin_areas': []" in str(patch_call_list[2])
+        assert "'affect_whole_country': True" in str(patch_call_list[0])
+        assert "'admin_areas': []" in str(patch_call_list[0])
         assert "'country': '985f66a0-5d95-e211-a939-e4115bead28a'" in str(
-            patch_call_list[2]
+            patch_call_list[0]
         )
-        assert "'trading_bloc': ''" in str(patch_call_list[2])
-        assert "'caused_by_trading_bloc': False" in str(patch_call_list[2])
-        assert "'caused_by_admin_areas': False" in str(patch_call_list[2])
+        assert "'trading_bloc': ''" in str(patch_call_list[0])
+        assert "'caused_by_trading_bloc': False" in str(patch_call_list[0])
+        assert "'caused_by_admin_areas': False" in str(patch_call_list[0])
         # Trade direction fields
-        assert "'trade_direction': '1'" in str(patch_call_list[3])
+        assert "'trade_direction': '1'" in str(patch_call_list[0])
         # Sector fields
         assert "'main_sector': '9638cecc-5f95-e211-a939-e4115bead28a'" in str(
-            patch_call_list[4]
+            patch_call_list[0]
         )
-        assert "'sectors': []" in str(patch_call_list[4])
-        assert "'sectors_affected': True" in str(patch_call_list[4])
+        assert "'sectors': []" in str(patch_call_list[0])
+        assert "'sectors_affected': True" in str(patch_call_list[0])
         # Companies fields
         assert "'companies': [{'id': '10590916', 'name': 'BLAH LTD'}]" in str(
-            patch_call_list[5]
+            patch_call_list[0]
         )
-        assert "'related_organisations': []" in str(patch_call_list[5])
+        assert "'related_organisations': []" in str(patch_call_list[0])
         # Export types fields
-        patch_call_list[6]
-        assert "'export_types': ['goods', 'services']" in str(patch_call_list[6])
+        patch_call_list[0]
+        assert "'export_types': ['goods', 'services']" in str(patch_call_list[0])
         assert "'export_description': 'A description of the export.'" in str(
-            patch_call_list[6]
+            patch_call_list[0]
         )
         assert (
             "'commodities': [{'code': '1001000000', "
             "'country': '80756b9a-5d95-e211-a939-e4115bead28a', 'trading_bloc': ''}]"
-        ) in str(patch_call_list[6])
+        ) in str(patch_call_list[0])
         assert (
             "'public_eligibility': True, " "'public_eligibility_summary': ''"
-        ) in str(patch_call_list[7])
+        ) in str(patch_call_list[0])
 
         # Assert the report submit mock was called a single time
         report_submit_patch.assert_called_once()
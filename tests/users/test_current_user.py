@@ -0,0 +1,49 @@
+from http import HTTPStatus
+from unittest.mock import patch
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.urls import reverse
+
+from core.tests import MarketAccessTestCase
+
+
+@patch("utils.api.resources.APIResource.list")
+class CurrentUserTestCase(MarketAccessTestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = LocMemCache("current-user-tests", {})
+        self.addCleanup(self.cache.clear)
+        cache_patcher = patch("users.helpers.cache", self.cache)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_user_is_resolved_once_per_request(self, mock_list):
+        response = self.client.get(reverse("users:manage_users"))
+
+        assert response.status_code == HTTPStatus.OK
+        # Shared by the permission check and the context processor
+        assert response.context["current_user"].data == self.current_user.data
+        self.get_current_user.assert_called_once_with()
+
+    def test_cached_user_data_is_used(self, mock_list):
+        self.cache.set("user_data:49", self.administrator.data)
+
+        response = self.client.get(reverse("users:manage_users"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.context["current_user"].data == self.administrator.data
+        self.get_current_user.assert_not_called()
+
+    def test_cached_permissions_are_checked(self, mock_list):
+        self.cache.set("user_data:49", self.general_user.data)
+
+        response = self.client.get(reverse("users:manage_users"))
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+        self.get_current_user.assert_not_called()
+
+    def test_user_is_not_resolved_unless_used(self, mock_list):
+        response = self.client.get(reverse("healthcheck:check-fe"))
+
+        assert response.status_code == HTTPStatus.OK
+        self.get_current_user.assert_not_called()
@@ -0,0 +1,150 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from mock import patch
+
+from utils.api.client import MarketAccessAPIClient
+from utils.api.resources import api_cache_stats
+
+API_CACHE_TIMES = {
+    "barrier-search": 30,
+    "current-user": 30,
+    "groups": 60,
+    "saved-searches": 60,
+    "top-priority-summary": 60,
+}
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "api-cache-tests",
+        }
+    },
+    API_CACHE_TIMES=API_CACHE_TIMES,
+    API_CACHE_STALE_TIME=300,
+)
+@patch("utils.api.client.get_session")
+class APICachePolicyTestCase(TestCase):
+    """
+    Test sharing slow-changing API responses between requests
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        api_cache_stats.clear()
+
+    def set_response(self, mock_get_session, data):
+        response = mock_get_session.return_value.request.return_value
+        response.json.side_effect = lambda: data
+
+    def test_responses_are_shared_between_clients(self, mock_get_session):
+        self.set_response(mock_get_session, {"results": [{"id": 1}], "count": 1})
+
+        first = MarketAccessAPIClient("abcd").groups.list()
+        second = MarketAccessAPIClient("efgh").groups.list()
+
+        assert first.data == second.data == [{"id": 1}]
+        assert mock_get_session.return_value.request.call_count == 1
+        assert api_cache_stats["groups:miss"] == 1
+        assert api_cache_stats["groups:hit"] == 1
+
+    def test_per_user_responses_are_not_shared(self, mock_get_session):
+        self.set_response(mock_get_session, {"id": 1})
+
+        MarketAccessAPIClient("abcd").users.get_current()
+        MarketAccessAPIClient("abcd").users.get_current()
+        MarketAccessAPIClient("efgh").users.get_current()
+
+        assert mock_get_session.return_value.request.call_count == 2
+
+    def test_writes_invalidate_cached_responses(self, mock_get_session):
+        self.set_response(mock_get_session, {"results": [], "count": 0})
+        client = MarketAccessAPIClient("abcd")
+
+        client.saved_searches.list()
+        client.saved_searches.patch(id=1, name="New name")
+        client.saved_searches.list()
+        MarketAccessAPIClient("efgh").saved_searches.list()
+
+        methods = [
+            call.args[0]
+            for call in mock_get_session.return_value.request.call_args_list
+        ]
+        assert methods == ["get", "patch", "get", "get"]
+
+    def test_top_priority_summary_is_invalidated_by_writes(self, mock_get_session):
+        self.set_response(mock_get_session, {"top_priority_summary_text": "Text"})
+        client = MarketAccessAPIClient("abcd")
+
+        client.barriers.get_top_priority_summary(barrier="1")
+        client.barriers.get_top_priority_summary(barrier="1")
+        client.barriers.patch_top_priority_summary(barrier="1")
+        client.barriers.get_top_priority_summary(barrier="1")
+
+        assert mock_get_session.return_value.request.call_count == 3
+
+    @patch("utils.api.resources.threading.Thread")
+    @patch("utils.api.resources.time.time")
+    def test_stale_responses_are_refreshed_in_background(
+        self, mock_time, mock_thread, mock_get_session
+    ):
+        mock_time.return_value = 1000
+        self.set_response(mock_get_session, {"results": [{"id": 1}], "count": 1})
+        MarketAccessAPIClient("abcd").groups.list()
+
+        mock_time.return_value = 1061
+        self.set_response(mock_get_session, {"results": [{"id": 2}], "count": 1})
+        stale = MarketAccessAPIClient("abcd").groups.list()
+        MarketAccessAPIClient("abcd").groups.list()
+
+        assert stale.data == [{"id": 1}]
+        assert api_cache_stats["groups:stale"] == 2
+        assert mock_thread.call_count == 1
+        assert mock_get_session.return_value.request.call_count == 1
+
+        mock_thread.call_args.kwargs["target"]()
+        fresh = MarketAccessAPIClient("abcd").groups.list()
+
+        assert fresh.data == [{"id": 2}]
+        assert api_cache_stats["groups:hit"] == 1
+
+    @patch("utils.api.resources.threading.Thread")
+    def test_prefetched_lists_are_served_from_cache(
+        self, mock_thread, mock_get_session
+    ):
+        self.set_response(mock_get_session, {"results": [{"id": 1}], "count": 1})
+        client = MarketAccessAPIClient("abcd")
+
+        client.barriers.prefetch_list(limit=10, offset=10, status="2")
+        client.barriers.prefetch_list(limit=10, offset=10, status="2")
+        assert mock_thread.call_count == 1
+        mock_thread.call_args.kwargs["target"]()
+
+        barriers = client.barriers.list(status="2", offset=10, limit=10)
+
+        assert barriers.data == [{"id": 1}]
+        assert mock_get_session.return_value.request.call_count == 1
+        assert api_cache_stats["barrier-search:hit"] == 1
+
+    @patch("utils.api.resources.time.time")
+    def test_expired_searches_are_not_served_stale(self, mock_time, mock_get_session):
+        mock_time.return_value = 1000
+        self.set_response(mock_get_session, {"results": [], "count": 0})
+        MarketAccessAPIClient("abcd").barriers.list(limit=10, offset=0)
+
+        mock_time.return_value = 1031
+        MarketAccessAPIClient("abcd").barriers.list(limit=10, offset=0)
+
+        assert mock_get_session.return_value.request.call_count == 2
+        assert api_cache_stats["barrier-search:miss"] == 2
+
+    @override_settings(API_CACHE_TIMES={})
+    def test_caching_can_be_turned_off(self, mock_get_session):
+        self.set_response(mock_get_session, {"results": [], "count": 0})
+
+        MarketAccessAPIClient("abcd").groups.list()
+        MarketAccessAPIClient("abcd").groups.list()
+
+        assert mock_get_session.return_value.request.call_count == 2
@@ -0,0 +1,294 @@
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory, TestCase, override_settings
+from mock import Mock, patch
+
+import utils.api.client
+from utils.api.async_client import AsyncMarketAccessAPIClient
+from utils.api.client import (
+    MarketAccessAPIClient,
+    create_session,
+    get_api_client,
+    get_session,
+)
+from utils.middleware import APIClientMiddleware
+from utils.exceptions import APIHttpException
+
+
+class CookieSettingHandler(BaseHTTPRequestHandler):
+    received_cookies = []
+
+    def do_GET(self):
+        self.received_cookies.append(self.headers.get("Cookie"))
+        body = b'{"id": 1}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "sessionid=abc123; Path=/")
+        self.send_header("Set-Cookie", "csrftoken=xyz789; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MarketAccessAPIClientSessionTestCase(TestCase):
+    """
+    Test the pooled session used by MarketAccessAPIClient
+    """
+
+    def setUp(self):
+        super().setUp()
+        utils.api.client._session = None
+        self.addCleanup(setattr, utils.api.client, "_session", None)
+
+    def test_session_is_shared(self):
+        assert get_session() is get_session()
+
+    @override_settings(
+        MARKET_ACCESS_API_POOL_SIZE=25,
+        MARKET_ACCESS_API_MAX_RETRIES=4,
+        MARKET_ACCESS_API_RETRY_BACKOFF=0.5,
+    )
+    def test_create_session_configures_pool_and_retries(self):
+        session = create_session()
+        adapter = session.get_adapter("https://market-access.test/")
+
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 25
+        assert adapter.max_retries.total == 4
+        assert adapter.max_retries.read == 0
+        assert adapter.max_retries.backoff_factor == 0.5
+        assert "GET" in adapter.max_retries.allowed_methods
+        assert "POST" not in adapter.max_retries.allowed_methods
+
+    def test_cookies_are_not_shared_between_calls(self):
+        CookieSettingHandler.received_cookies = []
+        server = HTTPServer(("127.0.0.1", 0), CookieSettingHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        api_uri = f"http://127.0.0.1:{server.server_port}/"
+        with override_settings(MARKET_ACCESS_API_URI=api_uri):
+            MarketAccessAPIClient("user-one").get("whoami")
+            MarketAccessAPIClient("user-two").get("whoami")
+
+        assert CookieSettingHandler.received_cookies == [None, None]
+        assert len(get_session().cookies) == 0
+
+    @override_settings(
+        MARKET_ACCESS_API_URI="http://market-access.test/",
+        MARKET_ACCESS_API_CONNECT_TIMEOUT=1,
+        MARKET_ACCESS_API_READ_TIMEOUT=5,
+    )
+    @patch("utils.api.client.get_session")
+    def test_request_uses_session_with_timeouts(self, mock_get_session):
+        mock_get_session.return_value.request.return_value = Mock(ok=True)
+        client = MarketAccessAPIClient("abcd")
+
+        client.request("get", "barriers", params={"limit": 1})
+
+        mock_get_session.return_value.request.assert_called_once_with(
+            "get",
+            "http://market-access.test/barriers",
+            headers={
+                "Authorization": "Bearer abcd",
+                "X-User-Agent": "",
+                "X-Forwarded-For": "",
+            },
+            params={"limit": 1},
+            timeout=(1, 5),
+        )
+
+    @patch("utils.api.client.get_session")
+    def test_request_raises_api_http_exception(self, mock_get_session):
+        response = requests.Response()
+        response.status_code = 404
+        mock_get_session.return_value.request.return_value = response
+        client = MarketAccessAPIClient("abcd")
+
+        with self.assertRaises(APIHttpException) as context:
+            client.request("get", "barriers/1")
+
+        assert context.exception.status_code == 404
+
+
+class MarketAccessAPIClientGatherTestCase(TestCase):
+    """
+    Test running API calls concurrently with MarketAccessAPIClient.gather
+    """
+
+    def test_results_are_returned_in_order(self):
+        client = MarketAccessAPIClient("abcd")
+        results = client.gather(*(partial(lambda i: i * 2, i) for i in range(5)))
+        assert results == [0, 2, 4, 6, 8]
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        client = MarketAccessAPIClient("abcd")
+
+        # Each call waits for the other two, which would time out if run in turn
+        results = client.gather(barrier.wait, barrier.wait, barrier.wait)
+
+        assert sorted(results) == [0, 1, 2]
+
+    @override_settings(MARKET_ACCESS_API_MAX_CONCURRENCY=1)
+    def test_calls_run_in_turn_without_concurrency(self):
+        thread_ids = []
+        client = MarketAccessAPIClient("abcd")
+
+        client.gather(
+            lambda: thread_ids.append(threading.get_ident()),
+            lambda: thread_ids.append(threading.get_ident()),
+        )
+
+        assert thread_ids == [threading.get_ident()] * 2
+
+    def test_first_exception_is_raised(self):
+        not_found = requests.Response()
+        not_found.status_code = 404
+        server_error = requests.Response()
+        server_error.status_code = 500
+        finished = []
+
+        def fail(response):
+            raise APIHttpException(requests.HTTPError(response=response), response)
+
+        client = MarketAccessAPIClient("abcd")
+        with self.assertRaises(APIHttpException) as context:
+            client.gather(
+                lambda: finished.append(1),
+                partial(fail, not_found),
+                partial(fail, server_error),
+                lambda: finished.append(2),
+            )
+
+        assert context.exception.status_code == 404
+        assert sorted(finished) == [1, 2]
+
+
+@patch("utils.api.client.get_session")
+class MarketAccessAPIClientMemoTestCase(TestCase):
+    """
+    Test sharing GET responses between the clients used for one request
+    """
+
+    def get_request(self):
+        request = RequestFactory().get("/")
+        request.session = {"sso_token": "abcd"}
+        APIClientMiddleware(lambda request: None)(request)
+        return request
+
+    def test_repeated_gets_are_memoized(self, mock_get_session):
+        response = mock_get_session.return_value.request.return_value
+        response.json.side_effect = lambda: {"id": 1}
+        request = self.get_request()
+
+        first = get_api_client(request).users.get_current()
+        second = get_api_client(request).users.get_current()
+
+        assert first.id == second.id == 1
+        assert first.data is not second.data
+        assert mock_get_session.return_value.request.call_count == 1
+
+    def test_different_params_are_not_shared(self, mock_get_session):
+        mock_get_session.return_value.request.return_value.json.return_value = {}
+        client = get_api_client(self.get_request())
+
+        client.get("barriers", params={"limit": 1, "offset": 0})
+        client.get("barriers", params={"offset": 0, "limit": 1})
+        client.get("barriers", params={"limit": 2, "offset": 0})
+
+        assert mock_get_session.return_value.request.call_count == 2
+
+    def test_writes_clear_the_memo(self, mock_get_session):
+        mock_get_session.return_value.request.return_value.json.return_value = {}
+        request = self.get_request()
+        client = get_api_client(request)
+
+        client.get("barriers/1")
+        get_api_client(request).patch("barriers/1", json={"title": "New"})
+        client.get("barriers/1")
+
+        assert mock_get_session.return_value.request.call_count == 3
+
+    def test_requests_do_not_share_memo(self, mock_get_session):
+        mock_get_session.return_value.request.return_value.json.return_value = {}
+
+        get_api_client(self.get_request()).get("barriers/1")
+        get_api_client(self.get_request()).get("barriers/1")
+
+        assert mock_get_session.return_value.request.call_count == 2
+
+    def test_no_memo_without_middleware(self, mock_get_session):
+        mock_get_session.return_value.request.return_value.json.return_value = {}
+        request = RequestFactory().get("/")
+        request.session = {"sso_token": "abcd"}
+
+        get_api_client(request).get("barriers/1")
+        get_api_client(request).get("barriers/1")
+
+        assert mock_get_session.return_value.request.call_count == 2
+
+
+class AsyncMarketAccessAPIClientTestCase(TestCase):
+    """
+    Test the async client used by async views
+    """
+
+    @patch("utils.api.client.MarketAccessAPIClient.get")
+    def test_resources_return_models(self, mock_get):
+        mock_get.return_value = {"id": "1", "title": "Barrier"}
+        client = AsyncMarketAccessAPIClient("abcd")
+
+        barrier = async_to_sync(client.barriers.get)(id="1")
+
+        assert barrier.__class__.__name__ == "Barrier"
+        assert barrier.title == "Barrier"
+        mock_get.assert_called_once_with("barriers/1")
+
+    def test_gather_accepts_awaitables_and_callables(self):
+        client = AsyncMarketAccessAPIClient("abcd")
+
+        async def double(i):
+            return i * 2
+
+        async def run():
+            return await client.gather(double(1), partial(lambda i: i * 3, 2))
+
+        assert async_to_sync(run)() == [2, 6]
+
+    def test_gather_runs_calls_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+        client = AsyncMarketAccessAPIClient("abcd")
+
+        async def run():
+            return await client.gather(barrier.wait, barrier.wait, barrier.wait)
+
+        assert sorted(async_to_sync(run)()) == [0, 1, 2]
+
+    def test_gather_raises_first_exception(self):
+        finished = []
+        client = AsyncMarketAccessAPIClient("abcd")
+
+        def fail(message):
+            raise ValueError(message)
+
+        async def run():
+            return await client.gather(
+                partial(fail, "first"),
+                lambda: finished.append(1),
+                partial(fail, "second"),
+            )
+
+        with self.assertRaises(ValueError) as context:
+            async_to_sync(run)()
+
+        assert str(context.exception) == "first"
+        assert finished == [1]
@@ -0,0 +1,83 @@
+from django.db import OperationalError
+from django.test import SimpleTestCase
+from mock import patch
+
+from utils.db.postgresql_pool.pool import ConnectionPool
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.pool = ConnectionPool(max_size=2, timeout=0.01, max_idle_time=60)
+
+    def test_returned_connection_is_reused(self):
+        connection = self.pool.get(FakeConnection)
+        self.pool.put(connection)
+
+        assert self.pool.get(FakeConnection) is connection
+
+    def test_most_recently_returned_connection_is_reused_first(self):
+        first = self.pool.get(FakeConnection)
+        second = self.pool.get(FakeConnection)
+        self.pool.put(first)
+        self.pool.put(second)
+
+        assert self.pool.get(FakeConnection) is second
+
+    def test_get_times_out_when_all_connections_are_in_use(self):
+        self.pool.get(FakeConnection)
+        self.pool.get(FakeConnection)
+
+        with self.assertRaises(OperationalError):
+            self.pool.get(FakeConnection)
+
+    def test_failed_connect_frees_its_slot(self):
+        def connect():
+            raise OperationalError
+
+        for _ in range(3):
+            with self.assertRaises(OperationalError):
+                self.pool.get(connect)
+
+        assert self.pool.get(FakeConnection)
+
+    def test_unreusable_connection_is_closed(self):
+        connection = self.pool.get(FakeConnection)
+        self.pool.put(connection, reusable=False)
+
+        assert connection.closed
+        assert self.pool.get(FakeConnection) is not connection
+
+    def test_closed_connection_is_not_reused(self):
+        connection = self.pool.get(FakeConnection)
+        self.pool.put(connection)
+        connection.close()
+
+        assert self.pool.get(FakeConnection) is not connection
+
+    def test_idle_connection_expires(self):
+        with patch("utils.db.postgresql_pool.pool.time.monotonic", return_value=0):
+            connection = self.pool.get(FakeConnection)
+            self.pool.put(connection)
+
+        with patch("utils.db.postgresql_pool.pool.time.monotonic", return_value=61):
+            assert self.pool.get(FakeConnection) is not connection
+
+        assert connection.closed
+
+    def test_close_idle(self):
+        connection = self.pool.get(FakeConnection)
+        self.pool.put(connection)
+
+        self.pool.close_idle()
+
+        assert connection.closed
+        assert not self.pool.idle
@@ -0,0 +1,70 @@
+from django.test import SimpleTestCase
+from mock import patch
+
+from utils.diff import (
+    WORD_DIFF_MIN_LENGTH,
+    clear_diff_memo,
+    diff_budget,
+    diff_match_patch,
+    get_html_diff,
+)
+
+
+class HTMLDiffTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        clear_diff_memo()
+        self.addCleanup(clear_diff_memo)
+
+    def test_diff(self):
+        assert get_html_diff("Old summary", "New summary") == (
+            '<del class="diff__del">Old</del><ins class="diff__ins">New</ins>'
+            '<span class="diff__eq"> summary</span>'
+        )
+
+    def test_diff_is_memoized(self):
+        with patch.object(
+            diff_match_patch,
+            "diff_main",
+            autospec=True,
+            wraps=diff_match_patch.diff_main,
+        ) as mock_diff_main:
+            html = get_html_diff("Old summary", "New summary")
+            assert get_html_diff("Old summary", "New summary") == html
+
+        assert mock_diff_main.call_count == 1
+
+    def test_long_texts_are_diffed_by_word(self):
+        padding = " filler" * (WORD_DIFF_MIN_LENGTH // 7)
+
+        html = get_html_diff("A tariff of 10%" + padding, "A tariff of 12%" + padding)
+
+        assert '<del class="diff__del">10% </del><ins class="diff__ins">12% </ins>' in (
+            html
+        )
+
+    def test_exhausted_budget_shows_whole_texts(self):
+        with diff_budget(0) as budget:
+            html = get_html_diff("Old summary", "New summary")
+
+        assert html == (
+            '<del class="diff__del">Old summary</del>'
+            '<ins class="diff__ins">New summary</ins>'
+        )
+        assert budget.degraded == 1
+
+        # Cut short diffs are not memoized
+        assert get_html_diff("Old summary", "New summary") != html
+
+    @patch("utils.diff.time.thread_time")
+    def test_budget_is_used_up(self, mock_thread_time):
+        mock_thread_time.side_effect = [0, 1.5, 2, 3]
+
+        with diff_budget(2) as budget:
+            get_html_diff("Old summary", "New summary")
+            assert budget.remaining == 0.5
+            get_html_diff("Old text", "New text")
+            assert budget.remaining == -0.5
+            get_html_diff("Old notes", "New notes")
+
+        assert budget.degraded == 1
@@ -1,5 +1,38 @@
+import json
+
+from django.apps import apps
+from django.conf import settings
+from django.test import override_settings
+from mock import patch
+
+from barriers.forms.search import BarrierSearchForm
+from core.filecache import memfiles
 from core.tests import MarketAccessTestCase
-from utils.metadata import get_metadata
+from tools.benchmarks.metadata_lookups import (
+    linear_get_admin_area,
+    linear_get_category,
+    linear_get_country,
+    linear_get_government_organisation,
+    linear_get_overseas_region_by_id,
+    linear_get_sector,
+)
+from tools.benchmarks.search_form import get_original_choice_builders
+from utils.metadata import (
+    LEGACY_METADATA_CACHE_KEYS,
+    METADATA_CACHE_KEY,
+    METADATA_EXPIRY_CACHE_KEY,
+    METADATA_FORMAT_HEADER,
+    METADATA_VERSION_CACHE_KEY,
+    Metadata,
+    clear_metadata_cache,
+    decode_metadata,
+    encode_metadata,
+    fetch_metadata,
+    get_metadata,
+    get_metadata_version,
+    local_metadata_cache,
+    run_metadata_refresher,
+)
 
 
 class MetadataTestCase(MarketAccessTestCase):
@@ -46,6 +79,101 @@ class MetadataTestCase(MarketAccessTestCase):
             "Wider Europe",
         ]
 
+    def test_get_overseas_region_by_id(self):
+        metadata = get_metadata()
+        region = metadata.get_overseas_region_by_id(
+            "c4679b44-079e-4394-8bf7-bb0881a5031d"
+        )
+        assert region["name"] == "Middle East"
+        assert metadata.get_overseas_region_by_id("not-a-region") is None
+
+    def test_get_countries_with_admin_areas_list(self):
+        metadata = get_metadata()
+        countries = metadata.get_countries_with_admin_areas_list()
+        country_ids = [country["id"] for country in countries]
+        assert len(country_ids) == len(set(country_ids))
+        assert {
+            "id": "b05f66a0-5d95-e211-a939-e4115bead28a",
+            "name": "Brazil",
+        } in countries
+
+    def test_get_trading_bloc_by_country_id(self):
+        metadata = get_metadata()
+        trading_bloc = metadata.get_trading_bloc_by_country_id(
+            "56af72a6-5d95-e211-a939-e4115bead28a"
+        )
+        assert trading_bloc["code"] == "TB00003"
+        assert set(trading_bloc.keys()) == {"code", "name", "short_name"}
+
+    def test_get_government_organisation(self):
+        metadata = get_metadata()
+        assert metadata.get_government_organisation(1)["name"] == (
+            "Attorney General's Office"
+        )
+        assert metadata.get_government_organisation("1")["name"] == (
+            "Attorney General's Office"
+        )
+
+    def test_lookups_match_linear_scans_when_reused(self):
+        metadata = get_metadata()
+        data = metadata.data
+        lookups = (
+            (metadata.get_country, linear_get_country, "countries"),
+            (metadata.get_admin_area, linear_get_admin_area, "admin_areas"),
+            (metadata.get_sector, linear_get_sector, "sectors"),
+            (metadata.get_category, linear_get_category, "categories"),
+            (
+                metadata.get_overseas_region_by_id,
+                linear_get_overseas_region_by_id,
+                "overseas_regions",
+            ),
+            (
+                metadata.get_government_organisation,
+                linear_get_government_organisation,
+                "government_organisations",
+            ),
+        )
+
+        for lookup, linear_lookup, key in lookups:
+            for item in data[key]:
+                expected = linear_lookup(data, item["id"])
+                assert lookup(item["id"]) == expected
+                assert lookup(item["id"]) == expected
+            assert lookup("not-an-id") is None
+
+    def test_lookups_do_not_rescan(self):
+        metadata = get_metadata()
+        country_id = "b05f66a0-5d95-e211-a939-e4115bead28a"
+
+        with patch.object(
+            Metadata, "_build_index", wraps=Metadata._build_index
+        ) as mock_build_index:
+            country = metadata.get_country(country_id)
+            assert metadata.get_country(country_id) is country
+            assert metadata.get_country(country_id) is country
+
+        assert mock_build_index.call_count == 1
+
+    def test_returned_lists_can_be_modified(self):
+        metadata = get_metadata()
+        returned_lists = (
+            metadata.get_category_list,
+            metadata.get_goods,
+            metadata.get_country_choices,
+            metadata.get_overseas_region_choices,
+            lambda: metadata.get_sector_list(level=0),
+            lambda: metadata.get_sector_choices(level=0),
+            metadata.get_barrier_tags,
+            lambda: metadata.get_barrier_tag_choices("search"),
+        )
+
+        for get_list in returned_lists:
+            original = get_list()
+            modified = get_list()
+            modified.insert(0, ("", "Select"))
+            modified.sort(key=str)
+            assert get_list() == original
+
     def test_get_sector(self):
         metadata = get_metadata()
         sector_id = "9838cecc-5f95-e211-a939-e4115bead28a"
@@ -155,3 +283,251 @@ class MetadataTestCase(MarketAccessTestCase):
             "show_at_reporting": False,
             "order": 9999,
         }
+
+    def test_search_choice_catalogue_matches_original_choices(self):
+        metadata = get_metadata()
+        catalogue = metadata.get_search_choice_catalogue()
+
+        for field_name, build in get_original_choice_builders().items():
+            catalogue_name = BarrierSearchForm.catalogue_choices[field_name]
+            original_choices = [tuple(choice) for choice in build(metadata)]
+            assert list(catalogue.get_choices(catalogue_name)) == original_choices
+            assert catalogue.get_labels(catalogue_name) == dict(original_choices)
+
+    def test_search_choice_catalogue_is_built_once(self):
+        metadata = get_metadata()
+
+        catalogue = metadata.get_search_choice_catalogue()
+
+        assert metadata.get_search_choice_catalogue() is catalogue
+        assert Metadata(metadata.data).get_search_choice_catalogue() is not catalogue
+
+    def test_search_choice_catalogue_is_read_only(self):
+        catalogue = get_metadata().get_search_choice_catalogue()
+
+        with self.assertRaises(TypeError):
+            catalogue.get_labels("categories")["1"] = "Changed"
+        with self.assertRaises(AttributeError):
+            catalogue.get_choices("categories").append(("1", "Changed"))
+
+
+@override_settings(DJANGO_ENV="dev", METADATA_LOCAL_CACHE_TIME=0)
+class LocalMetadataCacheTestCase(MarketAccessTestCase):
+    """
+    Test the process-local, versioned metadata cache
+    """
+
+    def setUp(self):
+        super().setUp()
+        file = f"{settings.BASE_DIR}/../core/fixtures/metadata.json"
+        self.raw_metadata = memfiles.open(file).encode()
+        self.redis_patcher = patch("utils.metadata.redis_client")
+        self.mock_redis = self.redis_patcher.start()
+        self.addCleanup(self.redis_patcher.stop)
+        self.redis_data = {}
+        self.mock_redis.mget.side_effect = lambda keys: [
+            self.redis_data.get(key) for key in keys
+        ]
+        self.mock_redis.get.side_effect = lambda key: self.redis_data.get(key)
+        local_metadata_cache.clear()
+        self.addCleanup(local_metadata_cache.clear)
+
+    def set_redis_metadata(self, version, expiry=None):
+        self.redis_data = {
+            METADATA_VERSION_CACHE_KEY: version,
+            METADATA_CACHE_KEY: self.raw_metadata,
+            METADATA_EXPIRY_CACHE_KEY: expiry,
+        }
+
+    def test_metadata_is_parsed_once_per_version(self):
+        self.set_redis_metadata(b"v1")
+
+        with patch("utils.metadata.json.loads", wraps=json.loads) as mock_loads:
+            metadata = get_metadata()
+            assert get_metadata() is metadata
+            assert get_metadata() is metadata
+
+        assert mock_loads.call_count == 1
+        blob_reads = [
+            call
+            for call in self.mock_redis.mget.call_args_list
+            if METADATA_CACHE_KEY in call.args[0]
+        ]
+        assert len(blob_reads) == 1
+
+    def test_no_redis_calls_within_local_cache_time(self):
+        self.set_redis_metadata(b"v1")
+
+        with override_settings(METADATA_LOCAL_CACHE_TIME=60):
+            metadata = get_metadata()
+            self.mock_redis.reset_mock()
+
+            for _ in range(10):
+                assert get_metadata() is metadata
+
+        assert self.mock_redis.method_calls == []
+
+    def test_new_version_is_reloaded(self):
+        self.set_redis_metadata(b"v1")
+        metadata = get_metadata()
+
+        self.set_redis_metadata(b"v2")
+        new_metadata = get_metadata()
+
+        assert new_metadata is not metadata
+        assert get_metadata() is new_metadata
+
+    def test_unversioned_metadata_gets_a_version(self):
+        self.set_redis_metadata(None)
+        self.mock_redis.ttl.return_value = 120
+        version = get_metadata_version(self.raw_metadata)
+
+        metadata = get_metadata()
+
+        self.mock_redis.set.assert_called_once_with(
+            METADATA_VERSION_CACHE_KEY, version, ex=120, nx=True
+        )
+        self.set_redis_metadata(version.encode())
+        self.mock_redis.mget.reset_mock()
+        assert get_metadata() is metadata
+        assert self.mock_redis.mget.call_count == 1
+
+    def test_metadata_blob_round_trip(self):
+        data = json.loads(self.raw_metadata)
+
+        raw_metadata = encode_metadata(data)
+
+        assert raw_metadata.startswith(METADATA_FORMAT_HEADER)
+        assert len(raw_metadata) < len(self.raw_metadata) / 4
+        assert decode_metadata(raw_metadata) == data
+
+    def test_metadata_blob_is_loaded(self):
+        data = json.loads(self.raw_metadata)
+        self.raw_metadata = encode_metadata(data)
+        self.set_redis_metadata(b"v1")
+
+        with patch("utils.metadata.json.loads") as mock_loads:
+            metadata = get_metadata()
+
+        assert metadata.data == data
+        mock_loads.assert_not_called()
+
+    @patch("utils.metadata.fetch_missing_metadata")
+    def test_legacy_json_metadata_is_loaded(self, mock_fetch_missing_metadata):
+        self.redis_data = {LEGACY_METADATA_CACHE_KEYS[0]: self.raw_metadata}
+
+        metadata = get_metadata()
+
+        assert metadata.data == json.loads(self.raw_metadata)
+        mock_fetch_missing_metadata.assert_not_called()
+
+    @patch("utils.metadata.requests.get")
+    def test_fetched_metadata_is_stored_as_blob(self, mock_get):
+        data = json.loads(self.raw_metadata)
+        mock_get.return_value.json.return_value = data
+
+        version, metadata = fetch_metadata()
+
+        blob_set = self.mock_redis.pipeline.return_value.set.call_args_list[0]
+        assert blob_set.args[0] == METADATA_CACHE_KEY
+        raw_metadata = blob_set.args[1]
+        assert decode_metadata(raw_metadata) == data
+        assert version == get_metadata_version(raw_metadata)
+        assert metadata == data
+
+    def test_clear_metadata_cache(self):
+        self.set_redis_metadata(b"v1")
+        get_metadata()
+
+        clear_metadata_cache()
+
+        self.mock_redis.delete.assert_called_once_with(
+            METADATA_CACHE_KEY,
+            METADATA_VERSION_CACHE_KEY,
+            METADATA_EXPIRY_CACHE_KEY,
+            *LEGACY_METADATA_CACHE_KEYS,
+        )
+        assert local_metadata_cache.get("v1") is None
+
+    @patch("utils.metadata.start_metadata_refresher")
+    @patch("core.apps.redis.Redis.from_url")
+    def test_startup_clears_metadata_cache(self, mock_from_url, mock_start_refresher):
+        self.set_redis_metadata(b"v1")
+        get_metadata()
+
+        apps.get_app_config("core").ready()
+
+        mock_from_url.return_value.delete.assert_called_once_with(
+            METADATA_CACHE_KEY,
+            METADATA_VERSION_CACHE_KEY,
+            METADATA_EXPIRY_CACHE_KEY,
+            *LEGACY_METADATA_CACHE_KEYS,
+        )
+        assert local_metadata_cache.get("v1") is None
+        mock_start_refresher.assert_called_once()
+
+    @patch("utils.metadata.fetch_metadata")
+    def test_missing_metadata_is_fetched_by_lock_holder(self, mock_fetch_metadata):
+        mock_fetch_metadata.return_value = ("v1", json.loads(self.raw_metadata))
+        self.mock_redis.lock.return_value.acquire.return_value = True
+
+        metadata = get_metadata()
+
+        assert metadata.data == json.loads(self.raw_metadata)
+        mock_fetch_metadata.assert_called_once()
+        self.mock_redis.lock.return_value.release.assert_called_once()
+
+    @patch("utils.metadata.time.sleep")
+    @patch("utils.metadata.fetch_metadata")
+    def test_missing_metadata_waits_for_lock_holder(
+        self, mock_fetch_metadata, mock_sleep
+    ):
+        self.mock_redis.lock.return_value.acquire.return_value = False
+        # Another process stores the metadata while this one is waiting
+        mock_sleep.side_effect = lambda seconds: self.set_redis_metadata(b"v1")
+
+        metadata = get_metadata()
+
+        assert metadata.data == json.loads(self.raw_metadata)
+        mock_fetch_metadata.assert_not_called()
+        assert local_metadata_cache.get("v1") is metadata
+
+    @override_settings(METADATA_LOCK_TIME=0)
+    @patch("utils.metadata.fetch_metadata")
+    def test_missing_metadata_is_fetched_when_wait_times_out(self, mock_fetch_metadata):
+        mock_fetch_metadata.return_value = ("v1", json.loads(self.raw_metadata))
+        self.mock_redis.lock.return_value.acquire.return_value = False
+
+        get_metadata()
+
+        mock_fetch_metadata.assert_called_once()
+
+    @patch("utils.metadata.refresh_metadata_in_background")
+    @patch("utils.metadata.time.time")
+    def test_metadata_is_refreshed_early(self, mock_time, mock_refresh):
+        mock_time.return_value = 1000
+        self.set_redis_metadata(b"v1", expiry=b"1100 2")
+        get_metadata()
+        get_metadata()
+        mock_refresh.assert_not_called()
+
+        # Within a fraction of a download time of expiry, refresh is near certain
+        mock_time.return_value = 1100
+        get_metadata()
+
+        mock_refresh.assert_called_once()
+
+    @patch("utils.metadata.time.sleep")
+    @patch("utils.metadata.refresh_metadata")
+    def test_refresher_renews_metadata_ahead_of_expiry(self, mock_refresh, mock_sleep):
+        mock_sleep.side_effect = [None, None, StopIteration]
+        self.mock_redis.ttl.side_effect = [
+            settings.METADATA_REFRESH_AHEAD_TIME + 1,
+            settings.METADATA_REFRESH_AHEAD_TIME - 1,
+            -2,
+        ]
+
+        with self.assertRaises(StopIteration):
+            run_metadata_refresher()
+
+        assert mock_refresh.call_count == 2
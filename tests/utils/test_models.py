@@ -0,0 +1,59 @@
+import datetime
+
+import dateutil.parser
+from django.test import TestCase
+from mock import patch
+
+from barriers.models import Barrier
+from barriers.models.assessments import EconomicAssessment
+from utils.models import parse_date
+
+
+class ParseDateTestCase(TestCase):
+    def test_matches_dateutil(self):
+        for value in (
+            "2020-03-19T12:01:01.591474Z",
+            "2020-03-19T12:01:01Z",
+            "2020-03-19T12:01:01+01:00",
+            "2020-03-19T12:01:01.591",
+            "2020-03-19",
+            "2020-03-19T12:01:01.5914Z",
+            "19 March 2020",
+        ):
+            with self.subTest(value=value):
+                assert parse_date(value) == dateutil.parser.parse(value)
+
+    def test_utc_dates_are_aware(self):
+        parsed = parse_date("2020-03-19T12:01:01Z")
+        assert parsed.utcoffset() == datetime.timedelta(0)
+
+
+class APIModelDatesTestCase(TestCase):
+    @patch("utils.models.parse_date", wraps=parse_date)
+    def test_dates_are_parsed_once(self, mock_parse_date):
+        barrier = Barrier({"reported_on": "2020-03-19T12:01:01Z"})
+
+        assert barrier.reported_on == barrier.reported_on
+        assert mock_parse_date.call_count == 1
+
+    def test_replaced_dates_are_parsed_again(self):
+        barrier = Barrier({"modified_on": "2020-03-19T12:01:01Z"})
+        assert barrier.modified_on.year == 2020
+
+        barrier.data["modified_on"] = "2021-03-19T12:01:01Z"
+
+        assert barrier.modified_on.year == 2021
+
+    def test_missing_dates_are_none(self):
+        barrier = Barrier({"status_date": None})
+        assert barrier.status_date is None
+
+    @patch("utils.models.parse_date", wraps=parse_date)
+    def test_date_fields(self, mock_parse_date):
+        assessment = EconomicAssessment({"created_on": "2020-03-19T12:01:01Z"})
+
+        assert assessment.created_on == datetime.datetime(
+            2020, 3, 19, 12, 1, 1, tzinfo=datetime.timezone.utc
+        )
+        assert assessment.created_on is assessment.created_on
+        assert mock_parse_date.call_count == 1
@@ -0,0 +1,24 @@
+from django.test import RequestFactory, SimpleTestCase
+
+from utils.pagination import PaginationMixin
+
+
+class PaginationQuerystringTestCase(SimpleTestCase):
+    def get_paginator(self, data):
+        paginator = PaginationMixin()
+        paginator.request = RequestFactory().get("/search/", data=data)
+        return paginator
+
+    def test_page_querystring_matches_update_querystring(self):
+        for data in (
+            {},
+            {"page": "3"},
+            {"page": "3", "status": ["2", "3"], "search": "a&b c"},
+            {"ordering": "-reported", "page": "3", "country": "Côte d'Ivoire"},
+        ):
+            paginator = self.get_paginator(data)
+            base_querystring = paginator.update_querystring()
+            for page in (1, 2, 500):
+                assert paginator.get_page_querystring(
+                    base_querystring, page
+                ) == paginator.update_querystring(page=page)
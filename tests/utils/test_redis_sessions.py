@@ -0,0 +1,183 @@
+from django.test import SimpleTestCase
+from mock import patch
+
+from utils.redis_sessions import (
+    COMPRESS_MIN_SIZE,
+    SessionStore,
+    decode_value,
+    encode_value,
+)
+
+
+class FakeRedis:
+    """
+    The redis hash commands used by SessionStore, recording each write.
+    """
+
+    def __init__(self):
+        self.hashes = {}
+        self.ttls = {}
+        self.writes = []
+
+    def hgetall(self, key):
+        return {
+            name.encode(): value for name, value in self.hashes.get(key, {}).items()
+        }
+
+    def hsetnx(self, key, name, value):
+        fields = self.hashes.setdefault(key, {})
+        if name in fields:
+            return 0
+        fields[name] = str(value).encode()
+        return 1
+
+    def hset(self, key, mapping):
+        self.writes.append(dict(mapping))
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hdel(self, key, *names):
+        for name in names:
+            self.hashes.get(key, {}).pop(name, None)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def exists(self, key):
+        return int(key in self.hashes)
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        def command(*args, **kwargs):
+            self.commands.append((getattr(self.redis, name), args, kwargs))
+
+        return command
+
+    def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+
+class RedisSessionTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.redis = FakeRedis()
+        patcher = patch("utils.redis_sessions.redis_client", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_session(self, **data):
+        session = SessionStore()
+        session.update(data)
+        session.save()
+        self.redis.writes.clear()
+        return SessionStore(session.session_key)
+
+    def test_value_round_trip(self):
+        for value in ("abc", 1, None, ["a", 1], {"a": {"b": [1, 2]}}):
+            assert decode_value(encode_value(value)) == value
+
+    def test_large_values_are_compressed(self):
+        value = {"steps": ["x" * 100] * 50}
+
+        encoded = encode_value(value)
+
+        assert len(encoded) < COMPRESS_MIN_SIZE
+        assert decode_value(encoded) == value
+
+    def test_session_round_trip(self):
+        session = self.create_session(sso_token="abcd", user_data={"id": 49})
+
+        assert session["sso_token"] == "abcd"
+        assert session["user_data"] == {"id": 49}
+        assert self.redis.ttls[session.get_redis_key(session.session_key)] == (
+            session.get_expiry_age()
+        )
+
+    def test_only_changed_keys_are_written(self):
+        session = self.create_session(
+            sso_token="abcd", wizard={"steps": ["x" * 100] * 50}
+        )
+
+        session["location"] = {"country": "1"}
+        session.save()
+
+        assert self.redis.writes == [{"location": encode_value({"country": "1"})}]
+        assert session.bytes_written == len("location") + len(
+            encode_value({"country": "1"})
+        )
+
+    def test_values_changed_in_place_are_written(self):
+        session = self.create_session(location={"admin_areas": ["1"]})
+
+        session["location"]["admin_areas"].append("2")
+        session.modified = True
+        session.save()
+
+        assert self.redis.writes == [
+            {"location": encode_value({"admin_areas": ["1", "2"]})}
+        ]
+
+    def test_unchanged_session_is_not_rewritten(self):
+        session = self.create_session(sso_token="abcd")
+
+        session["sso_token"] = "abcd"
+        session.save()
+
+        assert self.redis.writes == []
+        assert session.bytes_written == 0
+
+    def test_deleted_keys_are_removed(self):
+        session = self.create_session(sso_token="abcd", location={"country": "1"})
+
+        del session["location"]
+        session.save()
+
+        assert dict(SessionStore(session.session_key)) == {"sso_token": "abcd"}
+
+    def test_expired_session_is_rewritten(self):
+        session = self.create_session(sso_token="abcd", location={"country": "1"})
+        assert session["sso_token"] == "abcd"
+        self.redis.delete(session.get_redis_key(session.session_key))
+
+        session["location"] = {"country": "2"}
+        session.save()
+
+        assert dict(SessionStore(session.session_key)) == {
+            "sso_token": "abcd",
+            "location": {"country": "2"},
+        }
+
+    def test_missing_session_is_empty(self):
+        session = SessionStore("doesnotexist1234")
+
+        assert dict(session) == {}
+        assert session.session_key is None
+
+    def test_cycle_key(self):
+        session = self.create_session(sso_token="abcd")
+        old_key = session.session_key
+
+        session.cycle_key()
+        session.save()
+
+        assert not session.exists(old_key)
+        assert dict(SessionStore(session.session_key)) == {"sso_token": "abcd"}
+
+    def test_flush(self):
+        session = self.create_session(sso_token="abcd")
+        old_key = session.session_key
+
+        session.flush()
+
+        assert not session.exists(old_key)
+        assert session.session_key is None
@@ -0,0 +1,98 @@
+import requests
+from django import forms
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+from mock import patch
+
+from barriers.forms.mixins import DocumentMixin
+from utils.exceptions import FileUploadError
+from utils.forms.fields import RestrictedFileField
+from utils.uploadhandlers import MaxSizeUploadHandler
+
+
+class RestrictedFileFieldTestCase(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.field = RestrictedFileField(
+            content_types=["text/plain"], max_upload_size=1024 * 1024
+        )
+
+    def test_type_is_sniffed_from_the_start_of_the_file(self):
+        data = b"x" * (self.field.mime_sniff_size * 2)
+        document = SimpleUploadedFile("notes.txt", data)
+
+        with patch("utils.forms.fields.magic.from_buffer") as mock_from_buffer:
+            mock_from_buffer.return_value = "text/plain"
+            assert self.field.clean(document) is document
+
+        mock_from_buffer.assert_called_once_with(
+            data[: self.field.mime_sniff_size], mime=True
+        )
+        assert document.tell() == 0
+
+    def test_size_is_checked_before_reading(self):
+        document = SimpleUploadedFile("notes.txt", b"x" * (1024 * 1024 + 1))
+
+        with patch("utils.forms.fields.magic.from_buffer") as mock_from_buffer:
+            with self.assertRaisesRegex(forms.ValidationError, "must be smaller"):
+                self.field.clean(document)
+
+        mock_from_buffer.assert_not_called()
+
+    def test_disallowed_type(self):
+        document = SimpleUploadedFile("image.gif", b"GIF89a" + b"\0" * 100)
+
+        with self.assertRaisesRegex(forms.ValidationError, "must be a .txt"):
+            self.field.clean(document)
+
+
+@override_settings(FILE_MAX_SIZE=10)
+class MaxSizeUploadHandlerTestCase(SimpleTestCase):
+    def receive(self, chunks):
+        handler = MaxSizeUploadHandler()
+        handler.new_file("document", "notes.txt", "text/plain", None)
+        passed_on = [handler.receive_data_chunk(chunk, 0) for chunk in chunks]
+        return passed_on, handler.file_complete(sum(map(len, chunks)))
+
+    def test_small_file_is_passed_on(self):
+        passed_on, uploaded_file = self.receive([b"12345", b"67890"])
+
+        assert passed_on == [b"12345", b"67890"]
+        assert uploaded_file is None
+
+    def test_large_file_is_not_stored(self):
+        passed_on, uploaded_file = self.receive([b"12345", b"67890", b"1", b"2"])
+
+        assert passed_on == [b"12345", b"67890", None, None]
+        assert uploaded_file.name == "notes.txt"
+        assert uploaded_file.size == 12
+        assert uploaded_file.read() == b""
+
+
+class UploadToS3TestCase(SimpleTestCase):
+    @patch("utils.api.client.get_upload_session")
+    def test_file_is_streamed(self, mock_get_upload_session):
+        document = SimpleUploadedFile("notes.txt", b"notes")
+        document.read()
+
+        DocumentMixin.upload_to_s3(None, url="signed-url", document=document)
+
+        mock_put = mock_get_upload_session.return_value.put
+        mock_put.assert_called_once_with(
+            "signed-url",
+            headers={"x-amz-server-side-encryption": "AES256"},
+            data=document,
+        )
+        assert document.tell() == 0
+
+    @patch("utils.api.client.get_upload_session")
+    def test_failed_upload(self, mock_get_upload_session):
+        mock_put = mock_get_upload_session.return_value.put
+        mock_put.return_value.raise_for_status.side_effect = (
+            requests.exceptions.HTTPError()
+        )
+
+        with self.assertRaises(FileUploadError):
+            DocumentMixin.upload_to_s3(
+                None, url="signed-url", document=SimpleUploadedFile("a.txt", b"")
+            )
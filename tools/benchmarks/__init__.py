@@ -0,0 +1,50 @@
+"""
+Micro-benchmarks for hot paths in the frontend.
+
+Run from the project root (inside the web container) with e.g.:
+
+    python -m tools.benchmarks.metadata_lookups
+
+The benchmarks always run with the test settings, whatever
+DJANGO_SETTINGS_MODULE is set to, so metadata comes from the fixture in
+core/fixtures and no API or redis access is needed.
+"""
+
+import os
+import timeit
+import tracemalloc
+
+
+def setup_django():
+    os.environ["DJANGO_SETTINGS_MODULE"] = "config.settings.test"
+
+    import django
+
+    django.setup()
+
+
+def bench(label, func, number=1000, repeat=5):
+    """
+    Time func and print the best time per call in microseconds.
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print(f"{label:<60} {best * 1_000_000:>12.2f} µs")
+    return best
+
+
+def compare(label, old, new, number=1000, repeat=5):
+    old_time = bench(f"{label} (old)", old, number=number, repeat=repeat)
+    new_time = bench(f"{label} (new)", new, number=number, repeat=repeat)
+    print(f"{'':<60} {old_time / new_time:>11.1f}x")
+
+
+def allocations(label, func):
+    """
+    Run func once and print the peak memory it allocated in KiB.
+    """
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:<60} {peak / 1024:>9.1f} KiB")
+    return peak
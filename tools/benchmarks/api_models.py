@@ -0,0 +1,88 @@
+"""
+Compare re-parsing API dates with dateutil on every access with the memoized
+fromisoformat parsing in APIModel.get_date, for a 100-barrier search page.
+"""
+
+import json
+
+import dateutil.parser
+from django.conf import settings
+
+from tools.benchmarks import allocations, compare, setup_django
+
+# The dates shown for each barrier on the search page, each read twice by the
+# template (once to check it is set and once to display it)
+SEARCH_PAGE_DATE_FIELDS = (
+    "reported_on",
+    "modified_on",
+    "status_date",
+    "estimated_resolution_date",
+)
+
+
+def dateutil_render(barriers_data):
+    for data in barriers_data:
+        for field in SEARCH_PAGE_DATE_FIELDS:
+            for _ in range(2):
+                if data.get(field):
+                    dateutil.parser.parse(data[field])
+
+
+def model_render(barriers_data):
+    from barriers.models import Barrier
+
+    for data in barriers_data:
+        barrier = Barrier(data)
+        for field in SEARCH_PAGE_DATE_FIELDS:
+            for _ in range(2):
+                getattr(barrier, field)
+
+
+# Interactions are sorted by date and then the template shows each date
+def dateutil_interactions(history_data):
+    items = sorted(
+        history_data, key=lambda item: dateutil.parser.parse(item["date"]), reverse=True
+    )
+    for item in items:
+        dateutil.parser.parse(item["date"])
+
+
+def model_interactions(history_data):
+    from barriers.models import HistoryItem
+
+    items = [HistoryItem(item) for item in history_data]
+    items.sort(key=lambda item: item.date, reverse=True)
+    for item in items:
+        item.date
+
+
+def main():
+    setup_django()
+
+    with open(f"{settings.BASE_DIR}/../tests/barriers/fixtures/barriers.json") as f:
+        fixture = json.load(f)
+    with open(f"{settings.BASE_DIR}/../tests/barriers/fixtures/history.json") as f:
+        history = json.load(f)
+
+    barriers_data = [fixture[i % len(fixture)] for i in range(100)]
+    history = history[0]
+    history_data = [history[i % len(history)] for i in range(200)]
+
+    compare(
+        "search page dates (100 barriers)",
+        lambda: dateutil_render(barriers_data),
+        lambda: model_render(barriers_data),
+        number=20,
+    )
+    allocations("search page dates (old)", lambda: dateutil_render(barriers_data))
+    allocations("search page dates (new)", lambda: model_render(barriers_data))
+    compare(
+        "sort and show 200 interactions",
+        lambda: dateutil_interactions(history_data),
+        lambda: model_interactions(history_data),
+        number=20,
+    )
+
+
+if __name__ == "__main__":
+    main()
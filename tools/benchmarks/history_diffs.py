@@ -0,0 +1,138 @@
+"""
+Compare the history item diff before and after utils.diff.get_html_diff, on a
+corpus of barrier summary edits: typo fixes, added and removed sentences,
+rewritten paragraphs and wholesale replacements, for short, medium and long
+summaries.
+
+The corpus is generated from a fixed seed, so runs are comparable.
+"""
+
+import random
+
+from tools.benchmarks import bench, compare, setup_django
+
+SENTENCES = (
+    "Exporters of {product} to {country} are required to obtain an import "
+    "licence for each consignment, which can take up to {weeks} weeks to issue.",
+    "The {country} authorities introduced new labelling requirements for "
+    "{product} in {year} without notifying the WTO.",
+    "UK businesses report that customs officials apply inconsistent tariff "
+    "classifications to {product}, adding {percent}% to landed costs.",
+    "A {percent}% tariff applies to {product} from the UK, compared with "
+    "{weeks}% for competitors covered by a free trade agreement.",
+    "Certification issued by UK bodies is not recognised, so {product} must be "
+    "retested in {country} at the exporter's expense.",
+    "The post has raised the issue with the Ministry of Trade on {weeks} "
+    "occasions since {year} and is awaiting a formal response.",
+    "Industry estimates the barrier affects exports worth around "
+    "£{percent} million a year across {weeks} companies.",
+    "Sanitary and phytosanitary checks on {product} at the border cause delays "
+    "of up to {weeks} days, leading to spoilage.",
+)
+PRODUCTS = ("whisky", "lamb", "medical devices", "cosmetics", "steel", "cheese")
+COUNTRIES = ("Brazil", "India", "Japan", "Egypt", "Indonesia", "Canada")
+
+
+def make_sentence(rng):
+    return rng.choice(SENTENCES).format(
+        product=rng.choice(PRODUCTS),
+        country=rng.choice(COUNTRIES),
+        weeks=rng.randint(2, 20),
+        year=rng.randint(2015, 2023),
+        percent=rng.randint(5, 60),
+    )
+
+
+def make_summary(rng, length):
+    paragraphs = []
+    while sum(map(len, paragraphs)) < length:
+        paragraphs.append(" ".join(make_sentence(rng) for _ in range(4)))
+    return "\n\n".join(paragraphs)
+
+
+def fix_typo(rng, text):
+    position = rng.randrange(len(text))
+    return text[:position] + text[position + 1 :]
+
+
+def add_sentence(rng, text):
+    sentences = text.split(". ")
+    sentences.insert(rng.randrange(len(sentences)), make_sentence(rng)[:-1])
+    return ". ".join(sentences)
+
+
+def remove_sentence(rng, text):
+    sentences = text.split(". ")
+    sentences.pop(rng.randrange(len(sentences)))
+    return ". ".join(sentences)
+
+
+def rewrite_paragraph(rng, text):
+    paragraphs = text.split("\n\n")
+    index = rng.randrange(len(paragraphs))
+    paragraphs[index] = " ".join(make_sentence(rng) for _ in range(4))
+    return "\n\n".join(paragraphs)
+
+
+def replace_all(rng, text):
+    return make_summary(rng, len(text))
+
+
+EDITS = (fix_typo, add_sentence, remove_sentence, rewrite_paragraph, replace_all)
+
+
+def build_corpus(seed=0, lengths=(400, 2000, 10000), edits_per_kind=4):
+    """
+    Return a list of (old, new) summary pairs.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for length in lengths:
+        for edit in EDITS:
+            for _ in range(edits_per_kind):
+                old = make_summary(rng, length)
+                corpus.append((old, edit(rng, old)))
+    return corpus
+
+
+def old_diff(old, new):
+    from utils.diff import diff_match_patch
+
+    dmp = diff_match_patch()
+    diffs = dmp.diff_main(old, new)
+    dmp.diff_cleanupSemantic(diffs)
+    return dmp.diff_prettyHtml(diffs)
+
+
+def new_diff(old, new):
+    from utils.diff import clear_diff_memo, get_html_diff
+
+    clear_diff_memo()
+    return get_html_diff(old, new)
+
+
+def main():
+    setup_django()
+
+    from utils.diff import get_html_diff
+
+    for length in (400, 2000, 10000):
+        pairs = build_corpus(lengths=(length,))
+        compare(
+            f"diff {len(pairs)} summary edits (~{length} chars)",
+            lambda: [old_diff(old, new) for old, new in pairs],
+            lambda: [new_diff(old, new) for old, new in pairs],
+            number=1,
+            repeat=3,
+        )
+    corpus = build_corpus()
+    bench(
+        f"diff {len(corpus)} summary edits (memoized)",
+        lambda: [get_html_diff(old, new) for old, new in corpus],
+        number=1,
+        repeat=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Compare the JSON metadata blob earlier releases stored in redis with the
+compressed pickle blob from utils.metadata.encode_metadata: its size, which is
+sent from redis to every worker on each new version, and the time to load it.
+"""
+
+import json
+
+from django.conf import settings
+
+from tools.benchmarks import compare, setup_django
+
+
+def main():
+    setup_django()
+
+    from utils.metadata import decode_metadata, encode_metadata
+
+    with open(f"{settings.BASE_DIR}/../core/fixtures/metadata.json", "rb") as f:
+        json_blob = f.read()
+    blob = encode_metadata(json.loads(json_blob))
+
+    print(f"{'metadata blob (old)':<60} {len(json_blob) / 1024:>9.1f} KiB")
+    print(f"{'metadata blob (new)':<60} {len(blob) / 1024:>9.1f} KiB")
+    compare(
+        "load metadata blob",
+        lambda: json.loads(json_blob),
+        lambda: decode_metadata(blob),
+        number=100,
+    )
+
+
+if __name__ == "__main__":
+    main()
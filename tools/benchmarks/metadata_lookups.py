@@ -0,0 +1,96 @@
+"""
+Compare linear scans over the metadata lists with the indexed lookups
+provided by the Metadata class.
+"""
+
+from operator import itemgetter
+
+from tools.benchmarks import compare, setup_django
+
+
+def linear_get_country(data, country_id):
+    for country in data["countries"]:
+        if country["id"] == country_id:
+            return country
+
+
+def linear_get_admin_area(data, admin_area_id):
+    for admin_area in data["admin_areas"]:
+        if admin_area["id"] == admin_area_id and admin_area["disabled_on"] is None:
+            return admin_area
+
+
+def linear_get_sector(data, sector_id):
+    for sector in data.get("sectors", []):
+        if sector["id"] == sector_id:
+            return sector
+
+
+def linear_get_category(data, category_id):
+    for category in data["categories"]:
+        if str(category["id"]) == str(category_id):
+            return category
+
+
+def linear_get_overseas_region_by_id(data, region_id):
+    data["overseas_regions"].sort(key=itemgetter("name"))
+    for region in data["overseas_regions"]:
+        if region["id"] == str(region_id):
+            return region
+
+
+def linear_get_government_organisation(data, org_id):
+    for org in data.get("government_organisations", []):
+        if str(org["id"]) == str(org_id):
+            return org
+
+
+def main():
+    setup_django()
+
+    from utils.metadata import get_metadata
+
+    metadata = get_metadata()
+    data = metadata.data
+
+    country_id = data["countries"][-1]["id"]
+    admin_area_id = data["admin_areas"][-1]["id"]
+    sector_id = data["sectors"][-1]["id"]
+    category_id = data["categories"][-1]["id"]
+    region_id = data["overseas_regions"][-1]["id"]
+    org_id = data["government_organisations"][-1]["id"]
+
+    compare(
+        "get_country",
+        lambda: linear_get_country(data, country_id),
+        lambda: metadata.get_country(country_id),
+    )
+    compare(
+        "get_admin_area",
+        lambda: linear_get_admin_area(data, admin_area_id),
+        lambda: metadata.get_admin_area(admin_area_id),
+    )
+    compare(
+        "get_sector",
+        lambda: linear_get_sector(data, sector_id),
+        lambda: metadata.get_sector(sector_id),
+    )
+    compare(
+        "get_category",
+        lambda: linear_get_category(data, category_id),
+        lambda: metadata.get_category(category_id),
+    )
+    compare(
+        "get_overseas_region_by_id",
+        lambda: linear_get_overseas_region_by_id(data, region_id),
+        lambda: metadata.get_overseas_region_by_id(region_id),
+    )
+    compare(
+        "get_government_organisation",
+        lambda: linear_get_government_organisation(data, org_id),
+        lambda: metadata.get_government_organisation(org_id),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compare building the search pagination data the original way, with a link
+for every page truncated afterwards, and with one querystring copy per visible
+page link, against PaginationMixin.get_pagination_data, which encodes the
+querystring once, for a filtered search at increasing page counts.
+"""
+
+from tools.benchmarks import bench, compare, setup_django
+
+# A typical filtered search querystring
+SEARCH_PARAMS = {
+    "search": "tariff",
+    "country": ["80756b9a-5d95-e211-a939-e4115bead28a"],
+    "sector": ["9538cecc-5f95-e211-a939-e4115bead28a"],
+    "status": ["2", "3", "4", "5"],
+    "ordering": "-reported",
+}
+PAGE_COUNTS = (10, 500, 5000)
+
+
+def get_paginators():
+    from django.test import RequestFactory
+
+    from utils.models import ModelList
+    from utils.pagination import PaginationMixin
+
+    class Paginator(PaginationMixin):
+        pagination_limit = 100
+
+        def __init__(self, current_page):
+            self.request = RequestFactory().get(
+                "/search/", data={**SEARCH_PARAMS, "page": current_page}
+            )
+
+    class PerLinkQuerystringPaginator(Paginator):
+        def get_page_querystring(self, base_querystring, page):
+            return self.update_querystring(page=page)
+
+    class AllPagesPaginator(PerLinkQuerystringPaginator):
+        # Links are built for every page and all but the visible ones dropped,
+        # as truncate_pagination_data used to
+        def get_visible_pages(self, current_page, total_pages):
+            return range(1, total_pages + 1)
+
+        def get_pagination_data(self, object_list):
+            pagination_data = super().get_pagination_data(object_list)
+            pages = {page["label"]: page for page in pagination_data["pages"]}
+            pagination_data["pages"] = [
+                pages[page] if page else {"label": "..."}
+                for page in Paginator.get_visible_pages(
+                    self,
+                    pagination_data["current_page"],
+                    pagination_data["total_pages"],
+                )
+            ]
+            return pagination_data
+
+    def object_list(total_pages):
+        return ModelList(model=None, data=[], total_count=total_pages * 100)
+
+    return Paginator, PerLinkQuerystringPaginator, AllPagesPaginator, object_list
+
+
+def main():
+    setup_django()
+
+    (
+        Paginator,
+        PerLinkQuerystringPaginator,
+        AllPagesPaginator,
+        object_list,
+    ) = get_paginators()
+
+    for total_pages in PAGE_COUNTS:
+        barriers = object_list(total_pages)
+        current_page = total_pages // 2 or 1
+        old = AllPagesPaginator(current_page)
+        per_link = PerLinkQuerystringPaginator(current_page)
+        new = Paginator(current_page)
+        assert old.get_pagination_data(barriers) == new.get_pagination_data(barriers)
+
+        label = f"pagination data, {total_pages} pages"
+        compare(
+            label,
+            lambda: old.get_pagination_data(barriers),
+            lambda: new.get_pagination_data(barriers),
+            number=20 if total_pages > 500 else 200,
+        )
+        bench(
+            f"{label} (querystring per link)",
+            lambda: per_link.get_pagination_data(barriers),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Compare building BarrierSearchForm with each filter's choices rebuilt from the
+metadata, as it used to be, with building it from the metadata's search choice
+catalogue, for the search page with a few filters applied.
+
+Most of the time constructing the form goes on Django copying its declared
+fields, so the choices and label lookups are also timed on their own.
+
+The original choice builders are kept here so the tests can check the
+catalogue still produces the same choices.
+"""
+
+from operator import itemgetter
+
+from tools.benchmarks import compare, setup_django
+
+SEARCH_PARAMS = {
+    "country": ["TB00016", "80756b9a-5d95-e211-a939-e4115bead28a"],
+    "sector": ["9538cecc-5f95-e211-a939-e4115bead28a"],
+    "category": ["130", "117"],
+    "status": ["2", "3"],
+    "tags": ["1"],
+    "ordering": "-reported",
+}
+
+
+def original_country_choices(metadata):
+    return [
+        (trading_bloc["code"], trading_bloc["name"])
+        for trading_bloc in metadata.get_trading_bloc_list()
+    ] + [(country["id"], country["name"]) for country in metadata.get_country_list()]
+
+
+def original_trading_bloc_choices(labels):
+    def build(metadata):
+        return [
+            (
+                trading_bloc["code"],
+                labels.get(trading_bloc["code"], trading_bloc["name"]),
+            )
+            for trading_bloc in metadata.get_trading_bloc_list()
+        ]
+
+    return build
+
+
+def original_sector_choices(metadata):
+    return [(sector["id"], sector["name"]) for sector in metadata.get_sector_list(0)]
+
+
+def original_category_choices(metadata):
+    choices = [
+        (str(category["id"]), category["title"])
+        for category in metadata.data["categories"]
+    ]
+    choices = list(set(choices))
+    choices.sort(key=itemgetter(1))
+    return choices
+
+
+def original_region_choices(metadata):
+    return [
+        (region["id"], region["name"]) for region in metadata.get_overseas_region_list()
+    ]
+
+
+def original_status_choices(metadata):
+    choices = [
+        (id, value)
+        for id, value in metadata.data["barrier_status"].items()
+        if id in ("2", "3", "4", "5")
+    ]
+    choices.sort(key=itemgetter(0))
+    return choices
+
+
+def original_tags_choices(metadata):
+    from barriers.constants import DEPRECATED_TAGS
+
+    return [
+        (str(tag["id"]), tag["title"])
+        for tag in metadata.get_barrier_tag_choices("search")
+        if tag["title"] not in DEPRECATED_TAGS
+    ]
+
+
+def get_original_choice_builders():
+    from barriers.constants import (
+        TRADING_BLOC_IMPLEMENTATION_SEARCH_LABELS,
+        TRADING_BLOC_WIDE_SEARCH_LABELS,
+    )
+
+    return {
+        "country": original_country_choices,
+        "extra_location": original_trading_bloc_choices(
+            TRADING_BLOC_WIDE_SEARCH_LABELS
+        ),
+        "country_trading_bloc": original_trading_bloc_choices(
+            TRADING_BLOC_IMPLEMENTATION_SEARCH_LABELS
+        ),
+        "trade_direction": lambda metadata: metadata.get_trade_direction_choices(),
+        "sector": original_sector_choices,
+        "organisation": lambda metadata: metadata.get_gov_organisation_choices(),
+        "category": original_category_choices,
+        "region": original_region_choices,
+        "status": original_status_choices,
+        "tags": original_tags_choices,
+        "ordering": lambda metadata: metadata.get_search_ordering_choices(),
+    }
+
+
+def get_original_search_form_class():
+    """
+    BarrierSearchForm building its choices and label lookups on every use.
+    """
+    from barriers.forms.search import BarrierSearchForm
+
+    choice_builders = get_original_choice_builders()
+
+    class OriginalBarrierSearchForm(BarrierSearchForm):
+        def set_original_choices(self, field_name):
+            self.fields[field_name].choices = choice_builders[field_name](self.metadata)
+
+        def set_country_choices(self):
+            self.set_original_choices("country")
+
+        def set_extra_location_choices(self):
+            self.set_original_choices("extra_location")
+
+        def set_country_trading_bloc_choices(self):
+            self.set_original_choices("country_trading_bloc")
+
+        def set_trade_direction_choices(self):
+            self.set_original_choices("trade_direction")
+
+        def set_sector_choices(self):
+            self.set_original_choices("sector")
+
+        def set_organisation_choices(self):
+            self.set_original_choices("organisation")
+
+        def set_category_choices(self):
+            self.set_original_choices("category")
+
+        def set_region_choices(self):
+            self.set_original_choices("region")
+
+        def set_status_choices(self):
+            self.set_original_choices("status")
+
+        def set_tags_choices(self):
+            self.set_original_choices("tags")
+
+        def set_ordering_choices(self):
+            self.set_original_choices("ordering")
+
+        def get_choice_labels(self, field_name):
+            return dict(self.fields[field_name].choices)
+
+    return OriginalBarrierSearchForm
+
+
+def set_metadata_choices(form):
+    for field_name in form.catalogue_choices:
+        getattr(form, f"set_{field_name}_choices")()
+    for field_name in form.catalogue_choices:
+        form.get_choice_labels(field_name)
+
+
+def render_filters(form_class, metadata, data):
+    form = form_class(metadata=metadata, data=data)
+    form.is_valid()
+    return form.get_readable_filters()
+
+
+def main():
+    setup_django()
+
+    from django.http import QueryDict
+
+    from barriers.forms.search import BarrierSearchForm
+    from utils.metadata import get_metadata
+
+    metadata = get_metadata()
+    OriginalBarrierSearchForm = get_original_search_form_class()
+    data = QueryDict(mutable=True)
+    for key, value in SEARCH_PARAMS.items():
+        data.setlist(key, value if isinstance(value, list) else [value])
+
+    assert render_filters(OriginalBarrierSearchForm, metadata, data) == (
+        render_filters(BarrierSearchForm, metadata, data)
+    )
+
+    old_form = OriginalBarrierSearchForm(metadata=metadata, data=data)
+    new_form = BarrierSearchForm(metadata=metadata, data=data)
+    compare(
+        "set metadata choices and label lookups",
+        lambda: set_metadata_choices(old_form),
+        lambda: set_metadata_choices(new_form),
+    )
+    compare(
+        "construct search form",
+        lambda: OriginalBarrierSearchForm(metadata=metadata, data=data),
+        lambda: BarrierSearchForm(metadata=metadata, data=data),
+    )
+    compare(
+        "construct search form and list applied filters",
+        lambda: render_filters(OriginalBarrierSearchForm, metadata, data),
+        lambda: render_filters(BarrierSearchForm, metadata, data),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,31 @@
-from utils.api.client import MarketAccessAPIClient
+from django.core.cache import cache
+
+from users.models import User
+from utils.api.client import MarketAccessAPIClient, get_api_client
 from utils.exceptions import APIException
 
 
+def get_current_user(request):
+    """
+    The logged in user, or None if nobody is logged in.
+
+    The user's data is kept in the cache under user_data:<id> (see
+    UsersResource.update_cached_user_data), so /whoami is only called when it
+    has expired. Use request.current_user, set by CurrentUserMiddleware, rather
+    than calling this directly.
+    """
+    user_id = request.session.get("user_data", {}).get("id")
+    if not user_id:
+        return None
+
+    user_data = cache.get(f"user_data:{user_id}")
+    if user_data is not None:
+        return User(user_data)
+
+    client = get_api_client(request)
+    return client.users.get_current()
+
+
 def sync_user(session):
     """
     Calls to /whoami and updates the session
@@ -1,6 +1,6 @@
 from django.http import HttpResponseRedirect
 
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.exceptions import APIException
 from utils.sso import SSOClient
 
@@ -22,7 +22,7 @@ class UserMixin:
         return self._user
 
     def get_user(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         user_id = self.kwargs.get("user_id")
         return client.users.get(user_id)
 
@@ -38,7 +38,7 @@ class UserSearchMixin:
 
     @property
     def client(self):
-        return MarketAccessAPIClient(self.request.session.get("sso_token"))
+        return get_api_client(self.request)
 
     def form_valid(self, form):
         if self.request.POST.get("action") == "add":
@@ -90,7 +90,7 @@ class GroupQuerystringMixin:
         return self._group
 
     def get_group(self):
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         group_id = self.get_group_id()
         if group_id:
             return client.groups.get(group_id)
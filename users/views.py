@@ -16,7 +16,7 @@ from users.constants import (
     REGIONAL_LEAD_PERMISSION_GROUPS,
     USER_ADDITIONAL_PERMISSION_GROUPS,
 )
-from utils.api.client import MarketAccessAPIClient
+from utils.api.client import get_api_client
 from utils.helpers import build_absolute_uri
 from utils.pagination import PaginationMixin
 from utils.referers import RefererMixin
@@ -194,7 +194,7 @@ class ManageUsers(
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         group_id = self.get_group_id()
 
         context_data["page"] = "manage-users"
@@ -312,7 +312,7 @@ class EditUser(APIPermissionMixin, RefererMixin, UserMixin, FormView):
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
-        client = MarketAccessAPIClient(self.request.session.get("sso_token"))
+        client = get_api_client(self.request)
         kwargs["id"] = str(self.kwargs.get("user_id"))
         kwargs["token"] = self.request.session.get("sso_token")
         kwargs["groups"] = client.groups.list()
@@ -388,7 +388,7 @@ class ExportUsers(GroupQuerystringMixin, View):
         return self.request.GET.get("ordering", "").strip()
 
     def get(self, request):
-        client = MarketAccessAPIClient(request.session.get("sso_token"))
+        client = get_api_client(request)
         group_id = self.get_group_id()
 
         search_query_param = self.get_search_query()
@@ -0,0 +1,98 @@
+import asyncio
+import inspect
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .client import MarketAccessAPIClient
+from .resources import APIResource
+
+
+class AsyncAPIResource:
+    """
+    Async counterpart of an APIResource.
+
+    Every method of the wrapped resource is available as a coroutine
+    returning the same APIModel and ModelList objects, e.g.
+    await client.barriers.get(id=barrier_id)
+    """
+
+    def __init__(self, resource):
+        self.resource = resource
+
+    def __getattr__(self, name):
+        attr = getattr(self.resource, name)
+        if callable(attr):
+            return sync_to_async(attr, thread_sensitive=False)
+        return attr
+
+
+class AsyncMarketAccessAPIClient:
+    """
+    Async counterpart of MarketAccessAPIClient for use in async views.
+
+    Calls go through the pooled session of the sync client on worker threads,
+    so several of them can be in flight while the event loop serves other
+    requests.
+    """
+
+    def __init__(self, token=None, **kwargs):
+        self.sync_client = MarketAccessAPIClient(token=token, **kwargs)
+        for name, value in vars(self.sync_client).items():
+            if isinstance(value, APIResource):
+                setattr(self, name, AsyncAPIResource(value))
+
+    async def request(self, method, path, **kwargs):
+        return await sync_to_async(self.sync_client.request, thread_sensitive=False)(
+            method, path, **kwargs
+        )
+
+    async def get(self, path, raw=False, **kwargs):
+        return await sync_to_async(self.sync_client.get, thread_sensitive=False)(
+            path, raw=raw, **kwargs
+        )
+
+    async def post(self, path, **kwargs):
+        return await sync_to_async(self.sync_client.post, thread_sensitive=False)(
+            path, **kwargs
+        )
+
+    async def patch(self, path, **kwargs):
+        return await sync_to_async(self.sync_client.patch, thread_sensitive=False)(
+            path, **kwargs
+        )
+
+    async def put(self, path, **kwargs):
+        return await sync_to_async(self.sync_client.put, thread_sensitive=False)(
+            path, **kwargs
+        )
+
+    async def delete(self, path, **kwargs):
+        return await sync_to_async(self.sync_client.delete, thread_sensitive=False)(
+            path, **kwargs
+        )
+
+    async def gather(self, *calls):
+        """
+        Await API calls concurrently.
+
+        Accepts awaitables (e.g. client.barriers.get(id=barrier_id)) and,
+        like MarketAccessAPIClient.gather, zero-argument callables.
+        Results are returned in order and the first exception, in the order
+        the calls were given, is re-raised once all calls have finished.
+        """
+        semaphore = asyncio.Semaphore(settings.MARKET_ACCESS_API_MAX_CONCURRENCY)
+
+        async def run(call):
+            async with semaphore:
+                if inspect.isawaitable(call):
+                    return await call
+                return await sync_to_async(call, thread_sensitive=False)()
+
+        results = await asyncio.gather(
+            *(run(call) for call in calls), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
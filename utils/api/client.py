@@ -1,8 +1,14 @@
 import logging
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
 from json import JSONDecodeError
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from utils.exceptions import APIHttpException, APIJsonException
 
@@ -33,10 +39,92 @@ from .resources import (
 
 logger = logging.getLogger(__name__)
 
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+_session = None
+_upload_session = None
+_session_lock = threading.Lock()
+
+
+def create_session():
+    """
+    Create a requests session with a keep-alive connection pool.
+
+    The session is shared by every user in the worker, so it never stores
+    cookies. Idempotent requests are retried with backoff on connection errors
+    and on 502, 503 and 504 responses, but never after a read timeout.
+    """
+    retry = Retry(
+        total=settings.MARKET_ACCESS_API_MAX_RETRIES,
+        read=0,
+        backoff_factor=settings.MARKET_ACCESS_API_RETRY_BACKOFF,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.MARKET_ACCESS_API_POOL_SIZE,
+        pool_maxsize=settings.MARKET_ACCESS_API_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session():
+    """
+    Return the session shared by all API clients in this worker.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def get_upload_session():
+    """
+    Return the session shared by document uploads to S3 in this worker.
+
+    Uploads stream the file as the request body, which cannot be sent again,
+    so unlike the API session this one never retries.
+    """
+    global _upload_session
+    if _upload_session is None:
+        with _session_lock:
+            if _upload_session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=settings.MARKET_ACCESS_API_POOL_SIZE,
+                    max_retries=0,
+                )
+                _upload_session = requests.Session()
+                _upload_session.mount("https://", adapter)
+                _upload_session.mount("http://", adapter)
+    return _upload_session
+
+
+def get_api_client(request):
+    """
+    Return an API client for the user making the request.
+
+    Clients created for the same request share its memo (set up by
+    APIClientMiddleware), so a GET made several times while handling one
+    request only reaches the API once.
+    """
+    return MarketAccessAPIClient(
+        request.session.get("sso_token"), memo=getattr(request, "api_memo", None)
+    )
+
 
 class MarketAccessAPIClient:
-    def __init__(self, token=None, **kwargs):
+    def __init__(self, token=None, memo=None, **kwargs):
         self.token = token
+        self.memo = memo
         self.barriers = BarriersResource(self)
         self.documents = DocumentsResource(self)
         self.economic_assessments = EconomicAssessmentResource(self)
@@ -60,14 +148,52 @@ class MarketAccessAPIClient:
         self.feedback = FeedbackResource(self)
         self.barrier_download = BarrierDownloadsResource(self)
 
+    def gather(self, *calls):
+        """
+        Run independent API calls concurrently.
+
+        Each call is a callable taking no arguments, for example
+        functools.partial(client.barriers.get, id=barrier_id).
+        Results are returned in the same order as the calls. Once all calls
+        have finished, the first exception (in the order the calls were given)
+        is re-raised, so error handling is the same as running them one by one.
+        """
+        max_workers = min(len(calls), settings.MARKET_ACCESS_API_MAX_CONCURRENCY)
+        if max_workers <= 1:
+            return [call() for call in calls]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    def get_memo_key(self, path, kwargs):
+        if self.memo is None or set(kwargs) - {"params"}:
+            return None
+        params = kwargs.get("params") or {}
+        if isinstance(params, dict):
+            params = urllib.parse.urlencode(sorted(params.items()), doseq=True)
+        return (self.token, path, str(params))
+
     def request(self, method, path, **kwargs):
+        if self.memo is not None and method.upper() not in ("GET", "HEAD", "OPTIONS"):
+            # A write can change more than its own resource (e.g. a note changes
+            # a barrier's activity), so forget everything fetched so far
+            self.memo.clear()
+
         url = f"{settings.MARKET_ACCESS_API_URI}{path}"
         headers = {
             "Authorization": f"Bearer {self.token}",
             "X-User-Agent": "",
             "X-Forwarded-For": "",
         }
-        response = getattr(requests, method)(url, headers=headers, **kwargs)
+        kwargs.setdefault(
+            "timeout",
+            (
+                settings.MARKET_ACCESS_API_CONNECT_TIMEOUT,
+                settings.MARKET_ACCESS_API_READ_TIMEOUT,
+            ),
+        )
+        response = get_session().request(method, url, headers=headers, **kwargs)
 
         try:
             response.raise_for_status()
@@ -78,7 +204,12 @@ class MarketAccessAPIClient:
         return response
 
     def get(self, path, raw=False, **kwargs):
-        response = self.request("get", path, **kwargs)
+        memo_key = self.get_memo_key(path, kwargs)
+        response = self.memo.get(memo_key) if memo_key else None
+        if response is None:
+            response = self.request("get", path, **kwargs)
+            if memo_key:
+                self.memo[memo_key] = response
 
         if raw:
             return response
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import threading
 import time
 import urllib.parse
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import requests
@@ -39,49 +43,205 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+api_cache_stats = Counter()
+_api_cache_stats_lock = threading.Lock()
+
+
+class APICachePolicy:
+    """
+    Shares responses for one kind of API call between requests.
+
+    Responses are fresh for settings.API_CACHE_TIMES[name] seconds. After that,
+    if serve_stale is set, they are served for up to
+    settings.API_CACHE_STALE_TIME seconds more while a background thread
+    fetches a new copy. Writes through the resource bump a version number,
+    which makes every stored response in the scope out of date. Per-user
+    policies are scoped to the API token.
+
+    Hits, stale hits and misses are counted in api_cache_stats.
+    """
+
+    def __init__(self, name, per_user=False, serve_stale=True):
+        self.name = name
+        self.per_user = per_user
+        self.serve_stale = serve_stale
+
+    @property
+    def ttl(self):
+        return settings.API_CACHE_TIMES.get(self.name, 0)
+
+    def get_scope_key(self, client):
+        scope = "all"
+        if self.per_user:
+            scope = hashlib.sha256(str(client.token).encode()).hexdigest()
+        return f"api-cache:{self.name}:{scope}"
+
+    def get_cached(self, client, path, kwargs):
+        """
+        Return the entry key, current version and stored entry for a call.
+        """
+        scope_key = self.get_scope_key(client)
+        version_key = f"{scope_key}:version"
+        call = json.dumps([path, kwargs], sort_keys=True, default=str)
+        entry_key = f"{scope_key}:{hashlib.md5(call.encode()).hexdigest()}"
+
+        cached = cache.get_many([entry_key, version_key])
+        version = cached.get(version_key, 0)
+        entry = cached.get(entry_key)
+        if entry is not None and entry[0] != version:
+            entry = None
+        return entry_key, version, entry
+
+    def record(self, outcome):
+        with _api_cache_stats_lock:
+            api_cache_stats[f"{self.name}:{outcome}"] += 1
+
+    def get(self, client, path, **kwargs):
+        if not self.ttl:
+            return client.get(path, **kwargs)
+
+        entry_key, version, entry = self.get_cached(client, path, kwargs)
+        if entry is not None:
+            fresh_until, data = entry[1:]
+            if time.time() < fresh_until:
+                self.record("hit")
+                return data
+            if self.serve_stale:
+                self.record("stale")
+                self.fetch_in_background(client, entry_key, version, path, kwargs)
+                return data
+
+        self.record("miss")
+        data = client.get(path, **kwargs)
+        self.store(entry_key, version, data)
+        return data
+
+    def prefetch(self, client, path, **kwargs):
+        """
+        Fetch a call in the background unless a fresh response is stored.
+        """
+        if not self.ttl:
+            return
+
+        entry_key, version, entry = self.get_cached(client, path, kwargs)
+        if entry is None or time.time() >= entry[1]:
+            self.record("prefetch")
+            self.fetch_in_background(client, entry_key, version, path, kwargs)
+
+    def store(self, entry_key, version, data):
+        entry = (version, time.time() + self.ttl, data)
+        timeout = self.ttl
+        if self.serve_stale:
+            timeout += settings.API_CACHE_STALE_TIME
+        cache.set(entry_key, entry, timeout)
+
+    def fetch_in_background(self, client, entry_key, version, path, kwargs):
+        lock_key = f"{entry_key}:fetching"
+        if not cache.add(lock_key, 1, settings.MARKET_ACCESS_API_READ_TIMEOUT):
+            return
+
+        # The request's client may be gone (and its memo stale) by the time
+        # the fetch runs, so use a new one with the same token
+        background_client = type(client)(client.token)
+
+        def run():
+            try:
+                self.store(entry_key, version, background_client.get(path, **kwargs))
+            except Exception:
+                logger.exception(f"Fetching cached API call {path} failed")
+            finally:
+                cache.delete(lock_key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def invalidate(self, client):
+        version_key = f"{self.get_scope_key(client)}:version"
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.set(version_key, 1, None)
+
 
 class APIResource:
     resource_name = None
     model = None
+    cache_policy = None
+    # Policy for list(), when it differs from cache_policy
+    list_cache_policy = None
     client: MarketAccessAPIClient
 
     def __init__(self, client) -> None:
         self.client = client
 
+    def get_data(self, path, cache_policy=None, **kwargs):
+        cache_policy = cache_policy or self.cache_policy
+        if cache_policy is None:
+            return self.client.get(path, **kwargs)
+        return cache_policy.get(self.client, path, **kwargs)
+
+    def invalidate_cache(self, cache_policy=None):
+        cache_policy = cache_policy or self.cache_policy or self.list_cache_policy
+        if cache_policy is not None:
+            cache_policy.invalidate(self.client)
+
     def list(self, **kwargs) -> ModelList:
-        response_data = self.client.get(self.resource_name, params=kwargs)
+        response_data = self.get_data(
+            self.resource_name, cache_policy=self.list_cache_policy, params=kwargs
+        )
         return ModelList(
             model=self.model,
             data=response_data["results"],
             total_count=response_data["count"],
         )
 
+    def prefetch_list(self, **kwargs):
+        """
+        Fetch a list in the background so a later list() call is a cache hit.
+        """
+        cache_policy = self.list_cache_policy or self.cache_policy
+        if cache_policy is not None:
+            cache_policy.prefetch(self.client, self.resource_name, params=kwargs)
+
     def get(self, id=None, *args, **kwargs) -> APIModel:
         if not id:
             url = f"{self.resource_name}"
         else:
             url = f"{self.resource_name}/{id}"
-        return self.model(self.client.get(url, *args, **kwargs))
+        if args:
+            return self.model(self.client.get(url, *args, **kwargs))
+        return self.model(self.get_data(url, **kwargs))
 
     def patch(self, id, *args, **kwargs) -> APIModel:
         url = f"{self.resource_name}/{id}"
-        return self.model(self.client.patch(url, json=kwargs))
+        response_data = self.client.patch(url, json=kwargs)
+        self.invalidate_cache()
+        return self.model(response_data)
 
     def create(self, *args, **kwargs) -> APIModel:
-        return self.model(self.client.post(self.resource_name, json=kwargs))
+        response_data = self.client.post(self.resource_name, json=kwargs)
+        self.invalidate_cache()
+        return self.model(response_data)
 
     def update(self, id, *args, **kwargs) -> APIModel:
         url = f"{self.resource_name}/{id}"
-        return self.model(self.client.put(url, data=kwargs))
+        response_data = self.client.put(url, data=kwargs)
+        self.invalidate_cache()
+        return self.model(response_data)
 
     def delete(self, id, *args, **kwargs):
         url = f"{self.resource_name}/{id}"
-        return self.client.delete(url)
+        response = self.client.delete(url)
+        self.invalidate_cache()
+        return response
 
 
 class BarriersResource(APIResource):
     resource_name = "barriers"
     model = Barrier
+    list_cache_policy = APICachePolicy(
+        "barrier-search", per_user=True, serve_stale=False
+    )
+    top_priority_summary_cache_policy = APICachePolicy("top-priority-summary")
 
     def get_activity(self, barrier_id, **kwargs):
         url = f"barriers/{barrier_id}/activity"
@@ -168,21 +328,26 @@ class BarriersResource(APIResource):
         )
 
     def get_top_priority_summary(self, **kwargs):
-        return self.client.get(
+        return self.get_data(
             f"barriers/{kwargs['barrier']}/top_priority_summary/{kwargs['barrier']}",
+            cache_policy=self.top_priority_summary_cache_policy,
             data=kwargs,
         )
 
     def create_top_priority_summary(self, **kwargs):
-        return self.client.post(
+        response_data = self.client.post(
             f"barriers/{kwargs['barrier']}/top_priority_summary", data=kwargs
         )
+        self.invalidate_cache(self.top_priority_summary_cache_policy)
+        return response_data
 
     def patch_top_priority_summary(self, **kwargs):
-        return self.client.patch(
+        response_data = self.client.patch(
             f"barriers/{kwargs['barrier']}/top_priority_summary/{kwargs['barrier']}",
             data=kwargs,
         )
+        self.invalidate_cache(self.top_priority_summary_cache_policy)
+        return response_data
 
     def create_programme_fund_progress_update(self, **kwargs):
         return self.client.post(
@@ -244,30 +409,68 @@ class DocumentsResource(APIResource):
         return self.client.post(f"documents/{document_id}/upload-callback")
 
     def check_scan_status(self, document_id):
-        max_wait_time = settings.FILE_SCAN_MAX_WAIT_TIME
-        interval = settings.FILE_SCAN_STATUS_CHECK_INTERVAL
-
-        url = f"documents/{document_id}/upload-callback"
-        max_attempts = int(max_wait_time / interval)
-
-        for i in range(max_attempts):
-            try:
-                response = self.client.post(url)
-            except requests.exceptions.HTTPError:
-                raise ScanError("Unable to get scan status")
+        """
+        Check the virus scan once, without waiting for it to finish.
+
+        :return: STR - "pending" or "clean", raising ScanError if the scan failed
+        """
+        try:
+            response = self.client.post(f"documents/{document_id}/upload-callback")
+        except requests.exceptions.HTTPError:
+            raise ScanError("Unable to get scan status")
+
+        if response.get("status") == "virus_scanning_failed":
+            raise ScanError("Unable to virus scan the file")
+        elif response.get("status") == "virus_scanned":
+            if "av_clean" not in response or response.get("av_clean") is True:
+                return "clean"
+            raise ScanError(
+                "This file may be infected with a virus and will not be accepted."
+            )
+        return "pending"
+
+    def get_scan_status(self, document_id):
+        """
+        Get the virus scan status for polling, checking with the API at most
+        once per interval. The interval doubles after each check, up to
+        FILE_SCAN_STATUS_MAX_CHECK_INTERVAL.
+
+        :return: DICT - status and the milliseconds to wait before asking again
+        """
+        cache_key = f"document-scan-status:{document_id}"
+        now = time.time()
+        scan = cache.get(cache_key) or {
+            "status": "pending",
+            "started_at": now,
+            "checks": 0,
+            "next_check_at": now,
+        }
 
-            if response.get("status") == "virus_scanning_failed":
-                raise ScanError("Unable to virus scan the file")
-            elif response.get("status") == "virus_scanned":
-                if "av_clean" not in response or response.get("av_clean") is True:
-                    return
-                raise ScanError(
-                    "This file may be infected with a virus and will not be accepted."
-                )
+        if scan["status"] == "pending" and now >= scan["next_check_at"]:
+            if now - scan["started_at"] > settings.FILE_SCAN_MAX_WAIT_TIME / 1000:
+                scan["status"] = "failed"
+                scan["message"] = "Virus scan took too long"
+            else:
+                try:
+                    scan["status"] = self.check_scan_status(document_id)
+                except ScanError as e:
+                    scan["status"] = "failed"
+                    scan["message"] = str(e)
+            interval = min(
+                settings.FILE_SCAN_STATUS_CHECK_INTERVAL * 2 ** scan["checks"],
+                settings.FILE_SCAN_STATUS_MAX_CHECK_INTERVAL,
+            )
+            scan["checks"] += 1
+            scan["next_check_at"] = now + interval / 1000
+            cache.set(cache_key, scan, settings.FILE_SCAN_STATUS_CACHE_TIME)
 
-            time.sleep(interval / 1000)
+        if scan["status"] == "failed":
+            raise ScanError(scan["message"])
 
-        raise ScanError("Virus scan took too long")
+        return {
+            "status": scan["status"],
+            "retry_after": max(round((scan["next_check_at"] - now) * 1000), 0),
+        }
 
     def get_download(self, document_id):
         return self.client.get(f"documents/{document_id}/download")
@@ -276,14 +479,16 @@ class DocumentsResource(APIResource):
 class UsersResource(APIResource):
     resource_name = "users"
     model = User
+    current_user_cache_policy = APICachePolicy("current-user", per_user=True)
 
     def get_current(self):
-        user_data = self.client.get("whoami")
+        user_data = self.get_data("whoami", cache_policy=self.current_user_cache_policy)
         self.update_cached_user_data(user_data)
         return self.model(user_data)
 
     def patch(self, *args, **kwargs):
         user = super().patch(*args, **kwargs)
+        self.invalidate_cache(self.current_user_cache_policy)
         self.update_cached_user_data(user.data)
         return user
 
@@ -306,16 +511,19 @@ class ReportsResource(APIResource):
 class SavedSearchesResource(APIResource):
     resource_name = "saved-searches"
     model = SavedSearch
+    cache_policy = APICachePolicy("saved-searches", per_user=True)
 
 
 class GroupsResource(APIResource):
     resource_name = "groups"
     model = Group
+    cache_policy = APICachePolicy("groups")
 
 
 class CommoditiesResource(APIResource):
     resource_name = "commodities"
     model = Commodity
+    cache_policy = APICachePolicy("commodities")
 
 
 class PublicBarrierNotesResource(APIResource):
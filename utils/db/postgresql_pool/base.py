@@ -0,0 +1,53 @@
+"""
+PostgreSQL backend taking connections from a pool shared by the process.
+
+Under gevent each request is handled in its own greenlet, with its own Django
+connection, so CONN_MAX_AGE can't keep connections between requests. Instead
+CONN_MAX_AGE stays at 0 and closing a connection at the end of a request
+returns it to the pool, see ConnectionPool.
+
+The pool is sized with DATABASE_POOL_SIZE, which should cover the number of
+requests a worker handles at once that use the database.
+"""
+
+import threading
+
+from django.conf import settings
+from django.db.backends.postgresql import base
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from .pool import ConnectionPool
+
+pools = {}
+pools_lock = threading.Lock()
+
+
+def get_pool(alias):
+    with pools_lock:
+        if alias not in pools:
+            pools[alias] = ConnectionPool(
+                max_size=settings.DATABASE_POOL_SIZE,
+                timeout=settings.DATABASE_POOL_TIMEOUT,
+                max_idle_time=settings.DATABASE_POOL_MAX_IDLE_TIME,
+            )
+        return pools[alias]
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def get_new_connection(self, conn_params):
+        return get_pool(self.alias).get(
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params)
+        )
+
+    def _close(self):
+        if self.connection is None:
+            return
+
+        # Django keeps hold of a connection closed in an atomic block
+        reusable = not self.errors_occurred and not self.in_atomic_block
+        try:
+            if self.connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                self.connection.rollback()
+        except self.Database.Error:
+            reusable = False
+        get_pool(self.alias).put(self.connection, reusable=reusable)
@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+
+class ConnectionPool:
+    """
+    Database connections shared by every thread, or greenlet, in a process.
+
+    At most max_size connections are open or handed out at once. Getting a
+    connection waits up to timeout seconds for one to be returned. Returned
+    connections are reused most recently used first and closed once they
+    have been idle for max_idle_time seconds.
+    """
+
+    def __init__(self, max_size, timeout, max_idle_time):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_time = max_idle_time
+        # (connection, returned_at), oldest first
+        self.idle = deque()
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_size)
+
+    def get(self, connect):
+        """
+        Return an idle connection, or a new one made by calling connect.
+        """
+        if not self.slots.acquire(timeout=self.timeout):
+            raise OperationalError(
+                f"Timed out after {self.timeout}s waiting for one of "
+                f"{self.max_size} pooled database connections"
+            )
+        try:
+            connection = self.get_idle()
+            if connection is None:
+                connection = connect()
+        except BaseException:
+            self.slots.release()
+            raise
+        return connection
+
+    def get_idle(self):
+        stale = []
+        connection = None
+        with self.lock:
+            expired_at = time.monotonic() - self.max_idle_time
+            while self.idle and self.idle[0][1] < expired_at:
+                stale.append(self.idle.popleft()[0])
+            while self.idle and connection is None:
+                connection = self.idle.pop()[0]
+                if connection.closed:
+                    connection = None
+        for stale_connection in stale:
+            close_quietly(stale_connection)
+        return connection
+
+    def put(self, connection, reusable=True):
+        """
+        Give back a connection from get, closing it unless it is reusable.
+        """
+        try:
+            if reusable and not connection.closed:
+                with self.lock:
+                    self.idle.append((connection, time.monotonic()))
+            else:
+                close_quietly(connection)
+        finally:
+            self.slots.release()
+
+    def close_idle(self):
+        with self.lock:
+            idle, self.idle = self.idle, deque()
+        for connection, _ in idle:
+            close_quietly(connection)
+
+
+def close_quietly(connection):
+    try:
+        connection.close()
+    except Exception:
+        pass
@@ -1,7 +1,12 @@
+import contextlib
+import contextvars
+import hashlib
 import re
 import sys
+import threading
 import time
 import urllib.parse
+from collections import OrderedDict
 
 """
 Diff Match and Patch
@@ -1279,3 +1284,122 @@ class diff_match_patch:
                 % (pointer, len(text1))
             )
         return diffs
+
+
+# Diff service for history items
+
+# Texts longer than this (both together, in characters) are diffed word by
+# word, which is far cheaper than character by character
+WORD_DIFF_MIN_LENGTH = 1000
+# Longest time (seconds) spent on a single diff before settling for a coarser
+# result, as diff_match_patch's Diff_Timeout
+DIFF_TIMEOUT = 1.0
+DIFF_MEMO_SIZE = 1000
+
+WORD_RE = re.compile(r"\s+|\S+\s*")
+
+_diff_memo = OrderedDict()
+_diff_memo_lock = threading.Lock()
+_diff_budget = contextvars.ContextVar("diff_budget", default=None)
+
+
+class DiffBudget:
+    """
+    CPU time that may be spent on diffs while handling one request.
+
+    Once it is used up, diffs show the whole old text as deleted and the whole
+    new text as inserted. Those results are counted in `degraded` so callers
+    can avoid caching anything built from them.
+    """
+
+    def __init__(self, seconds):
+        self.remaining = seconds
+        self.degraded = 0
+
+
+@contextlib.contextmanager
+def diff_budget(seconds):
+    budget = DiffBudget(seconds)
+    token = _diff_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _diff_budget.reset(token)
+
+
+def get_diff_budget():
+    return _diff_budget.get()
+
+
+def get_html_diff(old_text, new_text):
+    """
+    Return the changes between two texts as HTML, using diff_match_patch.
+
+    Results are memoized, keyed on a hash of both texts.
+    """
+    key = hashlib.md5(f"{old_text}\0{new_text}".encode()).digest()
+    with _diff_memo_lock:
+        html = _diff_memo.get(key)
+        if html is not None:
+            _diff_memo.move_to_end(key)
+            return html
+
+    budget = get_diff_budget()
+    if budget is not None and budget.remaining <= 0:
+        budget.degraded += 1
+        return diff_match_patch().diff_prettyHtml(
+            [
+                (diff_match_patch.DIFF_DELETE, old_text),
+                (diff_match_patch.DIFF_INSERT, new_text),
+            ]
+        )
+
+    started_at = time.thread_time()
+    dmp = diff_match_patch()
+    dmp.Diff_Timeout = DIFF_TIMEOUT
+    if budget is not None:
+        dmp.Diff_Timeout = min(DIFF_TIMEOUT, budget.remaining)
+    if len(old_text) + len(new_text) >= WORD_DIFF_MIN_LENGTH:
+        diffs = diff_words(dmp, old_text, new_text)
+    else:
+        diffs = dmp.diff_main(old_text, new_text)
+    dmp.diff_cleanupSemantic(diffs)
+    html = dmp.diff_prettyHtml(diffs)
+    if budget is not None:
+        budget.remaining -= time.thread_time() - started_at
+
+    with _diff_memo_lock:
+        _diff_memo[key] = html
+        while len(_diff_memo) > DIFF_MEMO_SIZE:
+            _diff_memo.popitem(last=False)
+    return html
+
+
+def diff_words(dmp, text1, text2):
+    """
+    Diff two texts word by word, each word being taken with the whitespace
+    after it. Like diff_linesToChars, each distinct word is swapped for one
+    character, the shorter strings are diffed, then the words put back.
+    """
+    words = [""]
+    word_hash = {}
+
+    def words_to_chars(text):
+        chars = []
+        for word in WORD_RE.findall(text):
+            if word not in word_hash:
+                words.append(word)
+                word_hash[word] = len(words) - 1
+            chars.append(chr(word_hash[word]))
+        return "".join(chars)
+
+    chars1 = words_to_chars(text1)
+    chars2 = words_to_chars(text2)
+    diffs = dmp.diff_main(chars1, chars2, False)
+    dmp.diff_charsToLines(diffs, words)
+    return diffs
+
+
+def clear_diff_memo():
+    with _diff_memo_lock:
+        _diff_memo.clear()
@@ -28,6 +28,9 @@ class RestrictedFileField(forms.FileField):
     Custom FileField with restrictions on content types and file size
     """
 
+    # libmagic needs several KiB to tell office documents from other zips
+    mime_sniff_size = 64 * 1024
+
     mime_types = {
         "image/gif": ".gif",
         "image/png": ".png",
@@ -75,7 +78,14 @@ class RestrictedFileField(forms.FileField):
         if not data:
             return
 
-        content_type = magic.from_buffer(data.file.read(), mime=True)
+        if data.size > self.max_upload_size:
+            raise forms.ValidationError(
+                f"The selected file must be smaller than {filesizeformat(self.max_upload_size)}"
+            )
+
+        data.seek(0)
+        content_type = magic.from_buffer(data.read(self.mime_sniff_size), mime=True)
+        data.seek(0)
         extension = os.path.splitext(data.name)[1]
         allowed_extensions = self.get_allowed_extensions()
 
@@ -87,11 +97,6 @@ class RestrictedFileField(forms.FileField):
                 f"The selected file must be a {', '.join(allowed_extensions)}"
             )
 
-        if data.size > self.max_upload_size:
-            raise forms.ValidationError(
-                f"The selected file must be smaller than {filesizeformat(self.max_upload_size)}"
-            )
-
         return data
 
 
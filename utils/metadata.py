@@ -1,31 +1,312 @@
+import hashlib
 import json
+import logging
+import math
+import pickle
+import random
+import threading
+import time
+import zlib
 from operator import itemgetter
+from types import MappingProxyType
 
 import redis
 import requests
 from django.conf import settings
 from mohawk import Sender
 
-from barriers.constants import DEPRECATED_TAGS, Statuses
+from barriers.constants import (
+    DEPRECATED_TAGS,
+    TRADING_BLOC_IMPLEMENTATION_SEARCH_LABELS,
+    TRADING_BLOC_WIDE_SEARCH_LABELS,
+    Statuses,
+)
 from core.filecache import memfiles
 from utils.exceptions import HawkException
 
+logger = logging.getLogger(__name__)
+
+# Keys are versioned with the blob format, so releases using different
+# formats can share redis while a deploy rolls out
+METADATA_CACHE_KEY = "metadata:1"
+METADATA_VERSION_CACHE_KEY = "metadata:1:version"
+# "<expires at> <seconds the download took>", for refreshing before expiry
+METADATA_EXPIRY_CACHE_KEY = "metadata:1:expiry"
+METADATA_LOCK_KEY = "metadata:lock"
+# JSON blob stored by earlier releases
+LEGACY_METADATA_CACHE_KEYS = ("metadata", "metadata:version", "metadata:expiry")
+# Start of a metadata blob in the current format, zlib compressed pickle
+METADATA_FORMAT_HEADER = b"metadata:1:"
+# How often (seconds) a request waiting for another process's download checks
+# whether the metadata has arrived
+METADATA_WAIT_INTERVAL = 0.05
+
 if settings.DJANGO_ENV == "test":
     redis_client = None
 else:
     redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
 
 
+class LocalMetadataCache:
+    """
+    Process-local cache of the parsed Metadata object.
+
+    The raw metadata blob lives in redis alongside a version key, the parsed
+    object is only rebuilt when the version in redis differs from ours.
+    The version in redis is checked at most once per METADATA_LOCAL_CACHE_TIME
+    seconds, in between calls are served without touching redis.
+    """
+
+    def __init__(self):
+        # (version, metadata) is swapped in a single assignment so readers
+        # never see a version paired with another version's metadata.
+        self.entry = (None, None)
+        self.checked_at = 0
+
+    def get(self, version):
+        cached_version, metadata = self.entry
+        if version is not None and version == cached_version:
+            self.checked_at = time.monotonic()
+            return metadata
+
+    def get_unchecked(self):
+        """
+        Return the metadata without checking the version in redis,
+        as long as it was checked recently enough.
+        """
+        age = time.monotonic() - self.checked_at
+        if age < settings.METADATA_LOCAL_CACHE_TIME:
+            return self.entry[1]
+
+    def set(self, version, metadata):
+        self.entry = (version, metadata)
+        self.checked_at = time.monotonic()
+
+    def clear(self):
+        self.entry = (None, None)
+        self.checked_at = 0
+
+
+local_metadata_cache = LocalMetadataCache()
+
+
+def get_metadata_version(raw_metadata):
+    if isinstance(raw_metadata, str):
+        raw_metadata = raw_metadata.encode()
+    return hashlib.md5(raw_metadata).hexdigest()
+
+
+def encode_metadata(metadata):
+    """
+    Serialise metadata for redis, much smaller and quicker to load than JSON.
+    """
+    data = pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL)
+    return METADATA_FORMAT_HEADER + zlib.compress(data)
+
+
+def decode_metadata(raw_metadata):
+    """
+    Load metadata stored by encode_metadata, or JSON from earlier releases.
+    """
+    if raw_metadata.startswith(METADATA_FORMAT_HEADER):
+        data = zlib.decompress(raw_metadata[len(METADATA_FORMAT_HEADER) :])
+        return pickle.loads(data)
+    return json.loads(raw_metadata)
+
+
+def decode_version(version):
+    if isinstance(version, bytes):
+        return version.decode()
+    return version
+
+
 def get_metadata():
     if settings.DJANGO_ENV == "test":
         # we're testing and have no access to the API, so use the fixture.
         file = f"{settings.BASE_DIR}/../core/fixtures/metadata.json"
         return Metadata(json.loads(memfiles.open(file)))
 
-    metadata = redis_client.get("metadata")
-    if metadata:
-        return Metadata(json.loads(metadata))
+    metadata = local_metadata_cache.get_unchecked()
+    if metadata is not None:
+        return metadata
+
+    version, expiry = redis_client.mget(
+        [METADATA_VERSION_CACHE_KEY, METADATA_EXPIRY_CACHE_KEY]
+    )
+    metadata = local_metadata_cache.get(decode_version(version))
+    if metadata is not None:
+        if should_refresh_early(expiry):
+            refresh_metadata_in_background()
+        return metadata
+
+    version, raw_metadata = redis_client.mget(
+        [METADATA_VERSION_CACHE_KEY, METADATA_CACHE_KEY]
+    )
+    if raw_metadata:
+        return load_metadata(version, raw_metadata)
 
+    # Until the refresher stores it in the current format, use the JSON
+    # from an earlier release rather than downloading it
+    raw_metadata = redis_client.get(LEGACY_METADATA_CACHE_KEYS[0])
+    if raw_metadata:
+        return load_metadata(get_metadata_version(raw_metadata), raw_metadata)
+    return fetch_missing_metadata()
+
+
+def load_metadata(version, raw_metadata):
+    """
+    Parse a metadata blob from redis into the local cache.
+    """
+    version = decode_version(version)
+    if version is None:
+        version = set_missing_metadata_version(raw_metadata)
+    metadata = Metadata(decode_metadata(raw_metadata))
+    local_metadata_cache.set(version, metadata)
+    return metadata
+
+
+def fetch_missing_metadata():
+    """
+    Fetch metadata that is missing from redis, once across all workers.
+
+    Whoever gets the lock downloads it while everyone else waits for it to
+    appear in redis. If it doesn't arrive in time they download it themselves.
+    """
+    lock = redis_client.lock(METADATA_LOCK_KEY, timeout=settings.METADATA_LOCK_TIME)
+    if not lock.acquire(blocking=False):
+        deadline = time.monotonic() + settings.METADATA_LOCK_TIME
+        while time.monotonic() < deadline:
+            time.sleep(METADATA_WAIT_INTERVAL)
+            version, raw_metadata = redis_client.mget(
+                [METADATA_VERSION_CACHE_KEY, METADATA_CACHE_KEY]
+            )
+            if raw_metadata:
+                return load_metadata(version, raw_metadata)
+        logger.warning("Timed out waiting for metadata from another process")
+        lock = None
+
+    try:
+        version, data = fetch_metadata()
+    finally:
+        release_lock(lock)
+    metadata = Metadata(data)
+    local_metadata_cache.set(version, metadata)
+    return metadata
+
+
+def release_lock(lock):
+    if lock is None:
+        return
+    try:
+        lock.release()
+    except redis.exceptions.LockError:
+        # The lock expired during a slow download, which is harmless
+        pass
+
+
+def should_refresh_early(expiry):
+    """
+    Decide whether to refresh metadata before it expires.
+
+    The chance rises sharply as expiry nears, scaled by how long the last
+    download took, so one worker usually refreshes it just ahead of time
+    (probabilistic early expiration, "XFetch").
+    """
+    if expiry is None:
+        return False
+    expires_at, fetch_time = (float(value) for value in decode_version(expiry).split())
+    early_by = -fetch_time * settings.METADATA_EARLY_REFRESH_BETA
+    early_by *= math.log(1 - random.random())
+    return time.time() + early_by >= expires_at
+
+
+def refresh_metadata():
+    """
+    Download metadata into redis, unless another process already is.
+
+    :return: BOOL - whether the metadata was downloaded
+    """
+    lock = redis_client.lock(METADATA_LOCK_KEY, timeout=settings.METADATA_LOCK_TIME)
+    if not lock.acquire(blocking=False):
+        return False
+    try:
+        fetch_metadata()
+    finally:
+        release_lock(lock)
+    return True
+
+
+_background_refresh_lock = threading.Lock()
+
+
+def refresh_metadata_in_background():
+    if not _background_refresh_lock.acquire(blocking=False):
+        return
+
+    def run():
+        try:
+            refresh_metadata()
+        except Exception:
+            logger.exception("Refreshing metadata failed")
+        finally:
+            _background_refresh_lock.release()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def run_metadata_refresher():
+    """
+    Keep the metadata in redis fresh, so requests never wait for a download.
+
+    Every METADATA_REFRESH_INTERVAL seconds, metadata that is missing or due
+    to expire within METADATA_REFRESH_AHEAD_TIME seconds is downloaded again.
+    """
+    while True:
+        try:
+            ttl = redis_client.ttl(METADATA_CACHE_KEY)
+            # -2 means the key is missing, -1 that it never expires
+            if ttl == -2 or 0 <= ttl < settings.METADATA_REFRESH_AHEAD_TIME:
+                refresh_metadata()
+        except Exception:
+            logger.exception("Refreshing metadata failed")
+        time.sleep(settings.METADATA_REFRESH_INTERVAL)
+
+
+_refresher = None
+_refresher_lock = threading.Lock()
+
+
+def start_metadata_refresher():
+    """
+    Start run_metadata_refresher in a daemon thread, once per process.
+    """
+    global _refresher
+    with _refresher_lock:
+        if _refresher is None:
+            _refresher = threading.Thread(target=run_metadata_refresher, daemon=True)
+            _refresher.start()
+
+
+def set_missing_metadata_version(raw_metadata):
+    """
+    Add a version to a metadata blob that was stored without one,
+    expiring together with the blob.
+    """
+    version = get_metadata_version(raw_metadata)
+    ttl = redis_client.ttl(METADATA_CACHE_KEY)
+    if ttl is None or ttl <= 0:
+        ttl = settings.METADATA_CACHE_TIME
+    redis_client.set(METADATA_VERSION_CACHE_KEY, version, ex=ttl, nx=True)
+    return version
+
+
+def fetch_metadata():
+    """
+    Fetch metadata from the API and store it in redis with a new version.
+
+    :return: TUPLE - (version, metadata)
+    """
+    started_at = time.time()
     url = f"{settings.MARKET_ACCESS_API_URI}metadata"
     sender = Sender(
         settings.MARKET_ACCESS_API_HAWK_CREDS,
@@ -43,14 +324,44 @@ def get_metadata():
             "Authorization": sender.request_header,
             "Content-Type": "text/plain",
         },
+        timeout=(
+            settings.MARKET_ACCESS_API_CONNECT_TIMEOUT,
+            settings.MARKET_ACCESS_API_READ_TIMEOUT,
+        ),
     )
 
     if not response.ok:
         raise HawkException(f"Call to fetch metadata failed {response}")
 
     metadata = response.json()
-    redis_client.set("metadata", json.dumps(metadata), ex=settings.METADATA_CACHE_TIME)
-    return Metadata(metadata)
+    raw_metadata = encode_metadata(metadata)
+    version = get_metadata_version(raw_metadata)
+    finished_at = time.time()
+    expiry = f"{finished_at + settings.METADATA_CACHE_TIME} {finished_at - started_at}"
+    pipeline = redis_client.pipeline()
+    pipeline.set(METADATA_CACHE_KEY, raw_metadata, ex=settings.METADATA_CACHE_TIME)
+    pipeline.set(METADATA_VERSION_CACHE_KEY, version, ex=settings.METADATA_CACHE_TIME)
+    pipeline.set(METADATA_EXPIRY_CACHE_KEY, expiry, ex=settings.METADATA_CACHE_TIME)
+    pipeline.execute()
+    return version, metadata
+
+
+def clear_metadata_cache(client=None):
+    """
+    Remove metadata from redis.
+
+    Deleting the version key invalidates the local cache in every worker,
+    as none of them will find a version matching their own the next time
+    they check (within METADATA_LOCAL_CACHE_TIME seconds).
+    """
+    client = client or redis_client
+    client.delete(
+        METADATA_CACHE_KEY,
+        METADATA_VERSION_CACHE_KEY,
+        METADATA_EXPIRY_CACHE_KEY,
+        *LEGACY_METADATA_CACHE_KEYS,
+    )
+    local_metadata_cache.clear()
 
 
 class Metadata:
@@ -98,14 +409,46 @@ class Metadata:
 
     def __init__(self, data):
         self.data = data
+        self._lookups = {}
+
+    def _get_lookup(self, name, build):
+        """
+        Lazily build and memoize a lookup table or list derived from the data.
+
+        Metadata instances are shared between requests by the local metadata
+        cache, so each lookup is built at most once per metadata version.
+        Public methods returning lists hand out copies, callers are free to
+        modify them without affecting other requests.
+        """
+        lookup = self._lookups.get(name)
+        if lookup is None:
+            lookup = self._lookups[name] = build()
+        return lookup
+
+    @classmethod
+    def _build_index(cls, items, key="id", condition=None):
+        """
+        Map key -> item, keeping the first item for each key to match
+        the behaviour of a linear scan.
+        """
+        index = {}
+        for item in items:
+            if condition is None or condition(item):
+                index.setdefault(key(item) if callable(key) else item[key], item)
+        return index
 
     def get_admin_area_list(self):
         return self.data["admin_areas"]
 
     def get_admin_area(self, admin_area_id):
-        for admin_area in self.data["admin_areas"]:
-            if admin_area["id"] == admin_area_id and admin_area["disabled_on"] is None:
-                return admin_area
+        admin_areas = self._get_lookup(
+            "admin_areas_by_id",
+            lambda: self._build_index(
+                self.data["admin_areas"],
+                condition=lambda admin_area: admin_area["disabled_on"] is None,
+            ),
+        )
+        return admin_areas.get(admin_area_id)
 
     def get_admin_areas(self, admin_area_ids):
         """
@@ -120,57 +463,97 @@ class Metadata:
         admin_areas = [self.get_admin_area(area_id) for area_id in area_ids]
         return admin_areas
 
+    def _build_admin_areas_by_country(self):
+        admin_areas_by_country = {}
+        for admin_area in self.data["admin_areas"]:
+            admin_areas_by_country.setdefault(admin_area["country"]["id"], []).append(
+                admin_area
+            )
+        return admin_areas_by_country
+
     def get_admin_areas_by_country(self, country_id):
-        return [
-            admin_area
-            for admin_area in self.data["admin_areas"]
-            if admin_area["country"]["id"] == country_id
-        ]
+        admin_areas_by_country = self._get_lookup(
+            "admin_areas_by_country", self._build_admin_areas_by_country
+        )
+        return list(admin_areas_by_country.get(country_id, []))
+
+    def get_admin_area_choices_by_country(self):
+        """
+        Admin areas as {"value", "label"} options, grouped by country id.
+        """
+        admin_areas_by_country = self._get_lookup(
+            "admin_areas_by_country", self._build_admin_areas_by_country
+        )
+        return {
+            str(country_id): [
+                {"value": admin_area["id"], "label": admin_area["name"]}
+                for admin_area in admin_areas
+            ]
+            for country_id, admin_areas in admin_areas_by_country.items()
+        }
 
     def get_countries_with_admin_areas_list(self):
-        countries_list = []
-        results_list = []
-        for admin_area in self.data["admin_areas"]:
-            if admin_area["country"]["id"] not in countries_list:
-                countries_list.append(admin_area["country"]["id"])
-                results_list.append(
-                    {
-                        "id": admin_area["country"]["id"],
-                        "name": admin_area["country"]["name"],
-                    }
-                )
-        return results_list
+        admin_areas_by_country = self._get_lookup(
+            "admin_areas_by_country", self._build_admin_areas_by_country
+        )
+        return [
+            {
+                "id": admin_areas[0]["country"]["id"],
+                "name": admin_areas[0]["country"]["name"],
+            }
+            for admin_areas in admin_areas_by_country.values()
+        ]
 
     def get_country(self, country_id):
-        for country in self.data["countries"]:
-            if country["id"] == country_id:
-                return country
+        countries = self._get_lookup(
+            "countries_by_id", lambda: self._build_index(self.data["countries"])
+        )
+        return countries.get(country_id)
 
     def get_country_list(self):
         return self.data["countries"]
 
     def get_country_choices(self):
-        return [(country["id"], country["name"]) for country in self.get_country_list()]
+        return list(
+            self._get_lookup(
+                "country_choices",
+                lambda: [
+                    (country["id"], country["name"])
+                    for country in self.get_country_list()
+                ],
+            )
+        )
 
-    def get_overseas_region_list(self):
+    def _sort_overseas_regions(self):
         self.data["overseas_regions"].sort(key=itemgetter("name"))
         return self.data["overseas_regions"]
 
+    def get_overseas_region_list(self):
+        return self._get_lookup("overseas_regions", self._sort_overseas_regions)
+
     def get_overseas_region_by_id(self, region_id):
-        for region in self.get_overseas_region_list():
-            if region["id"] == str(region_id):
-                return region
-        return None
+        regions = self._get_lookup(
+            "overseas_regions_by_id",
+            lambda: self._build_index(self.get_overseas_region_list()),
+        )
+        return regions.get(str(region_id))
 
     def get_overseas_region_choices(self):
-        return [
-            (region["id"], region["name"]) for region in self.get_overseas_region_list()
-        ]
+        return list(
+            self._get_lookup(
+                "overseas_region_choices",
+                lambda: [
+                    (region["id"], region["name"])
+                    for region in self.get_overseas_region_list()
+                ],
+            )
+        )
 
     def get_sector(self, sector_id):
-        for sector in self.data.get("sectors", []):
-            if sector["id"] == sector_id:
-                return sector
+        sectors = self._get_lookup(
+            "sectors_by_id", lambda: self._build_index(self.data.get("sectors", []))
+        )
+        return sectors.get(sector_id)
 
     def get_sectors(self, sector_ids):
         """
@@ -186,6 +569,7 @@ class Metadata:
         return sectors
 
     def get_sectors_by_ids(self, sector_ids):
+        sector_ids = set(sector_ids)
         return [
             sector
             for sector in self.data.get("sectors", [])
@@ -193,26 +577,40 @@ class Metadata:
         ]
 
     def get_sector_list(self, level=None):
-        return [
-            sector
-            for sector in self.data["sectors"]
-            if (level is None or sector["level"] == level)
-            and sector["disabled_on"] is None
-        ]
+        return list(
+            self._get_lookup(
+                f"sectors_level_{level}",
+                lambda: [
+                    sector
+                    for sector in self.data["sectors"]
+                    if (level is None or sector["level"] == level)
+                    and sector["disabled_on"] is None
+                ],
+            )
+        )
 
     def get_sector_choices(self, level=None):
-        return [
-            (sector["id"], sector["name"]) for sector in self.get_sector_list(level)
-        ]
+        return list(
+            self._get_lookup(
+                f"sector_choices_level_{level}",
+                lambda: [
+                    (sector["id"], sector["name"])
+                    for sector in self.get_sector_list(level)
+                ],
+            )
+        )
 
-    def get_status(self, status_id):
+    def _load_status_info(self):
         for id, name in self.data["barrier_status"].items():
             if id == "1":
                 continue
             self.STATUS_INFO[id]["id"] = id
             self.STATUS_INFO[id]["name"] = name
+        return self.STATUS_INFO
 
-        return self.STATUS_INFO[status_id]
+    def get_status(self, status_id):
+        status_info = self._get_lookup("status_info", self._load_status_info)
+        return status_info[status_id]
 
     def get_status_text(
         self,
@@ -246,36 +644,50 @@ class Metadata:
         if priority_code == "None":
             priority_code = "UNKNOWN"
 
-        for priority in self.data["barrier_priorities"]:
-            if priority["code"] == priority_code:
-                return priority
+        priorities = self._get_lookup(
+            "priorities_by_code",
+            lambda: self._build_index(self.data["barrier_priorities"], key="code"),
+        )
+        return priorities.get(priority_code)
+
+    def _build_category_list(self):
+        return list(self._build_index(self.data.get("categories"), key="id").values())
 
     def get_category_list(self, sort=True):
         """
         Dedupe and sort the barrier types
         """
-        ids = []
-        unique_categories = []
-        for category in self.data.get("categories"):
-            if category["id"] not in ids:
-                unique_categories.append(category)
-                ids.append(category["id"])
-
         if sort:
-            unique_categories.sort(key=itemgetter("title"))
-        return unique_categories
+            return list(
+                self._get_lookup(
+                    "sorted_categories",
+                    lambda: sorted(
+                        self.get_category_list(sort=False), key=itemgetter("title")
+                    ),
+                )
+            )
+        return list(self._get_lookup("categories", self._build_category_list))
 
     def get_category(self, category_id):
-        for category in self.data["categories"]:
-            if str(category["id"]) == str(category_id):
-                return category
+        categories = self._get_lookup(
+            "categories_by_id",
+            lambda: self._build_index(
+                self.data["categories"], key=lambda category: str(category["id"])
+            ),
+        )
+        return categories.get(str(category_id))
 
     def get_categories_by_group(self, group):
-        return [
-            category
-            for category in self.get_category_list(sort=False)
-            if category["category"] == group
-        ]
+        return list(
+            self._get_lookup(
+                f"categories_group_{group}",
+                lambda: [
+                    category
+                    for category in self.get_category_list(sort=False)
+                    if category["category"] == group
+                ],
+            )
+        )
 
     def get_goods(self):
         return self.get_categories_by_group("GOODS")
@@ -313,9 +725,15 @@ class Metadata:
         return stages
 
     def get_barrier_tag(self, tag_id):
-        for tag in self.get_barrier_tags():
-            if str(tag["id"]) == str(tag_id):
-                return tag
+        tags = self._get_lookup(
+            "barrier_tags_by_id",
+            lambda: self._build_index(
+                self.get_barrier_tags(), key=lambda tag: str(tag["id"])
+            ),
+        )
+        tag = tags.get(str(tag_id))
+        if tag is not None:
+            return tag
         return {
             "id": tag_id,
             "title": "[unknown tag]",
@@ -325,8 +743,14 @@ class Metadata:
         }
 
     def get_barrier_tags(self):
-        tags = self.data.get("barrier_tags", [])
-        return sorted(tags, key=lambda k: k["order"])
+        return list(
+            self._get_lookup(
+                "barrier_tags",
+                lambda: sorted(
+                    self.data.get("barrier_tags", []), key=lambda k: k["order"]
+                ),
+            )
+        )
 
     def get_barrier_tag_choices(self, list_use):
         """
@@ -375,21 +799,33 @@ class Metadata:
         return (td for td in self.get_trade_direction(all_items=True))
 
     def get_trading_bloc(self, code):
-        for trading_bloc in self.get_trading_bloc_list():
-            if trading_bloc["code"] == code:
-                return trading_bloc
+        trading_blocs = self._get_lookup(
+            "trading_blocs_by_code",
+            lambda: self._build_index(self.get_trading_bloc_list(), key="code"),
+        )
+        return trading_blocs.get(code)
 
     def get_trading_bloc_list(self):
         return self.data.get("trading_blocs", [])
 
-    def get_trading_bloc_by_country_id(self, country_id):
+    def _build_trading_blocs_by_country_id(self):
+        trading_blocs_by_country_id = {}
         for trading_bloc in self.get_trading_bloc_list():
-            if country_id in trading_bloc["country_ids"]:
-                return {
-                    "code": trading_bloc["code"],
-                    "name": trading_bloc["name"],
-                    "short_name": trading_bloc["short_name"],
-                }
+            for country_id in trading_bloc["country_ids"]:
+                trading_blocs_by_country_id.setdefault(country_id, trading_bloc)
+        return trading_blocs_by_country_id
+
+    def get_trading_bloc_by_country_id(self, country_id):
+        trading_blocs = self._get_lookup(
+            "trading_blocs_by_country_id", self._build_trading_blocs_by_country_id
+        )
+        trading_bloc = trading_blocs.get(country_id)
+        if trading_bloc is not None:
+            return {
+                "code": trading_bloc["code"],
+                "name": trading_bloc["name"],
+                "short_name": trading_bloc["short_name"],
+            }
 
     def is_trading_bloc_code(self, code):
         return self.get_trading_bloc(code) is not None
@@ -410,12 +846,16 @@ class Metadata:
         return dict(self.get_gov_organisation_choices())
 
     def get_government_organisation(self, org_id):
-        for org in self.get_gov_organisations():
-            if str(org["id"]) == str(org_id):
-                return org
+        organisations = self._get_lookup(
+            "government_organisations_by_id",
+            lambda: self._build_index(
+                self.get_gov_organisations(), key=lambda org: str(org["id"])
+            ),
+        )
+        return organisations.get(str(org_id))
 
     def get_gov_organisations_by_ids(self, list_of_ids):
-        list_of_ids = [str(id) for id in list_of_ids]
+        list_of_ids = {str(id) for id in list_of_ids}
         return (
             org for org in self.get_gov_organisations() if str(org["id"]) in list_of_ids
         )
@@ -428,6 +868,108 @@ class Metadata:
     def get_search_ordering_choices(self):
         return self.data["search_ordering_choices"]
 
+    def get_search_sidebar(self):
+        """
+        The data the search filters are built from, as JSON, with its ETag.
+
+        :return: TUPLE - (content, etag)
+        """
+        return self._get_lookup("search_sidebar", self._build_search_sidebar)
+
+    def _build_search_sidebar(self):
+        content = json.dumps(
+            {
+                "trading_blocs": self.get_trading_bloc_list(),
+                "admin_areas": self.get_admin_area_choices_by_country(),
+                "countries_with_admin_areas": (
+                    self.get_countries_with_admin_areas_list()
+                ),
+                "search_ordering_choices": self.get_search_ordering_choices(),
+            },
+            separators=(",", ":"),
+        ).encode()
+        return content, f'"{hashlib.md5(content).hexdigest()}"'
+
+    def get_search_choice_catalogue(self):
+        """
+        Choices for the barrier search filters, see barriers.forms.search.
+        """
+        return self._get_lookup("search_choices", self._build_search_choice_catalogue)
+
+    def _build_search_choice_catalogue(self):
+        trading_blocs = self.get_trading_bloc_list()
+        open_status_ids = ("2", "3", "4", "5")
+        return ChoiceCatalogue(
+            {
+                "locations": [
+                    (trading_bloc["code"], trading_bloc["name"])
+                    for trading_bloc in trading_blocs
+                ]
+                + self.get_country_choices(),
+                "countries": self.get_country_choices(),
+                "trading_bloc_wide": [
+                    (
+                        trading_bloc["code"],
+                        TRADING_BLOC_WIDE_SEARCH_LABELS.get(
+                            trading_bloc["code"], trading_bloc["name"]
+                        ),
+                    )
+                    for trading_bloc in trading_blocs
+                ],
+                "trading_bloc_implementations": [
+                    (
+                        trading_bloc["code"],
+                        TRADING_BLOC_IMPLEMENTATION_SEARCH_LABELS.get(
+                            trading_bloc["code"], trading_bloc["name"]
+                        ),
+                    )
+                    for trading_bloc in trading_blocs
+                ],
+                "trade_directions": self.get_trade_direction_choices(),
+                "sectors": self.get_sector_choices(level=0),
+                "organisations": self.get_gov_organisation_choices(),
+                "categories": [
+                    (str(category["id"]), category["title"])
+                    for category in self.get_category_list()
+                ],
+                "overseas_regions": self.get_overseas_region_choices(),
+                "open_statuses": sorted(
+                    (status_id, name)
+                    for status_id, name in self.data["barrier_status"].items()
+                    if status_id in open_status_ids
+                ),
+                "tags": [
+                    (str(tag["id"]), tag["title"])
+                    for tag in self.get_barrier_tags()
+                    if tag["title"] not in DEPRECATED_TAGS
+                ],
+                "search_ordering": [
+                    tuple(choice) for choice in self.get_search_ordering_choices()
+                ],
+            }
+        )
+
+
+class ChoiceCatalogue:
+    """
+    Named sets of (value, label) choices, each with a value -> label lookup.
+
+    A catalogue is shared by every request using the same metadata version,
+    so the choices are tuples and the lookups read-only.
+    """
+
+    def __init__(self, choices):
+        self._choices = {name: tuple(items) for name, items in choices.items()}
+        self._labels = {
+            name: MappingProxyType(dict(items)) for name, items in self._choices.items()
+        }
+
+    def get_choices(self, name):
+        return self._choices[name]
+
+    def get_labels(self, name):
+        return self._labels[name]
+
 
 class MetadataMixin:
     _metadata = None
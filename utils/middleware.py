@@ -1,6 +1,10 @@
+import functools
 import logging
 
 from django.utils.cache import add_never_cache_headers
+from django.utils.functional import SimpleLazyObject
+
+from users.helpers import get_current_user
 
 
 class RequestLoggingMiddleware:
@@ -19,13 +23,52 @@ class RequestLoggingMiddleware:
         return self.get_response(request)
 
 
+class APIClientMiddleware:
+    """
+    Gives each request a memo of GET responses from the API.
+
+    Every client created with utils.api.client.get_api_client while handling
+    the request shares it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.api_memo = {}
+        return self.get_response(request)
+
+
+class CurrentUserMiddleware:
+    """
+    Sets request.current_user to the logged in user.
+
+    The user is looked up the first time it is used, then shared by the
+    permission checks, context processors and views handling the request.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.current_user = SimpleLazyObject(
+            functools.partial(get_current_user, request)
+        )
+        return self.get_response(request)
+
+
 class DisableClientCachingMiddleware:
+    """
+    Stops browsers caching responses, unless the view set Cache-Control itself.
+    """
+
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
         response = self.get_response(request)
-        add_never_cache_headers(response)
+        if not response.has_header("Cache-Control"):
+            add_never_cache_headers(response)
         return response
 
 
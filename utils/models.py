@@ -1,9 +1,26 @@
+import datetime
 from collections import UserList
 from typing import Dict, Tuple
 
 import dateutil.parser
 
 
+def parse_date(value):
+    """
+    Parse a date from the API.
+
+    The API sends ISO 8601, which datetime.fromisoformat handles far faster
+    than dateutil. On Python 3.9 it doesn't accept a trailing Z, and anything
+    else it rejects is left to dateutil.
+    """
+    try:
+        if value.endswith("Z"):
+            value = f"{value[:-1]}+00:00"
+        return datetime.datetime.fromisoformat(value)
+    except (AttributeError, ValueError):
+        return dateutil.parser.parse(value)
+
+
 class APIModel:
     data: Dict = {}
     date_fields: Tuple = tuple()
@@ -19,7 +36,7 @@ class APIModel:
                 return value
 
             if name in self.date_fields:
-                return dateutil.parser.parse(value)
+                return self.get_date(name)
 
             return value
         except Exception:
@@ -27,6 +44,20 @@ class APIModel:
             # existing methods and properties
             return super().__getattr__(name)
 
+    def get_date(self, name):
+        """
+        Return the date in self.data[name] as a datetime, or None if unset.
+
+        The parsed date is kept until self.data[name] is replaced, so templates
+        and sorts can read it as often as they like.
+        """
+        value = self.data.get(name)
+        parsed_dates = self.__dict__.setdefault("_parsed_dates", {})
+        cached = parsed_dates.get(name)
+        if cached is None or cached[0] is not value:
+            cached = parsed_dates[name] = (value, parse_date(value) if value else None)
+        return cached[1]
+
 
 class ModelList(UserList):
     """
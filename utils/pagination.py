@@ -23,6 +23,17 @@ class PaginationMixin:
         params.update(kwargs)
         return params.urlencode()
 
+    def get_page_querystring(self, base_querystring, page):
+        """
+        Querystring for a page, given the current querystring without "page".
+
+        Equivalent to update_querystring(page=page), without copying and
+        encoding the request's query params again for every page link.
+        """
+        if base_querystring:
+            return f"{base_querystring}&page={page}"
+        return f"page={page}"
+
     def get_pagination_data(self, object_list):
         limit = self.get_pagination_limit()
         total_count = object_list.total_count
@@ -34,27 +45,36 @@ class PaginationMixin:
         end_position = (
             full_page_end + total_count - abs(total_count - full_page_end)
         ) // 2
+        base_querystring = self.update_querystring()
         pagination_data = {
             "total_pages": total_pages,
             "current_page": current_page,
             "pages": [
-                {
-                    "label": i,
-                    "url": self.update_querystring(page=i),
-                }
-                for i in range(1, total_pages + 1)
+                (
+                    {"label": "..."}
+                    if page is None
+                    else {
+                        "label": page,
+                        "url": self.get_page_querystring(base_querystring, page),
+                    }
+                )
+                for page in self.get_visible_pages(current_page, total_pages)
             ],
             "total_items": total_count,
             "start_position": start_position,
             "end_position": end_position,
         }
         if current_page > 1:
-            pagination_data["previous"] = self.update_querystring(page=current_page - 1)
+            pagination_data["previous"] = self.get_page_querystring(
+                base_querystring, current_page - 1
+            )
 
         if current_page != total_pages:
-            pagination_data["next"] = self.update_querystring(page=current_page + 1)
+            pagination_data["next"] = self.get_page_querystring(
+                base_querystring, current_page + 1
+            )
 
-        return self.truncate_pagination_data(pagination_data)
+        return pagination_data
 
     def get_pagination_limit(self):
         return self.pagination_limit
@@ -62,55 +82,50 @@ class PaginationMixin:
     def get_pagination_offset(self):
         return self.get_pagination_limit() * (self.get_current_page() - 1)
 
-    def truncate_pagination_data(self, pagination_data, block_size=4):
+    def get_visible_pages(self, current_page, total_pages, block_size=4):
         """
-        Truncate the pagination links.
+        Return the page numbers to link to, with None for each gap ("...").
 
         We don't want to show a link for every page if there are hundreds of
-        pages. This trims out page links we're probably not interested in.
+        pages, so only a block around the current page and the first and last
+        pages are shown. Only these are worked out, whatever the page count.
 
         This is a direct port from the node project.
         """
-        pages = pagination_data["pages"]
-
-        if len(pages) <= block_size:
-            return pagination_data
-
-        current_page_num = pagination_data["current_page"]
-        current_page_index = pagination_data["current_page"] - 1
-        first_page = pages[0]
-        last_page = pages[-1]
+        # int() because total_pages is a MagicMock in some tests
+        total_pages = int(total_pages)
+        if total_pages <= block_size:
+            return list(range(1, total_pages + 1))
 
         block_pivot = int(block_size / 2)
-        start_of_current_block = abs(current_page_num - block_pivot)
-        start_of_last_block = last_page["label"] - block_size
+        start_of_current_block = abs(current_page - block_pivot)
+        start_of_last_block = total_pages - block_size
         block_start_index = min(
             start_of_current_block,
             start_of_last_block,
-            current_page_index,
+            current_page - 1,
         )
 
-        truncated_pages = pages[block_start_index:][:block_size]
-        first_of_truncated_pages_num = truncated_pages[0]["label"]
-        last_of_truncated_pages_num = truncated_pages[-1]["label"]
+        first_of_block = block_start_index + 1
+        last_of_block = min(block_start_index + block_size, total_pages)
+        pages = list(range(first_of_block, last_of_block + 1))
 
-        if first_of_truncated_pages_num > 3:
-            truncated_pages = [{"label": "..."}] + truncated_pages
+        if first_of_block > 3:
+            pages = [None] + pages
 
-        if first_of_truncated_pages_num == 3:
-            truncated_pages = [pages[1]] + truncated_pages
+        if first_of_block == 3:
+            pages = [2] + pages
 
-        if first_of_truncated_pages_num > 1:
-            truncated_pages = [first_page] + truncated_pages
+        if first_of_block > 1:
+            pages = [1] + pages
 
-        if last_of_truncated_pages_num < last_page["label"] - 2:
-            truncated_pages.append({"label": "..."})
+        if last_of_block < total_pages - 2:
+            pages.append(None)
 
-        if last_of_truncated_pages_num == last_page["label"] - 2:
-            truncated_pages.append(pages[-2])
+        if last_of_block == total_pages - 2:
+            pages.append(total_pages - 1)
 
-        if last_of_truncated_pages_num < last_page["label"]:
-            truncated_pages.append(last_page)
+        if last_of_block < total_pages:
+            pages.append(total_pages)
 
-        pagination_data["pages"] = truncated_pages
-        return pagination_data
+        return pages
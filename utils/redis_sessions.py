@@ -0,0 +1,147 @@
+"""
+Session engine keeping each session in a redis hash, one field per key.
+
+Saving a session only writes the fields whose values changed since it was
+loaded, so a view updating one key of a session holding a report wizard's
+state doesn't rewrite the whole session.
+"""
+
+import json
+import logging
+import zlib
+
+import redis
+from django.conf import settings
+from django.contrib.sessions.backends.base import CreateError, SessionBase
+
+logger = logging.getLogger(__name__)
+
+# Redis doesn't keep empty hashes, so every session has this field
+CREATED_FIELD = ""
+# Each value starts with a byte saying how it is encoded
+JSON_VALUE = b"j"
+ZLIB_VALUE = b"z"
+# Values whose JSON is at least this many bytes are compressed
+COMPRESS_MIN_SIZE = 1024
+
+if settings.DJANGO_ENV == "test":
+    redis_client = None
+else:
+    redis_client = redis.Redis.from_url(url=settings.REDIS_URI)
+
+
+def encode_value(value):
+    data = json.dumps(value, separators=(",", ":")).encode()
+    if len(data) >= COMPRESS_MIN_SIZE:
+        return ZLIB_VALUE + zlib.compress(data)
+    return JSON_VALUE + data
+
+
+def decode_value(data):
+    if data[:1] == ZLIB_VALUE:
+        return json.loads(zlib.decompress(data[1:]))
+    return json.loads(data[1:])
+
+
+class SessionStore(SessionBase):
+    key_prefix = "session:1:"
+
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        # Encoded value of each field as last loaded or saved. Changes are
+        # found by comparing against these rather than tracking assignments,
+        # as views also change values in place and set modified.
+        self._stored_fields = {}
+        self.bytes_written = 0
+
+    def get_redis_key(self, session_key):
+        return f"{self.key_prefix}{session_key}"
+
+    def load(self):
+        fields = {}
+        if self.session_key is not None:
+            fields = redis_client.hgetall(self.get_redis_key(self.session_key))
+
+        stored_fields = {name.decode(): value for name, value in fields.items()}
+        if stored_fields.pop(CREATED_FIELD, None) is None:
+            self._session_key = None
+            return {}
+
+        try:
+            session = {
+                name: decode_value(value) for name, value in stored_fields.items()
+            }
+        except (ValueError, zlib.error):
+            logger.warning(f"Session {self.session_key} could not be decoded")
+            self._session_key = None
+            return {}
+
+        self._stored_fields = stored_fields
+        return session
+
+    def exists(self, session_key):
+        return bool(redis_client.exists(self.get_redis_key(session_key)))
+
+    def create(self):
+        for _ in range(10000):
+            self._session_key = self._get_new_session_key()
+            self._stored_fields = {}
+            try:
+                self.save(must_create=True)
+            except CreateError:
+                continue
+            self.modified = True
+            return
+        raise RuntimeError("Unable to create a new session key.")
+
+    def save(self, must_create=False):
+        if self.session_key is None:
+            return self.create()
+
+        key = self.get_redis_key(self.session_key)
+        if must_create and not redis_client.hsetnx(key, CREATED_FIELD, 1):
+            raise CreateError
+
+        session = self._get_session(no_load=must_create)
+        fields = {name: encode_value(value) for name, value in session.items()}
+        changed_fields = {
+            name: value
+            for name, value in fields.items()
+            if self._stored_fields.get(name) != value
+        }
+        removed_fields = [name for name in self._stored_fields if name not in fields]
+
+        pipeline = redis_client.pipeline()
+        pipeline.hsetnx(key, CREATED_FIELD, 1)
+        if changed_fields:
+            pipeline.hset(key, mapping=changed_fields)
+        if removed_fields:
+            pipeline.hdel(key, *removed_fields)
+        pipeline.expire(key, self.get_expiry_age())
+        recreated = pipeline.execute()[0]
+
+        if recreated and changed_fields != fields:
+            # The session expired after it was loaded, so write all of it
+            changed_fields = fields
+            redis_client.hset(key, mapping=fields)
+
+        self._stored_fields = fields
+        self.bytes_written = sum(
+            len(name) + len(value) for name, value in changed_fields.items()
+        )
+        logger.info(
+            f"Session save wrote {self.bytes_written} bytes, "
+            f"{len(changed_fields)} of {len(fields)} keys changed"
+        )
+
+    def delete(self, session_key=None):
+        if session_key is None:
+            if self.session_key is None:
+                return
+            session_key = self.session_key
+        redis_client.delete(self.get_redis_key(session_key))
+
+    @classmethod
+    def clear_expired(cls):
+        # Redis expires sessions itself
+        pass
@@ -0,0 +1,37 @@
+import io
+
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Stop storing an uploaded file once it is bigger than FILE_MAX_SIZE.
+
+    This runs before the memory and temporary file handlers. The rest of an
+    oversized file is counted but not passed on to them, and the form gets an
+    empty file of the full size, so RestrictedFileField reports it as too big
+    without the file ever being held in memory or on disk.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > settings.FILE_MAX_SIZE:
+            return None
+        return raw_data
+
+    def file_complete(self, file_size):
+        if self.received > settings.FILE_MAX_SIZE:
+            return UploadedFile(
+                file=io.BytesIO(),
+                name=self.file_name,
+                content_type=self.content_type,
+                size=self.received,
+                charset=self.charset,
+            )
+        return None